@@ -0,0 +1,44 @@
+"""
+Bandingkan capture_mode "dom" dan "network" terhadap fixture server lokal
+
+Jalankan dari root repository:
+    python benchmarks/bench_capture.py --tweets 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixture_server import start_fixture_server
+from xscrapper import TwitterScraper
+
+
+def run_mode(base_url: str, mode: str, max_tweets: int, block_resources: str):
+    with TwitterScraper(headless=True, capture_mode=mode, base_url=base_url,
+                        block_resources=block_resources) as scraper:
+        started = time.perf_counter()
+        tweets = scraper.scrape_tweets("fixture", max_tweets=max_tweets)
+        elapsed = time.perf_counter() - started
+    return len(tweets), len({tweet["tweet_id"] for tweet in tweets}), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark capture mode DOM vs network")
+    parser.add_argument("--tweets", type=int, default=200, help="Jumlah tweet yang diambil per mode")
+    parser.add_argument("--block", default="none", help="Preset resource blocking (none/text+images/text-only)")
+    args = parser.parse_args()
+
+    server = start_fixture_server(total_tweets=args.tweets * 2)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    results = {mode: run_mode(base_url, mode, args.tweets, args.block) for mode in ("dom", "network")}
+    server.shutdown()
+
+    print(f"{'mode':<9}{'tweets':>8}{'unique ids':>12}{'seconds':>10}{'tweets/sec':>12}")
+    for mode, (count, unique, elapsed) in results.items():
+        print(f"{mode:<9}{count:>8}{unique:>12}{elapsed:>10.1f}{count / elapsed if elapsed else 0:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark ekstraksi tweet: jalur lama (ElementHandle per field) vs batch page.evaluate
+
+Jalankan dari root repository:
+    python benchmarks/bench_extraction.py --tweets 20 --rounds 20
+"""
+import argparse
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.fixtures import render_timeline_html
+from benchmarks.legacy import extract_tweet_element
+from xscrapper import EXTRACT_TWEETS_CONFIG, EXTRACT_TWEETS_JS, TWEET_ELEMENT_SELECTORS
+
+
+class RoundTripCounter:
+    """Proxy yang menghitung setiap pemanggilan method Playwright sync atau async (satu round trip)"""
+
+    def __init__(self, target, stats):
+        self._target = target
+        self._stats = stats
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            self._stats["round_trips"] += 1
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._await(result)
+            return self._wrap(result)
+
+        return wrapper
+
+    async def _await(self, awaitable):
+        return self._wrap(await awaitable)
+
+    def _wrap(self, value):
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if value is None or isinstance(value, (str, int, float, bool, dict)):
+            return value
+        return RoundTripCounter(value, self._stats)
+
+
+def run_legacy(page):
+    tweets = page.query_selector_all(TWEET_ELEMENT_SELECTORS[0])
+    return [extract_tweet_element(tweet) for tweet in tweets]
+
+
+def run_batch(page):
+    return page.evaluate(EXTRACT_TWEETS_JS, EXTRACT_TWEETS_CONFIG)
+
+
+def measure(page, extractor, rounds):
+    stats = {"round_trips": 0}
+    counted = RoundTripCounter(page, stats)
+    extracted = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        extracted += len(extractor(counted))
+    elapsed = time.perf_counter() - started
+    return {
+        "round_trips_per_pass": stats["round_trips"] / rounds,
+        "tweets_per_sec": extracted / elapsed if elapsed else 0.0,
+        "seconds": elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=20, help="Jumlah tweet pada halaman fixture")
+    parser.add_argument("--rounds", type=int, default=20, help="Jumlah pass ekstraksi per jalur")
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.set_content(render_timeline_html(args.tweets))
+
+        legacy = measure(page, run_legacy, args.rounds)
+        batch = measure(page, run_batch, args.rounds)
+        browser.close()
+
+    print(f"{'path':<8}{'round trips/pass':>18}{'tweets/sec':>14}")
+    for name, result in (("legacy", legacy), ("batch", batch)):
+        print(f"{name:<8}{result['round_trips_per_pass']:>18.1f}{result['tweets_per_sec']:>14.1f}")
+    if batch["tweets_per_sec"] and legacy["tweets_per_sec"]:
+        print(f"Speedup: {batch['tweets_per_sec'] / legacy['tweets_per_sec']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
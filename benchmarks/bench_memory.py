@@ -0,0 +1,85 @@
+"""
+Benchmark memori untuk menyimpan banyak tweet dalam satu proses
+
+Membandingkan list dict (bentuk hasil scrape_tweets), list Tweet (__slots__) dan
+TweetBatch (kolumnar) untuk jumlah tweet yang sama: memori yang tertahan (tracemalloc),
+byte per tweet, waktu membangun container dan waktu ekspor Parquet.
+
+Jalankan dari root repository:
+    python benchmarks/bench_memory.py --tweets 1000000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import render_tweet_record
+from xscrapper import Tweet, TweetBatch, TweetExportMixin, pa
+
+CONTAINERS = {
+    "dicts": list,
+    "tweets": lambda records: [Tweet.from_dict(record) for record in records],
+    "batch": TweetBatch
+}
+
+
+def generate_records(count: int, seed: int = 0):
+    """Record tweet sintetis satu per satu, supaya dict sumber tidak ikut tertahan"""
+    rng = random.Random(seed)
+    for index in range(count):
+        yield render_tweet_record(index, rng, keyword=f"keyword{index % 20}")
+
+
+def bench_container(name: str, count: int, directory: str):
+    """Bangun satu container berisi count tweet dan ukur memori yang tertahan"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    container = CONTAINERS[name](generate_records(count))
+    build_seconds = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "retained_mb": retained / (1024 * 1024),
+        "peak_mb": peak / (1024 * 1024),
+        "bytes_per_tweet": retained / count,
+        "build_seconds": build_seconds
+    }
+    if pa is not None:
+        filename = os.path.join(directory, f"{name}.parquet")
+        started = time.perf_counter()
+        TweetExportMixin().export_to_parquet(container, filename)
+        result["parquet_seconds"] = time.perf_counter() - started
+    del container
+    gc.collect()
+    return result
+
+
+def bench_memory(count: int):
+    """Jalankan benchmark untuk semua container"""
+    with tempfile.TemporaryDirectory() as directory:
+        return {name: bench_container(name, count, directory) for name in CONTAINERS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=1_000_000, help="Jumlah tweet per container")
+    args = parser.parse_args()
+
+    results = bench_memory(args.tweets)
+    print(f"\n{'container':<10}{'retained MB':>14}{'peak MB':>12}{'B/tweet':>10}{'build s':>10}{'parquet s':>12}")
+    for name, result in results.items():
+        parquet = result.get("parquet_seconds")
+        print(f"{name:<10}{result['retained_mb']:>14.1f}{result['peak_mb']:>12.1f}"
+              f"{result['bytes_per_tweet']:>10.0f}{result['build_seconds']:>10.2f}"
+              f"{parquet if parquet is not None else float('nan'):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark suite untuk loop scraping, scroll dan ekspor terhadap fixture server lokal
+
+Mengukur tweets/sec dan round trip Playwright per capture mode, waktu per scroll
+(human_like_scroll vs scroll_and_wait), throughput setiap exporter dan peak RSS.
+Hasil disimpan ke benchmarks/results/ dan dibandingkan dengan hasil sebelumnya.
+
+Jalankan dari root repository:
+    python benchmarks/bench_suite.py --tweets 300 --latency 50 --virtual-window 40
+    python benchmarks/bench_suite.py --skip-browser --export-tweets 100000
+    python benchmarks/bench_suite.py --skip-browser --memory-tweets 1000000
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.bench_extraction import RoundTripCounter
+from benchmarks.bench_memory import bench_memory
+from benchmarks.fixture_server import start_fixture_server
+from benchmarks.fixtures import render_tweet_record
+from benchmarks.legacy import human_like_scroll
+from xscrapper import SCROLL_AND_WAIT_JS, ScrollPolicy, TwitterScraper, TweetExportMixin, pa
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Metode scroll yang dibandingkan: baseline lama dan scroll berbasis MutationObserver
+SCROLL_METHODS = {
+    "human_like_scroll": human_like_scroll,
+    "scroll_and_wait": lambda page: page.evaluate(SCROLL_AND_WAIT_JS, ScrollPolicy().scroll_args())
+}
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Metrik yang lebih besar berarti lebih baik; sisanya (detik, round trip, RSS) lebih kecil lebih baik
+HIGHER_IS_BETTER = ("tweets_per_sec", "mb_per_sec", "cells_per_scroll")
+
+
+def peak_rss_mb():
+    """Peak RSS proses ini dan proses anak yang sudah selesai (browser), dalam MB"""
+    if resource is None:
+        return None
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "python": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    }
+
+
+def bench_scrape(base_url: str, mode: str, max_tweets: int, block_resources: str):
+    """Jalankan scrape_tweets dengan context engine dibungkus penghitung round trip"""
+    with TwitterScraper(headless=True, capture_mode=mode, base_url=base_url,
+                        block_resources=block_resources) as scraper:
+        scraper.session.valid = True
+        stats = {"round_trips": 0}
+        # Page pencarian dibuat dari context ini, jadi semua pemanggilannya ikut terhitung
+        scraper.engine.context = RoundTripCounter(scraper.engine.context, stats)
+        started = time.perf_counter()
+        tweets = scraper.scrape_tweets("fixture", max_tweets=max_tweets)
+        elapsed = time.perf_counter() - started
+    return {
+        "tweets": len(tweets),
+        "unique_ids": len({tweet["tweet_id"] for tweet in tweets}),
+        "seconds": elapsed,
+        "tweets_per_sec": len(tweets) / elapsed if elapsed else 0.0,
+        "round_trips": stats["round_trips"],
+        "round_trips_per_tweet": stats["round_trips"] / len(tweets) if tweets else None
+    }
+
+
+def bench_scroll(base_url: str, method: str, scrolls: int):
+    """Ukur waktu per pemanggilan scroll dan jumlah cell baru yang dimuat"""
+    # FIXTURE.loaded menghitung semua tweet yang pernah dirender, termasuk yang sudah divirtualisasi
+    count_cells = "() => FIXTURE.loaded || 0"
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.goto(f"{base_url}/search?q=fixture", wait_until="domcontentloaded")
+        page.wait_for_selector('article[data-testid="tweet"]')
+        started = time.perf_counter()
+        added = 0
+        for _ in range(scrolls):
+            before = page.evaluate(count_cells)
+            SCROLL_METHODS[method](page)
+            added += max(page.evaluate(count_cells) - before, 0)
+        elapsed = time.perf_counter() - started
+        browser.close()
+    return {
+        "seconds_per_scroll": elapsed / scrolls,
+        "cells_per_scroll": added / scrolls
+    }
+
+
+def bench_export(tweet_count: int, directory: str):
+    """Ukur throughput setiap exporter untuk tweet_count record sintetis"""
+    rng = random.Random(0)
+    tweets = [render_tweet_record(i, rng) for i in range(tweet_count)]
+    exporter = TweetExportMixin()
+    formats = [("csv", exporter.export_to_csv), ("json", exporter.export_to_json),
+               ("ndjson", exporter.export_to_ndjson), ("sqlite", exporter.export_to_sqlite)]
+    if pa is not None:
+        formats += [("parquet", exporter.export_to_parquet), ("arrow", exporter.export_to_arrow)]
+    results = {}
+    for name, export in formats:
+        filename = os.path.join(directory, f"bench.{name}")
+        started = time.perf_counter()
+        export(tweets, filename)
+        elapsed = time.perf_counter() - started
+        size_mb = os.path.getsize(filename) / (1024 * 1024)
+        results[name] = {
+            "seconds": elapsed,
+            "tweets_per_sec": tweet_count / elapsed if elapsed else 0.0,
+            "mb_per_sec": size_mb / elapsed if elapsed else 0.0,
+            "file_mb": size_mb
+        }
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results, prefix=""):
+    """Ratakan dict hasil bertingkat menjadi {"scrape.dom.tweets_per_sec": nilai}"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def previous_result(path: str):
+    """File hasil terakhir sebelum path, atau None"""
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+    files = sorted(name for name in os.listdir(RESULTS_DIR)
+                   if name.endswith(".json") and os.path.join(RESULTS_DIR, name) != path)
+    return os.path.join(RESULTS_DIR, files[-1]) if files else None
+
+
+def compare(current: dict, baseline_path: str, threshold: float):
+    """Cetak perubahan per metrik dan tandai regresi di atas threshold (persen)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = flatten(json.load(f)["results"])
+    print(f"\nPerbandingan dengan {os.path.basename(baseline_path)}:")
+    for name, value in flatten(current).items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        change = (value - old) / old * 100
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+        marker = "  REGRESI" if worse > threshold else ""
+        print(f"  {name:<45}{old:>12.2f} -> {value:>12.2f} ({change:+.1f}%){marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=200, help="Jumlah tweet yang diambil per capture mode")
+    parser.add_argument("--scrolls", type=int, default=10, help="Jumlah scroll per metode scroll")
+    parser.add_argument("--export-tweets", type=int, default=50000, help="Jumlah record untuk benchmark ekspor")
+    parser.add_argument("--memory-tweets", type=int, default=0,
+                        help="Jumlah tweet untuk benchmark memori dict/Tweet/TweetBatch (0 = lewati)")
+    parser.add_argument("--latency", type=int, default=0, help="Latency endpoint timeline (ms)")
+    parser.add_argument("--jitter", type=int, default=0, help="Jitter latency tambahan maksimal (ms)")
+    parser.add_argument("--virtual-window", type=int, default=0, help="Jumlah cell yang tetap di DOM")
+    parser.add_argument("--block", default="none", help="Preset resource blocking (none/text+images/text-only)")
+    parser.add_argument("--skip-browser", action="store_true", help="Hanya jalankan benchmark ekspor")
+    parser.add_argument("--label", default=None, help="Nama file hasil (default: waktu dan revisi git)")
+    parser.add_argument("--compare", default=None, help="File hasil pembanding (default: hasil terakhir)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Batas regresi dalam persen")
+    args = parser.parse_args()
+
+    results = {}
+    if not args.skip_browser:
+        server = start_fixture_server(total_tweets=args.tweets * 2, latency_ms=args.latency,
+                                      latency_jitter_ms=args.jitter, virtual_window=args.virtual_window)
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        try:
+            results["scrape"] = {mode: bench_scrape(base_url, mode, args.tweets, args.block)
+                                 for mode in ("dom", "network")}
+            results["scroll"] = {method: bench_scroll(base_url, method, args.scrolls)
+                                 for method in SCROLL_METHODS}
+        finally:
+            server.shutdown()
+    with tempfile.TemporaryDirectory() as directory:
+        results["export"] = bench_export(args.export_tweets, directory)
+    if args.memory_tweets:
+        results["memory"] = bench_memory(args.memory_tweets)
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    for name, value in flatten(results).items():
+        print(f"{name:<45}{value:>14.2f}")
+
+    revision = git_revision()
+    label = args.label or datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + (f"_{revision}" if revision else "")
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{label}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "label": label,
+            "git": revision,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": vars(args),
+            "results": results
+        }, f, indent=2)
+    print(f"\nHasil disimpan ke {path}")
+
+    baseline = args.compare or previous_result(path)
+    if baseline:
+        compare(results, baseline, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
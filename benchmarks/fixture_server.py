@@ -0,0 +1,178 @@
+"""
+Fixture server lokal yang meniru halaman pencarian X beserta endpoint SearchTimeline
+
+Halaman /search mengambil JSON dari /i/api/graphql/fixture/SearchTimeline saat dimuat
+dan setiap kali discroll ke bawah, lalu merender tweet dengan markup timeline X.
+Body response dibangkitkan saat request oleh fixtures.render_search_timeline_payload.
+Capture asli yang sudah disanitasi bisa dipakai dengan --recordings DIR: file
+search_timeline_<n>.json di folder itu menggantikan halaman ke-n.
+
+Seperti timeline X, daftar bisa divirtualisasi (hanya virtual_window cell terakhir yang
+tetap ada di DOM, sisanya diganti spacer), dan endpoint timeline bisa diberi latency.
+
+Jalankan dari root repository:
+    python benchmarks/fixture_server.py --port 8765
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import render_search_timeline_payload
+
+SEARCH_PAGE = '''<!DOCTYPE html><html><head><meta charset="utf-8"><title>Search / X</title></head>
+<body><header role="banner"><a aria-label="Home" href="/home" data-testid="AppTabBar_Home_Link">Home</a></header>
+<main><div data-testid="primaryColumn"><section><div aria-label="Timeline: Search timeline">
+<div id="spacer"></div><div id="timeline"></div></div></section></div></main>
+<script>
+const FIXTURE = __FIXTURE_CONFIG__;
+let cursor = "0", loading = false, done = false;
+const esc = s => String(s).replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+function renderTweet(result) {
+    if (result.__typename === "TweetWithVisibilityResults") result = result.tweet;
+    const legacy = result.legacy, user = result.core.user_results.result.core;
+    const metric = (id, label, n) => `<div role="button" data-testid="${id}" aria-label="${label}"><span>${n || ""}</span></div>`;
+    return `<div data-testid="cellInnerDiv"><article data-testid="tweet" role="article">
+        <div data-testid="User-Name"><a href="/${user.screen_name}" role="link"><div><span><span>${esc(user.name)}</span></span></div></a>
+        <a href="/${user.screen_name}" role="link" tabindex="-1"><span>@${user.screen_name}</span></a>
+        <a href="/${user.screen_name}/status/${result.rest_id}"><time datetime="${new Date(legacy.created_at).toISOString()}">${esc(legacy.created_at)}</time></a></div>
+        <div data-testid="tweetText" lang="${legacy.lang}"><span>${esc(legacy.full_text)}</span></div>
+        <div role="group">${metric("reply", "Reply", legacy.reply_count)}${metric("retweet", "Retweet", legacy.retweet_count)}${metric("like", "Like", legacy.favorite_count)}</div>
+    </article></div>`;
+}
+async function loadMore() {
+    if (loading || done) return;
+    loading = true;
+    const response = await fetch(`/i/api/graphql/fixture/SearchTimeline?cursor=${cursor}`);
+    if (response.status !== 200) { done = true; loading = false; return; }
+    const payload = await response.json();
+    const entries = payload.data.search_by_raw_query.search_timeline.timeline.instructions[0].entries;
+    let html = "";
+    for (const entry of entries) {
+        if (entry.content.entryType === "TimelineTimelineCursor") cursor = entry.content.value;
+        else {
+            html += renderTweet(entry.content.itemContent.tweet_results.result);
+            FIXTURE.loaded = (FIXTURE.loaded || 0) + 1;
+        }
+    }
+    const timeline = document.getElementById("timeline");
+    timeline.insertAdjacentHTML("beforeend", html);
+    if (FIXTURE.virtualWindow) {
+        // Cell lama dilepas dari DOM dan tingginya dipindah ke spacer, posisi scroll tetap
+        const cells = timeline.querySelectorAll('[data-testid="cellInnerDiv"]');
+        const spacer = document.getElementById("spacer");
+        let removed = 0;
+        for (let i = 0; i < cells.length - FIXTURE.virtualWindow; i++) {
+            removed += cells[i].offsetHeight;
+            cells[i].remove();
+        }
+        spacer.style.height = `${spacer.offsetHeight + removed}px`;
+    }
+    loading = false;
+}
+window.addEventListener("scroll", () => {
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 800) loadMore();
+});
+loadMore();
+</script></body></html>'''
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Handler HTTP untuk halaman pencarian, home dan endpoint SearchTimeline"""
+
+    page_size = 20
+    total_tweets = 1000
+    recordings_dir = None
+    latency_ms = 0
+    latency_jitter_ms = 0
+    virtual_window = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body: bytes, content_type: str, status: int = 200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def recorded_payload(self, page_index: int):
+        """Body capture untuk halaman page_index dari recordings_dir, atau None"""
+        if not self.recordings_dir:
+            return None
+        path = os.path.join(self.recordings_dir, f"search_timeline_{page_index}.json")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        return None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path in ("/search", "/home"):
+            page = SEARCH_PAGE.replace("__FIXTURE_CONFIG__", json.dumps({"virtualWindow": self.virtual_window}))
+            self.send_body(page.encode("utf-8"), "text/html; charset=utf-8")
+        elif url.path.endswith("/SearchTimeline"):
+            if self.latency_ms or self.latency_jitter_ms:
+                time.sleep((self.latency_ms + random.uniform(0, self.latency_jitter_ms)) / 1000)
+            start = int(parse_qs(url.query).get("cursor", ["0"])[0])
+            body = self.recorded_payload(start // self.page_size)
+            if body is None:
+                if start >= self.total_tweets:
+                    self.send_body(b"{}", "application/json", status=404)
+                    return
+                count = min(self.page_size, self.total_tweets - start)
+                body = json.dumps(render_search_timeline_payload(start, count)).encode("utf-8")
+            self.send_body(body, "application/json")
+        else:
+            self.send_body(b"", "text/plain", status=404)
+
+
+def start_fixture_server(port: int = 0, **options) -> ThreadingHTTPServer:
+    """
+    Jalankan fixture server di thread background
+
+    Args:
+        port: Port lokal (0 untuk port acak)
+        **options: Override atribut FixtureHandler (page_size, total_tweets, recordings_dir,
+                   latency_ms, latency_jitter_ms, virtual_window)
+
+    Returns:
+        Instance server; base URL tersedia di f"http://127.0.0.1:{server.server_port}"
+    """
+    handler = type("ConfiguredFixtureHandler", (FixtureHandler,), options)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fixture server timeline X lokal")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--total", type=int, default=1000, help="Jumlah tweet yang tersedia")
+    parser.add_argument("--latency", type=int, default=0, help="Latency endpoint timeline (ms)")
+    parser.add_argument("--jitter", type=int, default=0, help="Jitter latency tambahan maksimal (ms)")
+    parser.add_argument("--virtual-window", type=int, default=0,
+                        help="Jumlah cell yang tetap di DOM (0 = tanpa virtualisasi)")
+    parser.add_argument("--recordings", default=None,
+                        help="Folder berisi capture search_timeline_<n>.json yang sudah disanitasi")
+    args = parser.parse_args()
+    server = start_fixture_server(args.port, total_tweets=args.total, latency_ms=args.latency,
+                                  latency_jitter_ms=args.jitter, virtual_window=args.virtual_window,
+                                  recordings_dir=args.recordings)
+    print(f"Fixture server berjalan di http://127.0.0.1:{server.server_port}/search")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Fixture halaman timeline lokal untuk benchmark (tanpa akses jaringan)
+
+Markup meniru hasil pencarian X: article[data-testid="tweet"] di dalam
+cellInnerDiv, User-Name, time, tweetText, link status dan tombol metrik.
+"""
+import datetime
+import html
+import random
+
+METRIC_SAMPLES = ["", "3", "17", "248", "1,024", "1.2K", "15K", "3.4M"]
+
+
+def render_tweet_cell(index: int, rng: random.Random) -> str:
+    """Render satu cellInnerDiv yang berisi satu tweet"""
+    tweet_id = 1790000000000000000 + index
+    username = f"user{index % 97}"
+    created = datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=index)
+    text = html.escape(f"Tweet fixture #{index} tentang benchmark scraper {rng.random():.6f}")
+    metrics = "".join(
+        f'<div role="button" data-testid="{name}" aria-label="{label}">'
+        f'<span>{rng.choice(METRIC_SAMPLES)}</span></div>'
+        for name, label in (("reply", "Reply"), ("retweet", "Retweet"), ("like", "Like"))
+    )
+    return (
+        f'<div data-testid="cellInnerDiv">'
+        f'<article data-testid="tweet" role="article">'
+        f'<div data-testid="User-Name">'
+        f'<a href="/{username}" role="link"><div><span><span>{username.title()}</span></span></div></a>'
+        f'<a href="/{username}" role="link" tabindex="-1"><span>@{username}</span></a>'
+        f'<a href="/{username}/status/{tweet_id}"><time datetime="{created.isoformat()}.000Z">{created:%b %d}</time></a>'
+        f'</div>'
+        f'<div data-testid="tweetText" lang="id"><span>{text}</span></div>'
+        f'<div role="group">{metrics}</div>'
+        f'</article></div>'
+    )
+
+
+def render_timeline_html(count: int = 20, seed: int = 0) -> str:
+    """Render halaman timeline statis dengan sejumlah tweet"""
+    rng = random.Random(seed)
+    cells = "".join(render_tweet_cell(i, rng) for i in range(count))
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Search / X</title></head>'
+        '<body><header role="banner"><a aria-label="Home" href="/home" data-testid="AppTabBar_Home_Link">Home</a></header>'
+        '<main><div data-testid="primaryColumn">'
+        f'<section><div aria-label="Timeline: Search timeline">{cells}</div></section>'
+        '</div></main></body></html>'
+    )
+
+
+def render_tweet_result(index: int, rng: random.Random) -> dict:
+    """Render satu node tweet_results.result dengan format GraphQL SearchTimeline"""
+    tweet_id = str(1790000000000000000 + index)
+    username = f"user{index % 97}"
+    created = datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=index)
+    result = {
+        "__typename": "Tweet",
+        "rest_id": tweet_id,
+        "core": {"user_results": {"result": {
+            "__typename": "User",
+            "rest_id": str(1000 + index % 97),
+            "core": {"screen_name": username, "name": username.title()},
+            "legacy": {"screen_name": username, "name": username.title()}
+        }}},
+        "legacy": {
+            "id_str": tweet_id,
+            "created_at": created.strftime("%a %b %d %H:%M:%S +0000 %Y"),
+            "full_text": f"Tweet fixture #{index} tentang benchmark scraper {rng.random():.6f}",
+            "favorite_count": rng.randint(0, 20000),
+            "retweet_count": rng.randint(0, 2000),
+            "reply_count": rng.randint(0, 300),
+            "lang": "id"
+        }
+    }
+    if index % 10 == 3:
+        result = {"__typename": "TweetWithVisibilityResults", "tweet": result}
+    return result
+
+
+def render_search_timeline_payload(start: int = 0, count: int = 20, seed: int = 0) -> dict:
+    """Render satu halaman response SearchTimeline berisi tweet start..start+count"""
+    rng = random.Random(seed + start)
+    entries = [
+        {
+            "entryId": f"tweet-{1790000000000000000 + i}",
+            "sortIndex": str(1790000000000000000 + i),
+            "content": {
+                "entryType": "TimelineTimelineItem",
+                "itemContent": {
+                    "itemType": "TimelineTweet",
+                    "tweet_results": {"result": render_tweet_result(i, rng)}
+                }
+            }
+        }
+        for i in range(start, start + count)
+    ]
+    entries.append({
+        "entryId": f"cursor-bottom-{start + count}",
+        "content": {"entryType": "TimelineTimelineCursor", "value": str(start + count), "cursorType": "Bottom"}
+    })
+    return {"data": {"search_by_raw_query": {"search_timeline": {"timeline": {
+        "instructions": [{"type": "TimelineAddEntries", "entries": entries}]
+    }}}}}
+
+
+def render_tweet_record(index: int, rng: random.Random, keyword: str = "fixture") -> dict:
+    """Render satu record tweet dengan bentuk yang sama seperti hasil scrape_tweets (mode DOM)"""
+    created = datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=index)
+    return {
+        "username": f"user{index % 97}",
+        "timestamp": f"{created.isoformat()}.000Z",
+        "text": f"Tweet fixture #{index} tentang benchmark scraper {rng.random():.6f}",
+        "tweet_id": str(1790000000000000000 + index),
+        "metrics": {name: rng.choice(METRIC_SAMPLES) for name in ("replies", "retweets", "likes")},
+        "keyword": keyword
+    }
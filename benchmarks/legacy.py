@@ -0,0 +1,101 @@
+"""
+Jalur lama scraper yang hanya dipakai sebagai baseline benchmark
+
+extract_tweet_element membaca satu tweet lewat ElementHandle (satu round trip per
+field), human_like_scroll scroll bertahap dengan jeda tetap. Keduanya sudah diganti
+EXTRACT_TWEETS_JS dan SCROLL_AND_WAIT_JS di xscrapper.py.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import METRICS_SELECTORS, STATUS_LINK_SELECTOR, TEXT_SELECTOR, TIME_SELECTOR, USERNAME_SELECTORS
+
+
+def extract_tweet_element(tweet) -> dict:
+    """
+    Ekstrak satu tweet lewat ElementHandle sync
+
+    Args:
+        tweet: ElementHandle dari article tweet
+
+    Returns:
+        Record tweet dengan format yang sama seperti EXTRACT_TWEETS_JS
+    """
+    username = "Unknown"
+    timestamp = ""
+    text = ""
+    tweet_id = ""
+    metrics = {}
+
+    for selector in USERNAME_SELECTORS:
+        try:
+            username_element = tweet.query_selector(selector)
+            if username_element:
+                username = username_element.text_content().strip()
+                if username and username != "Unknown":
+                    break
+        except Exception:
+            continue
+    try:
+        time_element = tweet.query_selector(TIME_SELECTOR)
+        if time_element:
+            timestamp = time_element.get_attribute('datetime')
+    except Exception:
+        timestamp = ""
+    try:
+        text_element = tweet.query_selector(TEXT_SELECTOR)
+        if text_element:
+            text = text_element.inner_text()
+    except Exception:
+        text = ""
+    try:
+        for link in tweet.query_selector_all(STATUS_LINK_SELECTOR):
+            href = link.get_attribute('href')
+            if href and '/status/' in href:
+                tweet_id = href.split('/status/')[1].split('/')[0]
+                break
+    except Exception:
+        tweet_id = ""
+    for metric_name, selectors in METRICS_SELECTORS.items():
+        for selector in selectors:
+            try:
+                element = tweet.query_selector(selector)
+                if element:
+                    text_content = element.text_content().strip()
+                    if text_content:
+                        metrics[metric_name] = text_content
+                    break
+            except Exception:
+                continue
+
+    return {
+        "username": username or "Unknown",
+        "timestamp": timestamp or "",
+        "text": text,
+        "tweet_id": tweet_id,
+        "metrics": metrics
+    }
+
+
+def human_like_scroll(page):
+    """Scroll bertahap dengan jeda acak tetap, lalu klik tombol "Show more" jika ada (page sync)"""
+    scroll_distance = random.randint(500, 1200)
+    for _ in range(0, scroll_distance, random.randint(100, 200)):
+        page.evaluate(f"window.scrollBy(0, {random.randint(80, 150)})")
+        time.sleep(random.uniform(0.05, 0.15))
+    page.evaluate("window.scrollBy(0, 1000)")
+    time.sleep(random.uniform(0.3, 0.8))
+    try:
+        for selector in ('div[role="button"]:has-text("Show more")',
+                         'div[role="button"]:has-text("Load more")',
+                         'div[role="button"]:has-text("Show more tweets")'):
+            if page.query_selector(selector):
+                page.click(selector)
+                time.sleep(1)
+                break
+    except Exception:
+        pass
@@ -0,0 +1,67 @@
+"""
+CheckpointStore: job yang terputus dilanjutkan dengan parameter yang sama
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import CheckpointStore, build_search_url, split_dense_shard, tweet_key
+
+
+def job_tweet(tweet_id):
+    return {"username": f"user{tweet_id}", "timestamp": f"2025-01-01T00:00:{tweet_id % 60:02d}.000Z",
+            "text": f"tweet {tweet_id}", "tweet_id": str(tweet_id), "metrics": {}, "keyword": "python"}
+
+
+@pytest.fixture
+def checkpoint():
+    with CheckpointStore(":memory:") as checkpoint:
+        yield checkpoint
+
+
+def test_job_identity_follows_search_parameters(checkpoint):
+    job = checkpoint.open_job("python", "en", "2025-01-01", "2025-01-02")
+    assert checkpoint.open_job("python", "en", "2025-01-01", "2025-01-02")["job_id"] == job["job_id"]
+    assert CheckpointStore.job_id("python", "en", "2025-01-01", "2025-01-02") == job["job_id"]
+    assert CheckpointStore.job_id("python", "id", "2025-01-01", "2025-01-02") != job["job_id"]
+    assert CheckpointStore.job_id("python", "en", "2025-01-01", "2025-01-03") != job["job_id"]
+
+
+def test_record_tweets_deduplicates_and_tracks_oldest(checkpoint):
+    job_id = checkpoint.open_job("python")["job_id"]
+    checkpoint.record_tweets(job_id, [job_tweet(1005), job_tweet(1004)])
+    checkpoint.record_tweets(job_id, [job_tweet(1004), job_tweet(1003)])
+    job = checkpoint.get_job(job_id)
+    assert job["collected"] == 3
+    assert (job["oldest_id"], job["newest_id"]) == (1003, 1005)
+    assert sorted(checkpoint.seen_keys(job_id)) == sorted(tweet_key(job_tweet(i)) for i in (1003, 1004, 1005))
+    assert len(list(checkpoint.tweets(job_id))) == 3
+    # Rerun melanjutkan di bawah tweet tertua yang sudah dicapai
+    assert "max_id:1002" in build_search_url("https://twitter.com", "python", max_id=str(job["oldest_id"] - 1))
+
+
+def test_reopened_job_keeps_progress(tmp_path):
+    path = str(tmp_path / "checkpoint.db")
+    with CheckpointStore(path) as checkpoint:
+        job_id = checkpoint.open_job("python")["job_id"]
+        checkpoint.record_tweets(job_id, [job_tweet(1005), job_tweet(1004)])
+    with CheckpointStore(path) as checkpoint:
+        job = checkpoint.open_job("python")
+        assert (job["job_id"], job["status"], job["collected"], job["oldest_id"]) == (job_id, "running", 2, 1004)
+        checkpoint.mark_done(job_id)
+        assert checkpoint.get_job(job_id)["status"] == "done"
+
+
+def test_pending_shards_skips_done_and_split(checkpoint):
+    job_id = checkpoint.open_job("python", None, "2025-01-01", "2025-01-04")["job_id"]
+    shards = [("2025-01-01", "2025-01-02"), ("2025-01-02", "2025-01-03"), ("2025-01-03", "2025-01-04")]
+    checkpoint.mark_shard(job_id, *shards[0], "done", 10)
+    checkpoint.mark_shard(job_id, *shards[1], "split", 200)
+    checkpoint.mark_shard(job_id, *shards[2], "failed")
+    sub_shards = split_dense_shard(*shards[1])
+    checkpoint.mark_shard(job_id, *sub_shards[0], "done", 50)
+    # Shard yang dipecah diganti sub-shard yang belum selesai; shard gagal dicoba lagi
+    assert checkpoint.pending_shards(job_id, shards) == sub_shards[1:] + [shards[2]]
@@ -0,0 +1,59 @@
+"""
+Pembagian rentang since/until menjadi shard tanggal
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import split_date_range, split_dense_shard
+
+
+def test_single_day_is_one_shard():
+    assert split_date_range("2025-01-01", "2025-01-02") == [("2025-01-01", "2025-01-02")]
+    assert split_date_range("2025-01-01", "2025-01-02", "hour")[0] == ("2025-01-01", "2025-01-01_01:00:00_UTC")
+    assert len(split_date_range("2025-01-01", "2025-01-02", "hour")) == 24
+
+
+def test_last_window_is_truncated_at_end_date():
+    assert split_date_range("2025-01-01", "2025-01-03_05:00:00_UTC") == [
+        ("2025-01-01", "2025-01-02"),
+        ("2025-01-02", "2025-01-03"),
+        ("2025-01-03", "2025-01-03_05:00:00_UTC"),
+    ]
+    assert split_date_range("2025-01-01", "2025-01-01_10:00:00_UTC", 4) == [
+        ("2025-01-01", "2025-01-01_04:00:00_UTC"),
+        ("2025-01-01_04:00:00_UTC", "2025-01-01_08:00:00_UTC"),
+        ("2025-01-01_08:00:00_UTC", "2025-01-01_10:00:00_UTC"),
+    ]
+
+
+def test_empty_or_reversed_range_has_no_shards():
+    assert split_date_range("2025-01-01", "2025-01-01") == []
+    assert split_date_range("2025-01-02", "2025-01-01") == []
+
+
+@pytest.mark.parametrize("window", ["week", 0, -2])
+def test_invalid_window_is_rejected(window):
+    with pytest.raises(ValueError):
+        split_date_range("2025-01-01", "2025-01-02", window)
+
+
+def test_dense_day_is_split_into_quarters():
+    assert split_dense_shard("2025-01-01", "2025-01-02") == [
+        ("2025-01-01", "2025-01-01_06:00:00_UTC"),
+        ("2025-01-01_06:00:00_UTC", "2025-01-01_12:00:00_UTC"),
+        ("2025-01-01_12:00:00_UTC", "2025-01-01_18:00:00_UTC"),
+        ("2025-01-01_18:00:00_UTC", "2025-01-02"),
+    ]
+
+
+def test_dense_shard_stops_at_one_hour():
+    assert split_dense_shard("2025-01-01_03:00:00_UTC", "2025-01-01_04:00:00_UTC") == []
+    # Window dua jam tidak dipecah lebih kecil dari satu jam
+    assert split_dense_shard("2025-01-01_03:00:00_UTC", "2025-01-01_05:00:00_UTC") == [
+        ("2025-01-01_03:00:00_UTC", "2025-01-01_04:00:00_UTC"),
+        ("2025-01-01_04:00:00_UTC", "2025-01-01_05:00:00_UTC"),
+    ]
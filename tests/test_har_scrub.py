@@ -0,0 +1,64 @@
+"""
+scrub_har menghapus cookie, header auth dan request login dari arsip record_har
+"""
+import json
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import scrub_har
+
+
+def har_entry(url, request_headers, response_headers, post_data=None):
+    request = {"method": "POST" if post_data else "GET", "url": url, "headers": request_headers,
+               "cookies": [{"name": "auth_token", "value": "secret"}]}
+    if post_data:
+        request["postData"] = {"mimeType": "application/json", "text": post_data}
+    return {"request": request,
+            "response": {"status": 200, "headers": response_headers,
+                         "cookies": [{"name": "ct0", "value": "secret"}],
+                         "content": {"mimeType": "application/json", "text": "{}"}}}
+
+
+def sample_har():
+    return {"log": {"version": "1.2", "entries": [
+        har_entry("https://api.twitter.com/1.1/onboarding/task.json", [], [],
+                  post_data='{"password": "hunter2"}'),
+        har_entry("https://twitter.com/i/api/graphql/abc/SearchTimeline?variables=%7B%7D",
+                  [{"name": "Cookie", "value": "auth_token=secret"},
+                   {"name": "authorization", "value": "Bearer secret"},
+                   {"name": "x-csrf-token", "value": "secret"},
+                   {"name": "Accept", "value": "*/*"}],
+                  [{"name": "Set-Cookie", "value": "ct0=secret"},
+                   {"name": "Content-Type", "value": "application/json"}]),
+    ]}}
+
+
+def check_scrubbed(har):
+    text = json.dumps(har)
+    assert "secret" not in text and "hunter2" not in text
+    [entry] = har["log"]["entries"]
+    assert entry["request"]["headers"] == [{"name": "Accept", "value": "*/*"}]
+    assert entry["response"]["headers"] == [{"name": "Content-Type", "value": "application/json"}]
+
+
+def test_scrub_har_file(tmp_path):
+    path = tmp_path / "session.har"
+    path.write_text(json.dumps(sample_har()), encoding="utf-8")
+    assert scrub_har(str(path)) == 1
+    check_scrubbed(json.loads(path.read_text(encoding="utf-8")))
+
+
+def test_scrub_har_zip_keeps_bodies(tmp_path):
+    path = tmp_path / "session.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("har.har", json.dumps(sample_har()))
+        archive.writestr("0123abcd.json", b'{"data": {}}')
+    assert scrub_har(str(path)) == 1
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("0123abcd.json") == b'{"data": {}}'
+        check_scrubbed(json.loads(archive.read("har.har")))
+    assert not os.path.exists(str(path) + ".tmp")
+
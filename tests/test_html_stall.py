@@ -0,0 +1,103 @@
+"""
+Mode html: capture kosong setelah batch pertama dihitung sebagai scroll macet, bukan kegagalan
+"""
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import render_tweet_cell
+from xscrapper import (CAPTURE_TWEET_HTML_JS, SCROLL_AND_WAIT_JS, AsyncTwitterScraper, ScrapeFailedError,
+                       ScrollPolicy)
+
+
+class StallingPage:
+    """Page palsu: satu batch fragmen, beberapa capture kosong, lalu batch berikutnya"""
+
+    def __init__(self, empty_captures: int, batch_size: int = 5):
+        self.empty_captures = empty_captures
+        self.batch_size = batch_size
+        self.captures = 0
+        self.scroll_targets = []
+        self.rng = random.Random(0)
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return True
+
+    async def query_selector(self, selector):
+        return None
+
+    async def evaluate(self, script, arg=None):
+        if script is CAPTURE_TWEET_HTML_JS:
+            self.captures += 1
+            if self.captures == 1:
+                start = 0
+            elif self.captures == self.empty_captures + 2:
+                start = self.batch_size
+            else:
+                return []
+            return [render_tweet_cell(index, self.rng) for index in range(start, start + self.batch_size)]
+        if script is SCROLL_AND_WAIT_JS:
+            self.scroll_targets.append(arg["scrollTo"])
+            return 0
+        return None
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.page = page
+
+    async def new_page(self):
+        return self.page
+
+
+@pytest.fixture
+def scraper():
+    scraper = AsyncTwitterScraper(capture_mode="html", debug_level="off", parse_workers=1,
+                                  scroll_policy=ScrollPolicy())
+    scraper.semaphore = asyncio.Semaphore(1)
+    scraper.session.valid = True
+    yield scraper
+    if scraper.parse_pool is not None:
+        scraper.parse_pool.shutdown()
+
+
+def test_empty_captures_after_first_batch_are_stalls(scraper):
+    page = StallingPage(empty_captures=8)
+    scraper.context = FakeContext(page)
+    tweets = asyncio.run(scraper.scrape_tweets("python", max_tweets=10))
+    assert len(tweets) == 10
+    # Capture kosong pertama masih mengambil hasil parse batch pertama, sisanya macet
+    assert scraper.metrics.counters["stalled_scrolls"] == 7
+    assert scraper.metrics.counters.get("jobs") == 1
+
+
+def test_stalls_trigger_force_reload_then_stop(scraper):
+    page = StallingPage(empty_captures=100)
+    scraper.context = FakeContext(page)
+    tweets = asyncio.run(scraper.scrape_tweets("python", max_tweets=10))
+    assert len(tweets) == 5
+    assert scraper.metrics.counters["stalled_scrolls"] == 15
+    # Force reload (scroll ke atas) setiap 5 scroll macet
+    assert page.scroll_targets.count(0) == 3
+
+
+def test_empty_first_load_still_fails(scraper):
+    page = StallingPage(empty_captures=100)
+    page.captures = 1
+    scraper.context = FakeContext(page)
+    with pytest.raises(ScrapeFailedError):
+        asyncio.run(scraper.scrape_tweets("python", max_tweets=10))
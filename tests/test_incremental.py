@@ -0,0 +1,110 @@
+"""
+Resume cursor mode incremental: poll terpotong max_tweets, isi celah, lalu majukan mark
+"""
+import asyncio
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import EXTRACT_TWEETS_JS, SCROLL_AND_WAIT_JS, AsyncTwitterScraper, CheckpointStore
+
+
+class TimelinePage:
+    """Timeline f=live palsu: tweet ID newest..1 urut dari terbaru, menghormati max_id:"""
+
+    def __init__(self, newest: int, per_view: int = 20):
+        self.newest = newest
+        self.per_view = per_view
+        self.position = 0
+        self.url = ""
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return True
+
+    async def query_selector(self, selector):
+        return None
+
+    async def evaluate(self, script, arg=None):
+        if script is EXTRACT_TWEETS_JS:
+            match = re.search(r"max_id:(\d+)", self.url)
+            top = min(int(match.group(1)), self.newest) if match else self.newest
+            ids = range(top - self.position, max(top - self.position - self.per_view, 0), -1)
+            return [{"username": f"user{i}", "timestamp": "", "text": f"tweet {i}", "tweet_id": str(i),
+                     "metrics": {}} for i in ids]
+        if script is SCROLL_AND_WAIT_JS:
+            self.position += self.per_view // 2
+            return 1
+        return None
+
+    async def close(self):
+        pass
+
+
+class TimelineContext:
+    def __init__(self):
+        self.newest = 0
+        self.pages = []
+
+    async def new_page(self):
+        page = TimelinePage(self.newest)
+        self.pages.append(page)
+        return page
+
+
+@pytest.fixture
+def checkpoint():
+    with CheckpointStore(":memory:") as checkpoint:
+        yield checkpoint
+
+
+def poll(scraper, checkpoint, newest):
+    scraper.context.newest = newest
+    tweets = asyncio.run(scraper.scrape_tweets("python", max_tweets=100, checkpoint=checkpoint, incremental=True))
+    return sorted((int(tweet["tweet_id"]) for tweet in tweets), reverse=True), checkpoint.get_watermark("python")
+
+
+def test_store_cursor_keeps_mark_until_gap_is_filled(checkpoint):
+    checkpoint.advance_watermark("python", None, None, None, {"newest_id": 1000, "newest_timestamp": None})
+    checkpoint.suspend_watermark("python", None, None, None, {"newest_id": 1300, "newest_timestamp": None}, 1200)
+    mark = checkpoint.get_watermark("python")
+    assert (mark["newest_id"], mark["resume_max_id"], mark["pending_id"]) == (1000, 1200, 1300)
+    checkpoint.advance_watermark("python", None, None, None, {"newest_id": 1300, "newest_timestamp": None})
+    mark = checkpoint.get_watermark("python")
+    assert (mark["newest_id"], mark["resume_max_id"], mark["pending_id"]) == (1300, None, None)
+    # Mark tidak pernah mundur
+    checkpoint.advance_watermark("python", None, None, None, {"newest_id": 900, "newest_timestamp": None})
+    assert checkpoint.get_watermark("python")["newest_id"] == 1300
+
+
+def test_cut_poll_fills_gap_before_advancing(checkpoint):
+    scraper = AsyncTwitterScraper(debug_level="off")
+    scraper.context = TimelineContext()
+    scraper.semaphore = asyncio.Semaphore(1)
+    scraper.session.valid = True
+
+    collected, marks = [], []
+    for newest in (1000, 1300, 1300, 1300, 1300, 1310):
+        tweets, mark = poll(scraper, checkpoint, newest)
+        collected.extend(tweets)
+        marks.append(mark["newest_id"])
+        if mark["resume_max_id"] is not None:
+            # Selama celah belum terisi, mark tetap dan cursor tepat di bawah tweet tertua
+            assert mark["resume_max_id"] == min(tweets) - 1
+            assert mark["pending_id"] == 1300
+
+    assert marks == sorted(marks)
+    assert marks == [1000, 1000, 1000, 1300, 1300, 1310]
+    # Poll kedua dan ketiga mengisi celah dari max_id:, bukan dari tweet terbaru
+    assert [page.url.split("max_id:")[1].split("&")[0] for page in scraper.context.pages[2:4]] == ["1200", "1100"]
+    # Semua tweet di atas mark pertama diambil tepat sekali
+    assert sorted(collected) == list(range(901, 1001)) + list(range(1001, 1311))
@@ -0,0 +1,64 @@
+"""
+Parsing teks tombol metrik per bahasa UI
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import normalize_metric_column, normalize_tweet_metrics, parse_metric_display
+
+
+@pytest.mark.parametrize("value, lang, expected", [
+    # Sufiks Inggris, pemisah desimal titik atau koma
+    ("1.2K", "en", (1_200, True)),
+    ("1,2K", "en", (1_200, True)),
+    ("2M", "en", (2_000_000, True)),
+    ("1.5B", "en", (1_500_000_000, True)),
+    ("1,234.5K", "en", (1_234_500, True)),
+    # Sufiks Indonesia: "M" adalah miliar, bukan juta
+    ("3,4 rb", "id", (3_400, True)),
+    ("3.4rb", "id", (3_400, True)),
+    ("1,5 jt", "id", (1_500_000, True)),
+    ("2 M", "id", (2_000_000_000, True)),
+    ("1T", "id", (1_000_000_000_000, True)),
+    ("1.234,5 rb", "id", (1_234_500, True)),
+    # Tanpa bahasa: "M" dibaca sebagai juta, sufiks Indonesia tetap dikenali
+    ("2M", None, (2_000_000, True)),
+    ("5 rb", None, (5_000, True)),
+    # Sufiks bahasa lain tidak dikenali
+    ("5 rb", "en", (None, False)),
+    # Angka tanpa singkatan: pemisah adalah pemisah ribuan dan hasilnya eksak
+    ("12", "en", (12, False)),
+    ("1,234", "en", (1_234, False)),
+    ("1.234", "id", (1_234, False)),
+    ("1,234,567", None, (1_234_567, False)),
+    (42, "en", (42, False)),
+    # Nilai kosong atau tidak valid
+    ("", "en", (None, False)),
+    (None, "en", (None, False)),
+    ("abc", "en", (None, False)),
+])
+def test_parse_metric_display(value, lang, expected):
+    assert parse_metric_display(value, lang) == expected
+
+
+def test_normalize_metric_column_flags_abbreviated_rows():
+    counts, approximate = normalize_metric_column(["1.2K", "12", "1.2K", None, ""], "en")
+    assert counts == [1_200, 12, 1_200, None, None]
+    assert approximate == [True, False, True, False, False]
+
+
+def test_normalize_tweet_metrics_flags_any_abbreviated_metric():
+    tweets = [
+        {"metrics": {"likes": "12", "retweets": "3", "replies": "1"}},
+        {"metrics": {"likes": "7", "retweets": "1,5 jt"}},
+        {"metrics": {}},
+    ]
+    columns = normalize_tweet_metrics(tweets, "id")
+    assert columns["likes"] == [12, 7, None]
+    assert columns["retweets"] == [3, 1_500_000, None]
+    assert columns["replies"] == [1, None, None]
+    assert columns["metrics_approximate"] == [False, True, False]
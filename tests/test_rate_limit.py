@@ -0,0 +1,47 @@
+"""
+RateLimitMonitor dipakai bersama oleh semua page satu context
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import RATE_LIMIT_EMPTY_RESPONSES, RateLimitMonitor
+
+
+def test_empty_responses_are_counted_per_page():
+    monitor = RateLimitMonitor()
+    monitor.start_job()
+    monitor.start_job()
+    empty_a = empty_b = 0
+    for _ in range(RATE_LIMIT_EMPTY_RESPONSES - 1):
+        empty_a = monitor.check_payload({}, 0, empty_a)
+        # Page lain yang masih mendapat tweet tidak mengembalikan hitungan page pertama ke nol
+        empty_b = monitor.check_payload({}, 20, empty_b)
+    assert not monitor.limited
+    empty_a = monitor.check_payload({}, 0, empty_a)
+    assert monitor.limited and monitor.reason == "empty_timeline"
+    assert empty_b == 0
+
+
+def test_start_job_keeps_soft_signal_while_siblings_run():
+    monitor = RateLimitMonitor()
+    monitor.start_job()
+    empty = 0
+    for _ in range(RATE_LIMIT_EMPTY_RESPONSES):
+        empty = monitor.check_payload({}, 0, empty)
+    assert monitor.limited
+    monitor.start_job()
+    assert monitor.limited
+    monitor.finish_job()
+    monitor.finish_job()
+    # Tanpa job lain yang berjalan, sinyal lunak dari job sebelumnya dibuang
+    monitor.start_job()
+    assert not monitor.limited
+
+
+def test_hard_signal_survives_new_jobs():
+    monitor = RateLimitMonitor()
+    monitor.check_payload({"errors": [{"code": 88}]}, 0)
+    monitor.start_job()
+    assert monitor.limited and monitor.reason == "api_error_88"
@@ -0,0 +1,50 @@
+"""
+scrape_sharded menyimpan tweet parsial dari shard yang gagal
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import AsyncTwitterScraper, CheckpointStore, RateLimitedError, tweet_key
+
+
+def shard_tweet(tweet_id):
+    return {"username": f"user{tweet_id}", "timestamp": "", "text": f"tweet {tweet_id}",
+            "tweet_id": str(tweet_id), "metrics": {}, "keyword": "python"}
+
+
+class StubScraper(AsyncTwitterScraper):
+    """scrape_tweets palsu: shard 2025-01-02 kena rate limit setelah dua tweet"""
+
+    SHARD_TWEETS = {
+        "2025-01-01": [1874000000000000003, 1874000000000000002],
+        "2025-01-02": [1874400000000000002, 1874400000000000001],
+    }
+
+    async def scrape_tweets(self, keyword, max_tweets=100, lang=None, start_date=None, end_date=None,
+                            seen_index=None, max_scrolls=None, **kwargs):
+        tweets = [shard_tweet(tweet_id) for tweet_id in self.SHARD_TWEETS[start_date]]
+        for tweet in tweets:
+            seen_index.add(tweet_key(tweet))
+        if start_date == "2025-01-02":
+            raise RateLimitedError("banner: Rate limit exceeded", 900, tweets)
+        return tweets
+
+
+def test_failed_shard_keeps_partial_tweets():
+    scraper = StubScraper(debug_level="off")
+    tweets = asyncio.run(scraper.scrape_sharded("python", "2025-01-01", "2025-01-03"))
+    assert [tweet["tweet_id"] for tweet in tweets] == [
+        "1874400000000000002", "1874400000000000001", "1874000000000000003", "1874000000000000002"]
+
+
+def test_failed_shard_partial_tweets_are_checkpointed():
+    scraper = StubScraper(debug_level="off")
+    with CheckpointStore(":memory:") as checkpoint:
+        tweets = asyncio.run(scraper.scrape_sharded("python", "2025-01-01", "2025-01-03", checkpoint=checkpoint))
+        assert len(tweets) == 4
+        job_id = checkpoint.job_id("python", None, "2025-01-01", "2025-01-03")
+        assert checkpoint.shard_status(job_id, "2025-01-02", "2025-01-03") == "failed"
+        assert len(list(checkpoint.tweets(job_id))) == 4
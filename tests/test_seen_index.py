@@ -0,0 +1,46 @@
+"""
+SeenIndex mode set dan bloom
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import SeenIndex
+
+
+@pytest.mark.parametrize("mode", ["set", "bloom"])
+def test_add_reports_new_keys_only_once(mode):
+    index = SeenIndex(mode, capacity=1_000)
+    assert index.add("1790000000000000001")
+    assert not index.add("1790000000000000001")
+    assert index.add("1790000000000000002")
+    assert len(index) == 2
+
+
+def test_bloom_has_no_false_negatives():
+    capacity = 20_000
+    index = SeenIndex("bloom", capacity=capacity, error_rate=0.001)
+    keys = [str(1790000000000000000 + i) for i in range(capacity)]
+    added = sum(index.add(key) for key in keys)
+    assert all(key in index for key in keys)
+    assert not any(index.add(key) for key in keys)
+    # False positive membuat sebagian kecil kunci baru dianggap sudah terlihat
+    assert added >= capacity * 0.99
+    unseen = [str(1800000000000000000 + i) for i in range(capacity)]
+    assert sum(key in index for key in unseen) <= capacity * 0.01
+
+
+def test_bloom_memory_is_fixed_by_capacity():
+    index = SeenIndex("bloom", capacity=1_000_000, error_rate=0.001)
+    size = len(index._bits)
+    for i in range(10_000):
+        index.add(str(i))
+    assert len(index._bits) == size < 2 * 1024 * 1024
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        SeenIndex("dict")
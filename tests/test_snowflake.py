@@ -0,0 +1,59 @@
+"""
+Waktu dan batas window dari snowflake tweet ID
+"""
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import FIRST_SNOWFLAKE_ID, snowflake_time, snowflake_window, sort_tweets
+
+
+@pytest.mark.parametrize("tweet_id, created", [
+    # Contoh dari dokumentasi API: created_at "Wed Oct 10 20:19:24 +0000 2018"
+    (1050118621198921728, datetime.datetime(2018, 10, 10, 20, 19, 24, 211000)),
+    ("1050118621198921728", datetime.datetime(2018, 10, 10, 20, 19, 24, 211000)),
+    # Bit worker/sequence (22 bit bawah) tidak mengubah waktu
+    (((1735689600000 - 1288834974657) << 22) | 0x3FFFFF, datetime.datetime(2025, 1, 1)),
+])
+def test_snowflake_time_known_ids(tweet_id, created):
+    assert snowflake_time(tweet_id) == created
+
+
+@pytest.mark.parametrize("tweet_id", [20, FIRST_SNOWFLAKE_ID - 1, "", "abc", None])
+def test_snowflake_time_pre_snowflake_or_invalid(tweet_id):
+    assert snowflake_time(tweet_id) is None
+
+
+def test_snowflake_window_bounds_are_inclusive_exclusive():
+    lower, upper = snowflake_window("2018-10-10", "2018-10-11")
+    # Batas bawah inklusif: ID terkecil tepat di start_date
+    assert snowflake_time(lower) == datetime.datetime(2018, 10, 10)
+    assert snowflake_time(lower - 1) < datetime.datetime(2018, 10, 10)
+    # Batas atas eksklusif seperti until:, ID sebelum batas masih di hari terakhir
+    assert snowflake_time(upper) == datetime.datetime(2018, 10, 11)
+    assert snowflake_time(upper - 1) < datetime.datetime(2018, 10, 11)
+    assert lower <= 1050118621198921728 < upper
+
+
+def test_snowflake_window_hour_precision_and_open_ends():
+    lower, upper = snowflake_window("2018-10-10_20:00:00_UTC", "2018-10-10_21:00:00_UTC")
+    assert lower <= 1050118621198921728 < upper
+    assert snowflake_window(None, "2018-10-11")[0] is None
+    assert snowflake_window("2018-10-10", None)[1] is None
+
+
+def test_sort_tweets_orders_by_id_and_timestamp():
+    tweets = [
+        {"tweet_id": "1050118621198921728", "timestamp": ""},
+        {"tweet_id": "", "timestamp": "2018-10-10T21:00:00.000Z"},
+        {"tweet_id": "1049811748254646272", "timestamp": ""},
+        {"tweet_id": "", "timestamp": "2018-10-10T20:00:00+00:00"},
+    ]
+    ordered = [tweet["tweet_id"] or tweet["timestamp"] for tweet in sort_tweets(tweets)]
+    assert ordered == ["2018-10-10T21:00:00.000Z", "1050118621198921728",
+                       "2018-10-10T20:00:00+00:00", "1049811748254646272"]
+    assert sort_tweets(tweets, newest_first=False)[0]["tweet_id"] == "1049811748254646272"
@@ -0,0 +1,64 @@
+"""
+Parsing payload JSON SearchTimeline untuk capture_mode="network"
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import render_search_timeline_payload, render_tweet_result
+from xscrapper import parse_timeline_payload
+
+
+def timeline_entries(payload):
+    return payload["data"]["search_by_raw_query"]["search_timeline"]["timeline"]["instructions"][0]["entries"]
+
+
+def test_parses_fixture_page():
+    payload = render_search_timeline_payload(start=0, count=12)
+    records = parse_timeline_payload(payload)
+    assert [record["tweet_id"] for record in records] == [str(1790000000000000000 + i) for i in range(12)]
+    assert [record["username"] for record in records] == [f"user{i}" for i in range(12)]
+    assert records[0]["timestamp"] == "2025-01-01T00:00:00.000Z"
+    # Entry TweetWithVisibilityResults (index 3) dibuka ke tweet di dalamnya
+    assert records[3]["text"].startswith("Tweet fixture #3 ")
+    for record, entry in zip(records, timeline_entries(payload)):
+        result = entry["content"]["itemContent"]["tweet_results"]["result"]
+        legacy = result.get("tweet", result)["legacy"]
+        assert record["metrics"] == {"likes": str(legacy["favorite_count"]),
+                                     "retweets": str(legacy["retweet_count"]),
+                                     "replies": str(legacy["reply_count"])}
+
+
+def test_skips_cursor_and_promoted_entries_and_retweeted_originals():
+    payload = render_search_timeline_payload(start=0, count=2)
+    rng = random.Random(0)
+    retweet = render_tweet_result(50, rng)
+    retweet["legacy"]["retweeted_status_result"] = {"result": render_tweet_result(60, rng)}
+    promoted = {"entryId": "promoted-tweet-1790000000000000070", "content": {
+        "entryType": "TimelineTimelineItem",
+        "itemContent": {"itemType": "TimelineTweet", "promotedMetadata": {"advertiser_results": {}},
+                        "tweet_results": {"result": render_tweet_result(70, rng)}}}}
+    entries = timeline_entries(payload)
+    entries.insert(1, promoted)
+    entries.insert(2, {"entryId": "tweet-1790000000000000050", "content": {
+        "entryType": "TimelineTimelineItem",
+        "itemContent": {"itemType": "TimelineTweet", "tweet_results": {"result": retweet}}}})
+    records = parse_timeline_payload(payload)
+    assert [record["tweet_id"] for record in records] == [
+        "1790000000000000000", "1790000000000000050", "1790000000000000001"]
+    assert records[1]["username"] == "user50"
+
+
+def test_legacy_adaptive_payload():
+    payload = {"globalObjects": {
+        "tweets": {"1790000000000000009": {"user_id_str": "7", "full_text": "halo",
+                                           "created_at": "Wed Oct 10 20:19:24 +0000 2018",
+                                           "favorite_count": 5, "retweet_count": 1, "reply_count": 0}},
+        "users": {"7": {"screen_name": "alice"}}
+    }}
+    [record] = parse_timeline_payload(payload)
+    assert (record["tweet_id"], record["username"], record["text"]) == ("1790000000000000009", "alice", "halo")
+    assert record["timestamp"] == "2018-10-10T20:19:24.000Z"
+    assert record["metrics"] == {"likes": "5", "retweets": "1", "replies": "0"}
@@ -0,0 +1,55 @@
+"""
+Ekspor dari list Tweet harus sama dengan ekspor dari TweetBatch, termasuk flag metrics_approximate
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xscrapper import ColumnarSink, Tweet, TweetBatch, TweetStore
+
+RAW_TWEETS = [
+    {"username": "alice", "timestamp": "2025-01-01T00:03:00.000Z", "text": "pertama",
+     "tweet_id": "1874000000000000001", "metrics": {"likes": "1.2K", "retweets": "5", "replies": "0"},
+     "keyword": "python"},
+    {"username": "bob", "timestamp": "2025-01-01T00:02:00.000Z", "text": "kedua",
+     "tweet_id": "1874000000000000000", "metrics": {"likes": "12", "retweets": "3", "replies": "1"},
+     "keyword": "python"},
+]
+
+
+def tweet_objects():
+    return [Tweet.from_dict(tweet, "en") for tweet in RAW_TWEETS]
+
+
+def test_to_dict_keeps_approximate_flag():
+    tweets = tweet_objects()
+    assert [tweet.to_dict()["metrics_approximate"] for tweet in tweets] == [True, False]
+    assert [Tweet.from_dict(tweet.to_dict(), "en").metrics_approximate for tweet in tweets] == [True, False]
+
+
+def test_store_export_matches_batch(tmp_path):
+    rows = {}
+    for name, tweets in (("list", tweet_objects()), ("batch", TweetBatch(RAW_TWEETS, lang="en"))):
+        store = TweetStore(str(tmp_path / f"{name}.db"), lang="en")
+        store.upsert(tweets)
+        rows[name] = [{key: value for key, value in row.items() if key not in ("first_seen", "last_seen")}
+                      for row in store.query()]
+        store.close()
+    assert rows["list"] == rows["batch"]
+    assert [row["metrics_approximate"] for row in rows["list"]] == [1, 0]
+
+
+def test_columnar_export_matches_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    tables = {}
+    for name, tweets in (("list", tweet_objects()), ("batch", TweetBatch(RAW_TWEETS, lang="en"))):
+        filename = str(tmp_path / f"{name}.parquet")
+        sink = ColumnarSink(filename, lang="en")
+        sink.write_many(tweets)
+        sink.close()
+        tables[name] = pq.read_table(filename).to_pylist()
+    assert tables["list"] == tables["batch"]
+    assert [row["metrics_approximate"] for row in tables["list"]] == [True, False]
@@ -1,3 +1,4 @@
+import abc
 import json
 import csv
 import os
@@ -5,9 +6,33 @@ import datetime
 import sys
 import random
 import time
-from playwright.sync_api import sync_playwright, TimeoutError
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+import math
+import hashlib
+import asyncio
+import concurrent.futures
+import multiprocessing
+import queue
+import contextlib
+import collections
+import argparse
+import socket
+import sqlite3
+import re
+import array
+import html.parser
+import functools
+import zipfile
+from playwright.async_api import async_playwright, TimeoutError
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Iterable, Callable
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow hanya dibutuhkan untuk ekspor Parquet/Arrow
+    pa = None
+    pc = None
+    pq = None
 
 LICENSE = """
 ========================================================================================================================================================
@@ -31,742 +56,4307 @@ LICENSE = """
                                     Please give appropriate credit to OrionShii.
                                     """
 
-if __name__ == "__main__":
+if __name__ == "__main__" and sys.argv[1:2] != ["submit"]:
     print(LICENSE)
 
-class TwitterScraper:
-    def __init__(self, headless: bool = True):
+# Konfigurasi browser untuk engine scraping
+AUTH_STATE_PATH = "twitter_auth_state.json"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
+VIEWPORT = {"width": 1366, "height": 768}
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-web-security',
+    '--disable-setuid-sandbox',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    f'--user-agent={USER_AGENT}',
+]
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => false });
+    window.navigator.chrome = { runtime: {} };
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+    );
+"""
+EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Referer': 'https://twitter.com/',
+    'sec-ch-ua': '"Chromium";v="123", "Google Chrome";v="123"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+}
+# Bahasa UI Twitter tempat teks metrik dibaca ("1.2K" lawan "1,2 rb"). Browser meminta UI
+# Inggris lewat Accept-Language dan navigator.languages; filter lang pencarian tidak berpengaruh.
+UI_LOCALE = "en"
+
+# State machine login: setiap state dikenali dari selector CSS, teks halaman atau path URL.
+# Urutan penting: state yang dicek lebih dulu menang jika beberapa cocok sekaligus.
+LOGIN_STATES = {
+    "home": {"selectors": ['a[data-testid="AppTabBar_Home_Link"]', 'a[aria-label="Home"]'], "paths": ["/home"]},
+    # Prompt "unusual activity" meminta verifikasi, jadi dicek sebelum banner error
+    "verification": {"selectors": ['input[data-testid="ocfEnterTextTextInput"]']},
+    "error": {"texts": ["Wrong password", "Kata sandi salah", "Could not log you in",
+                        "Sorry, we could not find your account"]},
+    "password": {"selectors": ['input[name="password"]', 'input[type="password"]',
+                               'input[autocomplete="current-password"]']},
+    "username": {"selectors": ['input[autocomplete="username"]']}
+}
+LOGIN_BUTTON_TEXTS = {
+    "username": ["next", "berikutnya"],
+    "verification": ["next", "berikutnya"],
+    "password": ["log in", "login", "masuk"]
+}
+LOGIN_TYPING_DELAY_MS = 50
+LOGIN_STEP_TIMEOUT = 15000
+# Cek status login di halaman yang sudah terbuka: indikator home lawan tombol login
+HOME_INDICATOR_SELECTORS = ['a[aria-label="Home"]', 'a[data-testid="AppTabBar_Home_Link"]', 'header[role="banner"]']
+LOGIN_INDICATOR_SELECTORS = ['a[href="/login"]', 'a[data-testid="login"]', 'div[data-testid="loginButton"]']
+
+# Tunggu state login yang cocok, kecuali state di exclude (state yang baru saja diisi)
+LOGIN_STATE_JS = '''({states, exclude}) => {
+    const body = document.body ? document.body.innerText : "";
+    for (const [name, rule] of Object.entries(states)) {
+        if (exclude.includes(name)) continue;
+        if ((rule.selectors || []).some(selector => document.querySelector(selector))) return name;
+        if ((rule.texts || []).some(text => body.includes(text))) return name;
+        if ((rule.paths || []).includes(location.pathname)) return name;
+    }
+    return null;
+}'''
+
+# Klik tombol lanjut/masuk berdasarkan teksnya; cadangan jika Enter tidak memajukan form
+LOGIN_CLICK_JS = '''(texts) => {
+    const button = Array.from(document.querySelectorAll('[role="button"], button'))
+        .find(element => texts.some(text => element.textContent.trim().toLowerCase() === text));
+    if (button) button.click();
+    return Boolean(button);
+}'''
+
+# Validasi sesi tersimpan: hasil cek di-cache selama SESSION_CHECK_TTL detik
+SESSION_CACHE_PATH = "twitter_session_check.json"
+SESSION_CHECK_TTL = 30 * 60
+SESSION_COOKIES = ("auth_token", "ct0")
+SESSION_LOGIN_MARKERS = ("/login", "/i/flow/login", "/logout")
+
+class SessionManager:
+    """
+    Cek apakah storage state tersimpan masih login sebelum menjalankan alur login
+
+    Urutan cek dari yang paling murah: cookie sesi di file state (tanpa request), hasil cek
+    sebelumnya di cache selama ttl detik, lalu satu request HEAD lewat context.request
+    yang memakai cookie context yang sama.
+
+    /home adalah shell SPA yang bisa menjawab 200 walau cookie sudah basi, jadi hasil cek
+    ini hanya petunjuk untuk melewati alur login. valid baru True setelah login berhasil
+    atau check_login_status melihat indikator home di halaman.
+    """
+
+    def __init__(self, state_path: str = AUTH_STATE_PATH, base_url: str = "https://twitter.com",
+                 cache_path: Optional[str] = None, ttl: float = SESSION_CHECK_TTL):
         """
-        Inisialisasi Twitter Scraper
-        
         Args:
-            headless: Menjalankan browser dalam mode headless jika True
+            state_path: File storage state Playwright
+            base_url: Origin situs untuk request cek sesi
+            cache_path: File cache hasil cek sesi; default SESSION_CACHE_PATH untuk state
+                        utama, atau <state>.check.json untuk state akun lain
+            ttl: Lama hasil cek dianggap masih berlaku (detik)
         """
-        self.headless = headless
-        self.playwright = None
-        self.browser = None
-        self.context = None
-        self.page = None
-        self.debug_mode = True  # Enable debug mode by default for troubleshooting
-        
-    def __enter__(self):
-        """Context manager entry point."""
-        self.start()
-        return self
+        if cache_path is None:
+            cache_path = (SESSION_CACHE_PATH if state_path == AUTH_STATE_PATH
+                          else f"{os.path.splitext(state_path)[0]}.check.json")
+        self.state_path = state_path
+        self.check_url = f"{base_url.rstrip('/')}/home"
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.valid = False
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        """Baca file storage state; None jika tidak ada atau rusak"""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def storage_state_path(self) -> Optional[str]:
+        """Path storage state untuk new_context, atau None jika tidak bisa dipakai"""
+        return self.state_path if self.load_state() is not None else None
+
+    def has_session_cookies(self, state: Dict[str, Any]) -> bool:
+        """True jika semua cookie sesi ada dan belum kedaluwarsa"""
+        now = time.time()
+        alive = {cookie.get("name") for cookie in state.get("cookies", [])
+                 if cookie.get("expires", -1) == -1 or cookie.get("expires", -1) > now}
+        return all(name in alive for name in SESSION_COOKIES)
+
+    def fingerprint(self) -> Optional[str]:
+        try:
+            with open(self.state_path, "rb") as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def cached_result(self) -> Optional[bool]:
+        """Hasil cek terakhir untuk file state yang sama jika belum lewat ttl"""
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get("fingerprint") != self.fingerprint() or time.time() - cache.get("checked_at", 0) > self.ttl:
+            return None
+        return bool(cache.get("valid"))
+
+    def store_result(self, valid: bool):
+        if not valid:
+            self.valid = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": self.fingerprint(), "checked_at": time.time(), "valid": valid}, f)
+        except OSError as e:
+            print(f"Gagal menyimpan cache sesi: {e}")
+
+    def mark_valid(self):
+        """Dipanggil setelah login berhasil dan storage state disimpan"""
+        self.store_result(True)
+        self.valid = True
+
+    def invalidate(self):
+        """Sesi ternyata tidak login di halaman: buang hasil cek supaya login berikutnya menjalankan alur login"""
+        self.store_result(False)
+
+    def precheck(self) -> Optional[bool]:
+        """Cek tanpa request: False jika cookie sesi tidak ada, hasil cache jika ada, None jika perlu request"""
+        state = self.load_state()
+        if state is None or not self.has_session_cookies(state):
+            self.valid = False
+            return False
+        cached = self.cached_result()
+        if cached is not None:
+            if not cached:
+                self.valid = False
+            print(f"Status sesi dari cache: {'valid' if cached else 'tidak valid'}")
+        return cached
+
+    def record_response(self, status: int, url: str) -> bool:
+        """Sesi valid jika /home terbuka tanpa dialihkan ke halaman login"""
+        valid = status < 400 and not any(marker in url for marker in SESSION_LOGIN_MARKERS)
+        self.store_result(valid)
+        print(f"Sesi tersimpan {'masih valid' if valid else 'tidak valid lagi'} ({status})")
+        return valid
+
+    async def validate(self, context) -> bool:
+        """Validasi sesi context dengan maksimal satu request"""
+        result = self.precheck()
+        if result is not None:
+            return result
+        try:
+            response = await context.request.head(self.check_url, timeout=10000)
+            return self.record_response(response.status, response.url)
+        except Exception as e:
+            print(f"Cek sesi gagal: {e}")
+            return False
+
+# Deteksi rate limit: HTTP 429, kuota header x-rate-limit, error API kode 88,
+# banner error di halaman, dan response timeline kosong berturut-turut
+RATE_LIMIT_COOLDOWN = 15 * 60
+RATE_LIMIT_MAX_COOLDOWN = 4 * 60 * 60
+RATE_LIMIT_ERROR_CODES = {88}
+RATE_LIMIT_EMPTY_RESPONSES = 3
+RATE_LIMIT_BANNER_TEXTS = [
+    "Rate limit exceeded",
+    "You are over the daily limit",
+    "Something went wrong. Try reloading.",
+    "Terjadi kesalahan. Coba muat ulang."
+]
+RATE_LIMIT_BANNER_JS = '''(texts) => {
+    const body = document.body ? document.body.innerText : "";
+    return texts.find(text => body.includes(text)) || null;
+}'''
+
+class ScrapeFailedError(Exception):
+    """
+    Pencarian gagal sebelum selesai (belum login, halaman tidak terbuka, tweet tidak
+    dimuat); membawa tweet yang sudah diambil. Pencarian tanpa hasil bukan kegagalan.
+    """
+
+    def __init__(self, reason: str, tweets: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.tweets = tweets or []
+
+class RateLimitedError(ScrapeFailedError):
+    """Pencarian dihentikan karena akun terkena rate limit; membawa tweet yang sudah diambil"""
+
+    def __init__(self, reason: str, cooldown: float, tweets: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(reason, tweets)
+        self.cooldown = cooldown
+
+    def __str__(self):
+        return f"rate limited ({self.reason}), cooldown {self.cooldown:.0f}s"
+
+class RateLimitMonitor:
+    """
+    Kumpulkan sinyal rate limit dari response dan halaman untuk satu context
+
+    handle_response dipasang di context.on("response") dan hanya membaca status dan
+    header, sehingga tidak perlu menunggu body response.
+    """
+
+    def __init__(self, cooldown: float = RATE_LIMIT_COOLDOWN):
+        self.cooldown = cooldown
+        self.limited_until = 0.0
+        self.reason = None
+        self.active_jobs = 0
+
+    def mark(self, reason: str, until: Optional[float] = None):
+        self.limited_until = max(self.limited_until, until or time.time() + self.cooldown)
+        self.reason = reason
+
+    def reset(self):
+        self.limited_until = 0.0
+        self.reason = None
+
+    def start_job(self):
+        """
+        Mulai job baru di context ini
+
+        Sinyal lunak (timeline kosong) dari job sebelumnya hanya dibuang jika tidak ada
+        job lain yang sedang berjalan, supaya job paralel tidak saling menutupi sinyal.
+        """
+        if not self.active_jobs and self.reason == "empty_timeline":
+            self.reset()
+        self.active_jobs += 1
+
+    def finish_job(self):
+        self.active_jobs = max(0, self.active_jobs - 1)
+
+    @property
+    def limited(self) -> bool:
+        return time.time() < self.limited_until
+
+    def remaining(self) -> float:
+        """Sisa cooldown dalam detik"""
+        return max(0.0, self.limited_until - time.time())
+
+    def handle_response(self, response):
+        """Tandai rate limit dari HTTP 429 atau kuota x-rate-limit-remaining yang habis"""
+        if response.status != 429 and not is_timeline_response_url(response.url):
+            return
+        headers = response.headers
+        reset = headers.get("x-rate-limit-reset")
+        until = float(reset) if reset and reset.isdigit() else None
+        if response.status == 429:
+            self.mark("http_429", until)
+        elif headers.get("x-rate-limit-remaining") == "0":
+            self.mark("quota_exhausted", until)
+
+    def check_payload(self, payload: Dict[str, Any], tweet_count: int, empty_responses: int = 0) -> int:
+        """
+        Periksa payload timeline: error kode 88, atau beberapa response kosong berturut-turut
+
+        Args:
+            payload: JSON response timeline
+            tweet_count: Jumlah tweet di payload
+            empty_responses: Jumlah response kosong berturut-turut sebelumnya di page yang sama
+
+        Returns:
+            Jumlah response kosong berturut-turut setelah payload ini (disimpan per page)
+        """
+        codes = {error.get("code") for error in payload.get("errors", []) if isinstance(error, dict)}
+        if codes & RATE_LIMIT_ERROR_CODES:
+            self.mark("api_error_88")
+        empty_responses = 0 if tweet_count else empty_responses + 1
+        if empty_responses >= RATE_LIMIT_EMPTY_RESPONSES:
+            self.mark("empty_timeline")
+        return empty_responses
+
+    def check_banner(self, banner: Optional[str]):
+        """Tandai rate limit jika banner error ditemukan (hasil RATE_LIMIT_BANNER_JS)"""
+        if banner:
+            self.mark(f"banner: {banner}")
+
+# Pool akun: daftar akun di ACCOUNTS_PATH, storage state per akun di AUTH_STATE_DIR
+ACCOUNTS_PATH = "twitter_accounts.json"
+CREDENTIALS_PATH = "twitter_credentials.json"
+AUTH_STATE_DIR = "auth_states"
+
+class TokenBucket:
+    """Token bucket sederhana: rate_per_minute token per menit, maksimal burst token"""
+
+    def __init__(self, rate_per_minute: float = 6.0, burst: int = 3):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Detik sampai satu token tersedia"""
+        self.refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> bool:
+        self.refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+class Account:
+    """Satu akun di pool beserta storage state, token bucket dan status cooldown-nya"""
+
+    def __init__(self, username: str, password: str = "", state_path: Optional[str] = None,
+                 rate_per_minute: float = 6.0, burst: int = 3):
+        self.username = username
+        self.password = password
+        safe_name = "".join(char if char.isalnum() or char in "-_." else "_" for char in username)
+        self.state_path = state_path or os.path.join(AUTH_STATE_DIR, f"{safe_name}.json")
+        self.bucket = TokenBucket(rate_per_minute, burst)
+        self.cooldown_until = 0.0
+        self.strikes = 0
+        self.busy = False
+        self.disabled = False
+        self.jobs = 0
+        self.tweets = 0
+        self.rate_limits = 0
+        self.failures = 0
+
+    def available_in(self) -> float:
+        """Detik sampai akun boleh dipakai lagi (cooldown dan token bucket)"""
+        if self.disabled:
+            return float("inf")
+        return max(self.cooldown_until - time.time(), self.bucket.wait_time(), 0.0)
+
+class AccountPool:
+    """
+    Kumpulan akun dengan token bucket dan cooldown per akun
+
+    acquire() memilih akun sehat yang paling cepat tersedia. Akun yang terkena rate limit
+    didinginkan dengan backoff eksponensial (minimal sampai waktu reset dari server).
+    """
+
+    def __init__(self, accounts: List[Account], base_cooldown: float = RATE_LIMIT_COOLDOWN,
+                 max_cooldown: float = RATE_LIMIT_MAX_COOLDOWN):
+        if not accounts:
+            raise ValueError("AccountPool membutuhkan minimal satu akun")
+        self.accounts = accounts
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+
+    @classmethod
+    def load(cls, path: str = ACCOUNTS_PATH, credentials_path: str = CREDENTIALS_PATH,
+             rate_per_minute: float = 6.0, burst: int = 3) -> "AccountPool":
+        """
+        Muat akun dari file JSON berisi list {"username", "password", "state_path"?}
+
+        Jika file tidak ada, akun tunggal dari twitter_credentials.json dipakai dengan
+        storage state lama (twitter_auth_state.json).
+        """
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        elif os.path.exists(credentials_path):
+            with open(credentials_path, encoding="utf-8") as f:
+                entries = [dict(json.load(f), state_path=AUTH_STATE_PATH)]
+        else:
+            raise FileNotFoundError(f"Tidak ada {path} atau {credentials_path}")
+        return cls([Account(entry["username"], entry.get("password", ""), entry.get("state_path"),
+                            rate_per_minute, burst) for entry in entries])
+
+    def acquire(self) -> tuple:
+        """
+        Ambil akun yang siap dipakai
+
+        Returns:
+            (akun, 0) jika ada akun siap, atau (None, detik tunggu) jika semua sibuk/cooldown
+        """
+        idle = [account for account in self.accounts if not account.busy and not account.disabled]
+        if not idle:
+            return None, 1.0 if any(not account.disabled for account in self.accounts) else float("inf")
+        account = min(idle, key=lambda item: (item.available_in(), item.strikes, -item.bucket.tokens))
+        wait = account.available_in()
+        if wait > 0 or not account.bucket.take():
+            # Akun yang sedang sibuk bisa selesai lebih dulu dari cooldown akun idle
+            if any(item.busy for item in self.accounts):
+                wait = min(wait, 1.0)
+            return None, max(wait, 0.1)
+        account.busy = True
+        return account, 0.0
+
+    def release(self, account: Account):
+        account.busy = False
+
+    def report_success(self, account: Account, tweets: int):
+        account.strikes = 0
+        account.jobs += 1
+        account.tweets += tweets
+
+    def report_rate_limited(self, account: Account, cooldown: float = 0.0):
+        """Dinginkan akun: backoff eksponensial, minimal selama cooldown dari server"""
+        account.strikes += 1
+        account.rate_limits += 1
+        backoff = min(self.base_cooldown * 2 ** (account.strikes - 1), self.max_cooldown)
+        account.cooldown_until = time.time() + max(backoff, cooldown)
+        print(f"Akun @{account.username} terkena rate limit, cooldown {max(backoff, cooldown):.0f} detik")
+
+    def report_failure(self, account: Account, error: Exception):
+        """Catat job yang gagal karena error selain rate limit"""
+        account.failures += 1
+        print(f"Job dengan akun @{account.username} gagal: {error}")
+
+    def disable(self, account: Account, reason: str):
+        account.disabled = True
+        print(f"Akun @{account.username} dinonaktifkan: {reason}")
+
+    def print_summary(self):
+        print("Ringkasan akun:")
+        for account in self.accounts:
+            status = "nonaktif" if account.disabled else (
+                f"cooldown {account.cooldown_until - time.time():.0f}s" if account.cooldown_until > time.time() else "sehat")
+            print(f"  @{account.username:<20} {account.jobs:>4} job  {account.tweets:>6} tweet  "
+                  f"{account.rate_limits:>3} rate limit  {account.failures:>3} gagal  {status}")
+
+# Selector fallback lists, dicoba berurutan sampai ada yang cocok
+TWEET_ELEMENT_SELECTORS = [
+    'article[data-testid="tweet"]',
+    'div[data-testid="cellInnerDiv"] div[data-testid="tweet"]'
+]
+# Selector yang ditunggu setelah halaman pencarian dibuka, dicoba berurutan
+TWEET_LOAD_SELECTORS = [
+    'article[data-testid="tweet"]',
+    'div[data-testid="tweet"]',
+    'div[data-testid="tweetText"]',
+    '[data-testid="cellInnerDiv"]'
+]
+USERNAME_SELECTORS = [
+    'div[data-testid="User-Name"] a span',
+    'div[data-testid="User-Name"] span',
+    'a[role="link"] div span span',
+    '[data-testid="User-Name"] a[tabindex="-1"] span'
+]
+TIME_SELECTOR = 'time'
+TEXT_SELECTOR = 'div[data-testid="tweetText"]'
+STATUS_LINK_SELECTOR = 'a[href*="/status/"]'
+METRICS_SELECTORS = {
+    "likes": ['div[data-testid="like"]', 'div[aria-label*="Like"]'],
+    "retweets": ['div[data-testid="retweet"]', 'div[aria-label*="Retweet"]'],
+    "replies": ['div[data-testid="reply"]', 'div[aria-label*="Reply"]']
+}
+
+# Mengambil semua tweet yang terlihat dalam satu kali page.evaluate
+EXTRACT_TWEETS_JS = '''(config) => {
+    let nodes = [];
+    for (const selector of config.tweet) {
+        nodes = Array.from(document.querySelectorAll(selector));
+        if (nodes.length) break;
+    }
+    return nodes.map(node => {
+        let username = "Unknown";
+        for (const selector of config.username) {
+            const el = node.querySelector(selector);
+            if (el) {
+                username = (el.textContent || "").trim();
+                if (username && username !== "Unknown") break;
+            }
+        }
+        const timeEl = node.querySelector(config.time);
+        const textEl = node.querySelector(config.text);
+        let tweetId = "";
+        for (const link of node.querySelectorAll(config.statusLink)) {
+            const href = link.getAttribute("href");
+            if (href && href.includes("/status/")) {
+                tweetId = href.split("/status/")[1].split("/")[0];
+                break;
+            }
+        }
+        const metrics = {};
+        for (const [name, selectors] of Object.entries(config.metrics)) {
+            for (const selector of selectors) {
+                const el = node.querySelector(selector);
+                if (el) {
+                    const value = (el.textContent || "").trim();
+                    if (value) metrics[name] = value;
+                    break;
+                }
+            }
+        }
+        return {
+            username: username || "Unknown",
+            timestamp: timeEl ? (timeEl.getAttribute("datetime") || "") : "",
+            text: textEl ? textEl.innerText : "",
+            tweet_id: tweetId,
+            metrics: metrics
+        };
+    });
+}'''
+
+EXTRACT_TWEETS_CONFIG = {
+    "tweet": TWEET_ELEMENT_SELECTORS,
+    "username": USERNAME_SELECTORS,
+    "time": TIME_SELECTOR,
+    "text": TEXT_SELECTOR,
+    "statusLink": STATUS_LINK_SELECTOR,
+    "metrics": METRICS_SELECTORS
+}
+
+# Mode capture "html": browser hanya menyalin fragmen HTML tweet, parsing dilakukan
+# di process pool dengan aturan selector yang sama seperti EXTRACT_TWEETS_JS
+CAPTURE_TWEET_HTML_JS = '''(config) => {
+    const captured = window.__xscrapperCaptured || (window.__xscrapperCaptured = new Set());
+    let nodes = [];
+    for (const selector of config.tweet) {
+        nodes = Array.from(document.querySelectorAll(selector));
+        if (nodes.length) break;
+    }
+    const fragments = [];
+    for (const node of nodes) {
+        const link = node.querySelector(config.statusLink);
+        const key = link ? link.getAttribute("href") : null;
+        // Tweet yang belum selesai dirender (belum ada link status) diambil pada pass berikutnya
+        if (!key || captured.has(key)) continue;
+        captured.add(key);
+        const clone = node.cloneNode(true);
+        clone.querySelectorAll("svg, img, video, picture, style, script").forEach(el => el.remove());
+        fragments.push(clone.outerHTML);
+    }
+    return fragments;
+}'''
+HTML_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+                  "source", "track", "wbr"}
+SELECTOR_ATTRIBUTE_PATTERN = re.compile(r'\[([\w-]+)(?:([*^$]?=)"([^"]*)")?\]')
+
+class HtmlNode:
+    """Elemen minimal hasil FragmentParser: tag, atribut, parent dan anak (HtmlNode atau teks)"""
+
+    __slots__ = ("tag", "attrs", "parent", "children")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["HtmlNode"] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+
+    def iter_descendants(self) -> Iterator["HtmlNode"]:
+        """Semua elemen turunan dalam urutan dokumen"""
+        stack = [child for child in reversed(self.children) if isinstance(child, HtmlNode)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, HtmlNode))
+
+    def text_content(self, line_breaks: bool = False) -> str:
+        """Gabungan teks turunan (seperti textContent); line_breaks mengubah <br> menjadi newline"""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif line_breaks and node.tag == "br":
+                parts.append("\n")
+            else:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+
+    def query_selector(self, selector: str) -> Optional["HtmlNode"]:
+        """Elemen turunan pertama yang cocok dengan selector (subset CSS, lihat compile_selector)"""
+        compiled = compile_selector(selector)
+        for node in self.iter_descendants():
+            if selector_matches(node, compiled):
+                return node
+        return None
+
+    def query_selector_all(self, selector: str) -> List["HtmlNode"]:
+        compiled = compile_selector(selector)
+        return [node for node in self.iter_descendants() if selector_matches(node, compiled)]
+
+class FragmentParser(html.parser.HTMLParser):
+    """Bangun pohon HtmlNode dari satu fragmen HTML"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#fragment", {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in HTML_VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(HtmlNode(tag, {name: value or "" for name, value in attrs}, self.current))
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(selector: str) -> tuple:
+    """
+    Compile selector CSS sederhana menjadi tuple compound (tag, ((attr, operator, nilai), ...))
+
+    Subset yang didukung cukup untuk selector di modul ini: combinator turunan (spasi),
+    tag atau "*", serta atribut [a], [a="v"], [a*="v"], [a^="v"] dan [a$="v"].
+    """
+    compounds = []
+    for part in selector.split():
+        tag = part.split("[", 1)[0]
+        attributes = tuple(SELECTOR_ATTRIBUTE_PATTERN.findall(part[len(tag):]))
+        compounds.append(((tag or "*").lower(), attributes))
+    return tuple(compounds)
+
+def compound_matches(node: HtmlNode, compound: tuple) -> bool:
+    tag, attributes = compound
+    if tag != "*" and node.tag != tag:
+        return False
+    for name, operator, value in attributes:
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if (operator == "=" and actual != value) or (operator == "*=" and value not in actual) \
+                or (operator == "^=" and not actual.startswith(value)) \
+                or (operator == "$=" and not actual.endswith(value)):
+            return False
+    return True
+
+def selector_matches(node: HtmlNode, compiled: tuple) -> bool:
+    """Cocokkan elemen dengan selector hasil compile_selector (combinator turunan)"""
+    if not compound_matches(node, compiled[-1]):
+        return False
+    ancestor = node.parent
+    for compound in reversed(compiled[:-1]):
+        while ancestor is not None and not compound_matches(ancestor, compound):
+            ancestor = ancestor.parent
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+def parse_tweet_html(fragment: str, config: Dict[str, Any] = EXTRACT_TWEETS_CONFIG) -> Dict[str, Any]:
+    """
+    Parse satu fragmen HTML tweet dengan aturan yang sama seperti EXTRACT_TWEETS_JS
+
+    Args:
+        fragment: outerHTML elemen tweet (dari CAPTURE_TWEET_HTML_JS)
+        config: Selector, default EXTRACT_TWEETS_CONFIG
+
+    Returns:
+        Record tweet (username, timestamp, text, tweet_id, metrics)
+    """
+    parser = FragmentParser()
+    parser.feed(fragment)
+    parser.close()
+    node = parser.root
+    username = "Unknown"
+    for selector in config["username"]:
+        element = node.query_selector(selector)
+        if element:
+            username = element.text_content().strip()
+            if username and username != "Unknown":
+                break
+    time_element = node.query_selector(config["time"])
+    text_element = node.query_selector(config["text"])
+    tweet_id = ""
+    for link in node.query_selector_all(config["statusLink"]):
+        href = link.attrs.get("href", "")
+        if "/status/" in href:
+            tweet_id = href.split("/status/")[1].split("/")[0]
+            break
+    metrics = {}
+    for name, selectors in config["metrics"].items():
+        for selector in selectors:
+            element = node.query_selector(selector)
+            if element:
+                value = element.text_content().strip()
+                if value:
+                    metrics[name] = value
+                break
+    return {
+        "username": username or "Unknown",
+        "timestamp": time_element.attrs.get("datetime", "") if time_element else "",
+        "text": text_element.text_content(line_breaks=True) if text_element else "",
+        "tweet_id": tweet_id,
+        "metrics": metrics
+    }
+
+def parse_tweet_fragments(fragments: List[str]) -> List[Dict[str, Any]]:
+    """Parse sekumpulan fragmen; fungsi top-level supaya bisa dijalankan di process pool"""
+    return [parse_tweet_html(fragment) for fragment in fragments]
+
+def parse_captures(path: str, workers: Optional[int] = None, chunk_size: int = 200) -> Iterator[Dict[str, Any]]:
+    """
+    Parse ulang file capture NDJSON ({"keyword", "html"} per baris) di process pool
+
+    Dipakai saat aturan ekstraksi berubah: fragmen yang sudah tersimpan tidak perlu
+    di-scrape ulang.
+
+    Args:
+        path: File capture dari TwitterScraper(capture_path=...)
+        workers: Jumlah proses parser (default: jumlah CPU)
+        chunk_size: Jumlah fragmen per tugas
+
+    Yields:
+        Record tweet sesuai urutan di file, dengan keyword dari capture
+    """
+    def chunks():
+        chunk = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    chunk.append(json.loads(line))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = collections.deque()
+        for chunk in chunks():
+            pending.append((chunk, pool.submit(parse_tweet_fragments, [item["html"] for item in chunk])))
+            # Batasi fragmen yang menunggu supaya file besar tidak dimuat seluruhnya
+            while len(pending) > (workers or os.cpu_count() or 1) * 2:
+                yield from parsed_chunk(*pending.popleft())
+        while pending:
+            yield from parsed_chunk(*pending.popleft())
+
+def parsed_chunk(chunk: List[Dict[str, Any]], future) -> Iterator[Dict[str, Any]]:
+    for item, record in zip(chunk, future.result()):
+        record["keyword"] = item.get("keyword")
+        yield record
+
+def tweet_key(tweet: Dict[str, Any]) -> str:
+    """Kunci dedup tweet: tweet_id, atau gabungan username/timestamp/text jika id kosong"""
+    if tweet.get("tweet_id"):
+        return str(tweet["tweet_id"])
+    return f"{tweet.get('username', '')}|{tweet.get('timestamp', '')}|{tweet.get('text', '')}"
+
+def newest_position(tweets: List[Dict[str, Any]], position: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Tweet ID dan timestamp terbaru dari sekumpulan tweet
+
+    Args:
+        tweets: Tweet yang dibandingkan
+        position: Posisi sebelumnya yang ikut dibandingkan (hasil newest_position)
+
+    Returns:
+        {"newest_id": int atau None, "newest_timestamp": str atau None}
+    """
+    position = position or {}
+    ids = [int(tweet["tweet_id"]) for tweet in tweets if str(tweet.get("tweet_id", "")).isdigit()]
+    timestamps = [tweet["timestamp"] for tweet in tweets if tweet.get("timestamp")]
+    if position.get("newest_id") is not None:
+        ids.append(position["newest_id"])
+    if position.get("newest_timestamp"):
+        timestamps.append(position["newest_timestamp"])
+    return {"newest_id": max(ids, default=None), "newest_timestamp": max(timestamps, default=None)}
+
+def reached_watermark(tweet: Dict[str, Any], watermark: Optional[Dict[str, Any]]) -> bool:
+    """
+    Cek apakah tweet sama dengan atau lebih lama dari high-water mark
+
+    Dibandingkan lewat tweet ID jika tersedia (ID bertambah seiring waktu), jika tidak
+    lewat timestamp ISO.
+    """
+    if not watermark:
+        return False
+    tweet_id = str(tweet.get("tweet_id", ""))
+    if tweet_id.isdigit() and watermark.get("newest_id") is not None:
+        return int(tweet_id) <= watermark["newest_id"]
+    if tweet.get("timestamp") and watermark.get("newest_timestamp"):
+        return tweet["timestamp"] <= watermark["newest_timestamp"]
+    return False
+
+# Endpoint yang membawa hasil pencarian sebagai JSON (GraphQL dan API lama)
+TIMELINE_RESPONSE_MARKERS = ["/SearchTimeline", "/search/adaptive.json"]
+
+def is_timeline_response_url(url: str) -> bool:
+    """Cek apakah URL response adalah payload timeline pencarian"""
+    path = url.split("?", 1)[0]
+    return any(marker in path for marker in TIMELINE_RESPONSE_MARKERS)
+
+def parse_twitter_datetime(created_at: str) -> str:
+    """Ubah format created_at API ("Wed Oct 10 20:19:24 +0000 2018") ke ISO seperti atribut <time>"""
+    try:
+        parsed = datetime.datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
+        return parsed.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    except (TypeError, ValueError):
+        return created_at or ""
+
+def tweet_record_from_legacy(legacy: Dict[str, Any], screen_name: str, text: Optional[str] = None) -> Dict[str, Any]:
+    """Bangun record tweet dari objek "legacy" milik API"""
+    return {
+        "username": screen_name or "Unknown",
+        "timestamp": parse_twitter_datetime(legacy.get("created_at", "")),
+        "text": text if text is not None else legacy.get("full_text", legacy.get("text", "")),
+        "tweet_id": str(legacy.get("id_str", "")),
+        "metrics": {
+            "likes": str(legacy.get("favorite_count", 0)),
+            "retweets": str(legacy.get("retweet_count", 0)),
+            "replies": str(legacy.get("reply_count", 0))
+        }
+    }
+
+def tweet_record_from_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Bangun record tweet dari node GraphQL tweet_results.result"""
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet", {})
+    legacy = result.get("legacy")
+    if not legacy:
+        return None
+    user = result.get("core", {}).get("user_results", {}).get("result", {})
+    screen_name = user.get("core", {}).get("screen_name") or user.get("legacy", {}).get("screen_name", "")
+    note = result.get("note_tweet", {}).get("note_tweet_results", {}).get("result", {})
+    record = tweet_record_from_legacy(legacy, screen_name, note.get("text"))
+    record["tweet_id"] = str(result.get("rest_id") or record["tweet_id"])
+    return record
+
+def parse_timeline_payload(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Parse payload JSON timeline pencarian menjadi record tweet
+
+    Mendukung respons GraphQL SearchTimeline (tweet_results di dalam entries)
+    dan respons lama search/adaptive.json (globalObjects).
+
+    Args:
+        payload: JSON hasil response.json()
+
+    Returns:
+        List berisi record tweet dengan format yang sama seperti mode DOM
+    """
+    records = []
+    global_objects = payload.get("globalObjects") if isinstance(payload, dict) else None
+    if global_objects:
+        users = global_objects.get("users", {})
+        for tweet_id, legacy in global_objects.get("tweets", {}).items():
+            user = users.get(str(legacy.get("user_id_str", "")), {})
+            record = tweet_record_from_legacy(legacy, user.get("screen_name", ""))
+            record["tweet_id"] = record["tweet_id"] or str(tweet_id)
+            records.append(record)
+        return records
+
+    # Quoted tweet dan retweet memakai key lain, jadi hanya tweet utama yang diambil
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Tweet promosi bukan hasil pencarian
+            if node.get("promotedMetadata") or str(node.get("entryId", "")).startswith("promoted"):
+                continue
+            tweet_results = node.get("tweet_results")
+            if isinstance(tweet_results, dict) and tweet_results.get("result"):
+                record = tweet_record_from_result(tweet_results["result"])
+                if record:
+                    records.append(record)
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return records
+
+SEARCH_DATE_FORMATS = ["%Y-%m-%d", "%Y-%m-%d_%H:%M:%S_UTC"]
+
+def parse_search_date(value: str) -> datetime.datetime:
+    """Parse tanggal pencarian: YYYY-MM-DD atau YYYY-MM-DD_HH:MM:SS_UTC"""
+    for date_format in SEARCH_DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    raise ValueError(f"Format tanggal tidak valid: {value}")
+
+def format_search_date(value: datetime.datetime) -> str:
+    """Format tanggal untuk operator since:/until:, presisi jam hanya jika perlu"""
+    if value.time() == datetime.time(0, 0):
+        return value.strftime(SEARCH_DATE_FORMATS[0])
+    return value.strftime(SEARCH_DATE_FORMATS[1])
+
+def split_date_range(start_date: str, end_date: str, window: Any = "day") -> List[tuple]:
+    """
+    Pecah rentang since/until menjadi window berurutan
+
+    Args:
+        start_date: Awal rentang
+        end_date: Akhir rentang (eksklusif)
+        window: "day", "hour", atau jumlah jam per window
+
+    Returns:
+        List pasangan (since, until) dalam format pencarian
+    """
+    hours = {"day": 24, "hour": 1}.get(window, window)
+    if not isinstance(hours, (int, float)) or hours <= 0:
+        raise ValueError(f"Window tidak valid: {window}")
+    step = datetime.timedelta(hours=hours)
+    start = parse_search_date(start_date)
+    end = parse_search_date(end_date)
+    shards = []
+    while start < end:
+        stop = min(start + step, end)
+        shards.append((format_search_date(start), format_search_date(stop)))
+        start = stop
+    return shards
+
+def split_dense_shard(start_date: str, end_date: str, parts: int = 4) -> List[tuple]:
+    """Pecah window yang terlalu padat menjadi beberapa bagian, minimal satu jam"""
+    span = parse_search_date(end_date) - parse_search_date(start_date)
+    if span <= datetime.timedelta(hours=1):
+        return []
+    hours = max(1, math.ceil(span.total_seconds() / 3600 / parts))
+    return split_date_range(start_date, end_date, hours)
+
+def build_search_url(origin: str, keyword: str, lang: Optional[str] = None,
+                     start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     max_id: Optional[str] = None) -> str:
+    """Bangun URL pencarian live untuk origin tertentu"""
+    base_url = f"{origin}/search"
+    query_parts = [keyword]
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit point."""
-        self.close()
+    if lang:
+        query_parts.append(f"lang:{lang}")
         
-    def start(self):
-        """Memulai browser dan membuat context."""
-        print("Memulai browser...")
-        self.playwright = sync_playwright().start()
-        browser_args = [
-            '--disable-blink-features=AutomationControlled',
-            '--disable-features=IsolateOrigins,site-per-process',
-            '--disable-web-security',
-            '--disable-setuid-sandbox',
-            '--no-sandbox',
-            '--disable-dev-shm-usage',
-            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
-        ]
-        
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless, 
-            args=browser_args
-        )
-        self.context = self.browser.new_context(
-            viewport={"width": 1366, "height": 768},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
-        )
-        state_path = "twitter_auth_state.json"
-        if os.path.exists(state_path):
-            try:
-                self.context = self.browser.new_context(
-                    storage_state=state_path,
-                    viewport={"width": 1366, "height": 768},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
-                )
-                print(f"Loaded browser state from {state_path}")
-            except Exception as e:
-                print(f"Failed to load browser state: {e}")
-        self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            window.navigator.chrome = { runtime: {} };
-            Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-            );
-        """)
-        
-        self.page = self.context.new_page()
-        self.page.set_extra_http_headers({
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Referer': 'https://twitter.com/',
-            'sec-ch-ua': '"Chromium";v="123", "Google Chrome";v="123"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-        })
+    if start_date and end_date:
+        start = format_search_date(parse_search_date(start_date))
+        end = format_search_date(parse_search_date(end_date))
+        query_parts.append(f"since:{start} until:{end}")
         
-        print("Browser berhasil dimulai.")
-    
-    def debug_screenshot(self, name="debug"):
-        """Take a debug screenshot if debug mode is enabled"""
-        if self.debug_mode:
-            filename = f"{name}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}.png"
-            self.page.screenshot(path=filename)
-            print(f"Debug screenshot saved to {filename}")
+    if max_id:
+        query_parts.append(f"max_id:{max_id}")
         
-    def save_page_content(self, name="page_content"):
-        """Save the current page HTML content for debugging"""
-        if self.debug_mode:
-            filename = f"{name}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}.html"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(self.page.content())
-            print(f"Page content saved to {filename}")
-    
-    def improved_login(self, username: str, password: str) -> bool:
+    query = " ".join(query_parts)
+    search_query = f"{base_url}?q={query}&src=typed_query&f=live"
+    return search_query
+
+# Tweet ID adalah snowflake: bit di atas bit ke-22 berisi milidetik sejak epoch Twitter
+TWITTER_EPOCH_MS = 1288834974657
+SNOWFLAKE_TIMESTAMP_SHIFT = 22
+# Tweet sebelum November 2010 memakai ID berurutan yang tidak membawa waktu
+FIRST_SNOWFLAKE_ID = 29700859247
+
+def snowflake_id(tweet: Dict[str, Any]) -> Optional[int]:
+    """tweet_id sebagai int64, atau None jika tidak numerik"""
+    tweet_id = str(tweet.get("tweet_id", ""))
+    return int(tweet_id) if tweet_id.isdigit() else None
+
+def snowflake_time(tweet_id: Any) -> Optional[datetime.datetime]:
+    """Waktu pembuatan tweet (UTC, naive) dari snowflake ID, atau None untuk ID lama/tidak valid"""
+    tweet_id = int(tweet_id) if str(tweet_id).isdigit() else 0
+    if tweet_id < FIRST_SNOWFLAKE_ID:
+        return None
+    milliseconds = (tweet_id >> SNOWFLAKE_TIMESTAMP_SHIFT) + TWITTER_EPOCH_MS
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(milliseconds=milliseconds)
+
+def snowflake_floor(value: datetime.datetime) -> int:
+    """ID snowflake terkecil untuk tweet yang dibuat pada atau setelah value (UTC, naive)"""
+    milliseconds = (value - datetime.datetime(1970, 1, 1)) // datetime.timedelta(milliseconds=1)
+    return max(milliseconds - TWITTER_EPOCH_MS, 0) << SNOWFLAKE_TIMESTAMP_SHIFT
+
+def snowflake_window(start_date: Optional[str], end_date: Optional[str]) -> tuple:
+    """Batas ID (bawah inklusif, atas eksklusif) untuk rentang since/until; None jika tidak diatur"""
+    lower = snowflake_floor(parse_search_date(start_date)) if start_date else None
+    upper = snowflake_floor(parse_search_date(end_date)) if end_date else None
+    return lower, upper
+
+def snowflake_sort_key(tweet: Dict[str, Any]) -> int:
+    """Kunci urut waktu dari tweet ID; timestamp hanya di-parse untuk tweet tanpa ID"""
+    tweet_id = snowflake_id(tweet)
+    if tweet_id is not None:
+        return tweet_id
+    try:
+        created = datetime.datetime.fromisoformat(tweet.get("timestamp", "").replace("Z", "+00:00"))
+        return snowflake_floor(created.replace(tzinfo=None) - (created.utcoffset() or datetime.timedelta()))
+    except ValueError:
+        return 0
+
+def sort_tweets(tweets: List[Dict[str, Any]], newest_first: bool = True) -> List[Dict[str, Any]]:
+    """Urutkan tweet gabungan menurut waktu pembuatan (snowflake ID)"""
+    return sorted(tweets, key=snowflake_sort_key, reverse=newest_first)
+
+class SeenIndex:
+    """
+    Index tweet yang sudah diambil, dipakai untuk dedup dan deteksi progres scroll
+
+    Mode "set" menyimpan semua kunci secara eksak. Mode "bloom" memakai Bloom filter
+    dengan memori tetap untuk run jutaan tweet; sesekali tweet baru bisa dianggap
+    sudah terlihat (false positive) sesuai error_rate.
+    """
+
+    def __init__(self, mode: str = "set", capacity: int = 10_000_000, error_rate: float = 0.001):
         """
-        Enhanced login method with better error handling and detection mechanisms
-        
         Args:
-            username: Twitter username or email
-            password: Twitter password
-            
-        Returns:
-            True if login successful, False otherwise
+            mode: "set" (eksak) atau "bloom" (memori terbatas)
+            capacity: Perkiraan jumlah kunci maksimal untuk mode bloom
+            error_rate: Target false positive rate untuk mode bloom
         """
-        try:
-            print("Mencoba login ke Twitter dengan metode yang ditingkatkan...")
-            self.context.clear_cookies()
-            self.page.goto("https://twitter.com/i/flow/login", timeout=30000)
-            self.page.wait_for_timeout(4000)  # Wait for page to stabilize
-            self.debug_screenshot("login_page_initial")
-            if self.page.query_selector('a[data-testid="AppTabBar_Home_Link"]') or self.page.query_selector('a[aria-label="Home"]'):
-                print("Already logged in!")
-                return True
-            try:
-                print("Waiting for username field...")
-                username_field = self.page.wait_for_selector('input[autocomplete="username"]', timeout=10000)
-                
-                if not username_field:
-                    raise Exception("Username field not found")
-                for char in username:
-                    username_field.type(char)
-                    self.page.wait_for_timeout(random.randint(50, 150))
-                
-                self.page.wait_for_timeout(1000)
-                self.debug_screenshot("after_username_entry")
-                clicked = False
-                next_button_selectors = [
-                    'div[data-testid="auth_next_button"]',
-                    'div[data-testid="LoginForm_Forward_Button"]',
-                    'div[role="button"]:has-text("Next")',
-                    'div[role="button"]:has-text("Berikutnya")'
-                ]
-                
-                for selector in next_button_selectors:
-                    if self.page.query_selector(selector):
-                        try:
-                            self.page.click(selector)
-                            print(f"Clicked Next button using selector: {selector}")
-                            clicked = True
-                            break
-                        except Exception as e:
-                            print(f"Failed to click {selector}: {e}")
-                if not clicked:
-                    try:
-                        print("Trying JavaScript click method...")
-                        self.page.evaluate('''() => {
-                            const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                            const nextButton = buttons.find(button => {
-                                const text = button.textContent.toLowerCase();
-                                return text.includes('next') || text.includes('berikutnya');
-                            });
-                            if (nextButton) {
-                                nextButton.click();
-                                return true;
-                            }
-                            return false;
-                        }''')
-                        clicked = True
-                    except Exception as e:
-                        print(f"JavaScript click failed: {e}")
-                self.page.wait_for_timeout(3000)
-                self.debug_screenshot("after_next_button")
-                if self.page.query_selector('input[data-testid="ocfEnterTextTextInput"]'):
-                    print("Detected username verification step")
-                    input_field = self.page.query_selector('input[data-testid="ocfEnterTextTextInput"]')
-                    if input_field:
-                        for char in username:
-                            input_field.type(char)
-                            self.page.wait_for_timeout(random.randint(50, 150))
-                        self.page.wait_for_timeout(1000)
-                        for selector in next_button_selectors:
-                            if self.page.query_selector(selector):
-                                try:
-                                    self.page.click(selector)
-                                    print(f"Clicked Next button in verification step using: {selector}")
-                                    break
-                                except:
-                                    continue
-                        self.page.evaluate('''() => {
-                            const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                            const nextButton = buttons.find(button => {
-                                const text = button.textContent.toLowerCase();
-                                return text.includes('next') || text.includes('berikutnya');
-                            });
-                            if (nextButton) nextButton.click();
-                        }''')
-                        
-                        self.page.wait_for_timeout(3000)
-                password_selectors = [
-                    'input[name="password"]',
-                    'input[type="password"]',
-                    'input[autocomplete="current-password"]'
-                ]
-                password_field = None
-                for selector in password_selectors:
-                    try:
-                        password_field = self.page.wait_for_selector(selector, timeout=10000)
-                        if password_field:
-                            print(f"Found password field using selector: {selector}")
-                            break
-                    except Exception as e:
-                        print(f"Selector {selector} not found: {e}")
-                
-                if not password_field:
-                    self.debug_screenshot("password_field_missing")
-                    self.save_page_content("password_page_content")
-                    print("Password field not found after multiple attempts")
-                    if self.page.query_selector('text="Verify your identity"') or self.page.query_selector('text="Verify your phone"'):
-                        print("Twitter is requesting additional verification. Please login manually first.")
-                    
-                    return False
-                for char in password:
-                    password_field.type(char)
-                    self.page.wait_for_timeout(random.randint(50, 150))
-                
-                self.page.wait_for_timeout(1000)
-                self.debug_screenshot("after_password_entry")
-                login_button_selectors = [
-                    'div[data-testid="LoginForm_Login_Button"]',
-                    'div[role="button"]:has-text("Log in")',
-                    'div[role="button"]:has-text("Login")',
-                    'div[role="button"]:has-text("Masuk")'
-                ]
-                
-                clicked = False
-                for selector in login_button_selectors:
-                    if self.page.query_selector(selector):
-                        try:
-                            self.page.click(selector)
-                            print(f"Clicked login button using selector: {selector}")
-                            clicked = True
-                            break
-                        except:
-                            continue
-                if not clicked:
-                    print("Using JavaScript to click login button")
-                    self.page.evaluate('''() => {
-                        const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                        const loginButton = buttons.find(button => {
-                            const text = button.textContent.toLowerCase();
-                            return text.includes('log in') || text.includes('login') || text.includes('masuk');
-                        });
-                        if (loginButton) loginButton.click();
-                    }''')
-                print("Waiting for login to complete...")
-                self.page.wait_for_timeout(6000)
-                self.debug_screenshot("after_login_attempt")
-                home_selectors = [
-                    'a[aria-label="Home"]',
-                    'a[data-testid="AppTabBar_Home_Link"]',
-                    'div[data-testid="primaryColumn"]',
-                    'header[role="banner"]'
-                ]
-                
-                for selector in home_selectors:
-                    try:
-                        if self.page.wait_for_selector(selector, timeout=5000):
-                            print(f"Login confirmed with selector: {selector}")
-                            state_path = "twitter_auth_state.json"
-                            self.context.storage_state(path=state_path)
-                            print(f"Browser state saved to {state_path}")
-                            return True
-                    except:
-                        continue
-                error_indicators = [
-                    'div:has-text("Wrong password")',
-                    'div:has-text("Verify your identity")',
-                    'div:has-text("Unusual login")',
-                    'div:has-text("We noticed unusual activity")'
-                ]
-                
-                for indicator in error_indicators:
-                    if self.page.query_selector(indicator):
-                        print(f"Login failed: {indicator} detected")
-                        return False
-                current_url = self.page.url
-                if "twitter.com/home" in current_url:
-                    print("Login successful based on URL redirect")
-                    state_path = "twitter_auth_state.json"
-                    self.context.storage_state(path=state_path)
-                    print(f"Browser state saved to {state_path}")
-                    return True
-                
-                print("Login status uncertain - check the debug screenshots")
-                return False
-                
-            except Exception as e:
-                print(f"Error during login process: {e}")
-                self.debug_screenshot("login_error")
-                self.save_page_content("error_page_content")
+        if mode not in ("set", "bloom"):
+            raise ValueError(f"Unknown SeenIndex mode: {mode}")
+        self.mode = mode
+        self.count = 0
+        if mode == "set":
+            self._keys = set()
+        else:
+            self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+            self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+            self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key: str) -> bool:
+        if self.mode == "set":
+            return key in self._keys
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key: str) -> bool:
+        """Tambahkan kunci; return True jika kunci belum pernah terlihat"""
+        if self.mode == "set":
+            if key in self._keys:
                 return False
-                
-        except Exception as e:
-            print(f"Critical error in login process: {e}")
-            self.debug_screenshot("critical_error")
-            return False
-    
+            self._keys.add(key)
+            self.count += 1
+            return True
+        new = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+# Skema CSV tetap, supaya metrik yang baru muncul di tengah run tidak hilang
+CSV_FIELDNAMES = ['username', 'timestamp', 'text', 'tweet_id'] + \
+    [f"metrics_{metric}" for metric in METRICS_SELECTORS] + ['keyword']
+
+def tweet_to_csv_row(tweet: Dict[str, Any]) -> Dict[str, Any]:
+    """Ratakan tweet menjadi baris CSV sesuai CSV_FIELDNAMES"""
+    row = {
+        'username': tweet.get('username', ''),
+        'timestamp': tweet.get('timestamp', ''),
+        'text': tweet.get('text', ''),
+        'tweet_id': tweet.get('tweet_id', ''),
+        'keyword': tweet.get('keyword', '')
+    }
+    for metric in METRICS_SELECTORS:
+        row[f"metrics_{metric}"] = (tweet.get('metrics') or {}).get(metric, '')
+    return row
+
+CHECKPOINT_PATH = "scrape_checkpoints.db"
+
+class CheckpointStore:
+    """
+    Checkpoint persisten per job scraping (SQLite)
+
+    Menyimpan query, tweet yang sudah diambil (id dan data), tweet tertua/terbaru
+    yang sudah dicapai, serta progres shard. Job yang dijalankan ulang dengan
+    parameter yang sama akan melewati pekerjaan yang sudah selesai.
+    """
+
+    def __init__(self, path: str = CHECKPOINT_PATH):
+        """
+        Args:
+            path: Lokasi file database SQLite
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                lang TEXT,
+                start_date TEXT,
+                end_date TEXT,
+                status TEXT NOT NULL DEFAULT 'running',
+                collected INTEGER NOT NULL DEFAULT 0,
+                oldest_id INTEGER,
+                newest_id INTEGER,
+                oldest_timestamp TEXT,
+                newest_timestamp TEXT,
+                output TEXT,
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS job_tweets (
+                job_id TEXT NOT NULL,
+                tweet_key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (job_id, tweet_key)
+            );
+            CREATE TABLE IF NOT EXISTS job_shards (
+                job_id TEXT NOT NULL,
+                since TEXT NOT NULL,
+                until TEXT NOT NULL,
+                status TEXT NOT NULL,
+                collected INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, since, until)
+            );
+            CREATE TABLE IF NOT EXISTS watermarks (
+                signature TEXT PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                lang TEXT,
+                newest_id INTEGER,
+                newest_timestamp TEXT,
+                polls INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT,
+                resume_max_id INTEGER,
+                pending_id INTEGER,
+                pending_timestamp TEXT
+            );
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def job_id(keyword: str, lang: Optional[str] = None, start_date: Optional[str] = None,
+               end_date: Optional[str] = None) -> str:
+        """ID job yang stabil untuk kombinasi parameter pencarian"""
+        signature = json.dumps([keyword, lang, start_date, end_date])
+        return hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+
+    def open_job(self, keyword: str, lang: Optional[str] = None, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None) -> Dict[str, Any]:
+        """Ambil job yang sudah ada atau buat job baru; return baris job sebagai dict"""
+        job_id = self.job_id(keyword, lang, start_date, end_date)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, keyword, lang, start_date, end_date, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, keyword, lang, start_date, end_date, datetime.datetime.now().isoformat())
+            )
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def reset_job(self, job_id: str):
+        """Hapus progres job supaya dijalankan dari awal"""
+        with self.conn:
+            self.conn.execute("DELETE FROM job_tweets WHERE job_id = ?", (job_id,))
+            self.conn.execute("DELETE FROM job_shards WHERE job_id = ?", (job_id,))
+            self.conn.execute(
+                "UPDATE jobs SET status = 'running', collected = 0, oldest_id = NULL, newest_id = NULL, "
+                "oldest_timestamp = NULL, newest_timestamp = NULL, output = NULL WHERE job_id = ?",
+                (job_id,)
+            )
+
+    def set_output(self, job_id: str, output: str):
+        """Catat file output job supaya bisa dilanjutkan (append) saat resume"""
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET output = ? WHERE job_id = ?", (output, job_id))
+
+    def seen_keys(self, job_id: str) -> Iterator[str]:
+        """Kunci dedup semua tweet yang sudah tersimpan untuk job"""
+        for row in self.conn.execute("SELECT tweet_key FROM job_tweets WHERE job_id = ?", (job_id,)):
+            yield row[0]
+
+    def tweets(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """Semua tweet yang sudah tersimpan untuk job"""
+        for row in self.conn.execute("SELECT payload FROM job_tweets WHERE job_id = ?", (job_id,)):
+            yield json.loads(row[0])
+
+    def record_tweets(self, job_id: str, tweets: List[Dict[str, Any]]):
+        """Simpan satu batch tweet dan perbarui posisi tertua/terbaru dalam satu transaksi"""
+        if not tweets:
+            return
+        ids = [int(tweet["tweet_id"]) for tweet in tweets if str(tweet.get("tweet_id", "")).isdigit()]
+        timestamps = [tweet["timestamp"] for tweet in tweets if tweet.get("timestamp")]
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO job_tweets (job_id, tweet_key, payload) VALUES (?, ?, ?)",
+                [(job_id, tweet_key(tweet), json.dumps(tweet, ensure_ascii=False)) for tweet in tweets]
+            )
+            self.conn.execute(
+                """UPDATE jobs SET
+                    collected = collected + ?,
+                    oldest_id = COALESCE(MIN(COALESCE(oldest_id, ?), ?), oldest_id),
+                    newest_id = COALESCE(MAX(COALESCE(newest_id, ?), ?), newest_id),
+                    oldest_timestamp = COALESCE(MIN(COALESCE(oldest_timestamp, ?), ?), oldest_timestamp),
+                    newest_timestamp = COALESCE(MAX(COALESCE(newest_timestamp, ?), ?), newest_timestamp),
+                    updated_at = ?
+                WHERE job_id = ?""",
+                (cursor.rowcount,
+                 min(ids, default=None), min(ids, default=None),
+                 max(ids, default=None), max(ids, default=None),
+                 min(timestamps, default=None), min(timestamps, default=None),
+                 max(timestamps, default=None), max(timestamps, default=None),
+                 datetime.datetime.now().isoformat(), job_id)
+            )
+
+    def mark_done(self, job_id: str):
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET status = 'done', updated_at = ? WHERE job_id = ?",
+                              (datetime.datetime.now().isoformat(), job_id))
+
+    def get_watermark(self, keyword: str, lang: Optional[str] = None, start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """High-water mark (tweet terbaru yang sudah diambil) untuk query, atau None"""
+        row = self.conn.execute("SELECT * FROM watermarks WHERE signature = ?",
+                                (self.job_id(keyword, lang, start_date, end_date),)).fetchone()
+        return dict(row) if row else None
+
+    def advance_watermark(self, keyword: str, lang: Optional[str], start_date: Optional[str],
+                          end_date: Optional[str], newest: Dict[str, Any]):
+        """
+        Majukan high-water mark query ke posisi terbaru dari satu poll (tidak pernah mundur)
+
+        Dipanggil setelah poll mencapai mark (atau akhir timeline); resume cursor
+        dari poll yang terpotong dihapus.
+        """
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO watermarks (signature, keyword, lang, newest_id, newest_timestamp, polls, updated_at)
+                VALUES (?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(signature) DO UPDATE SET
+                    newest_id = COALESCE(MAX(COALESCE(newest_id, excluded.newest_id), excluded.newest_id), newest_id),
+                    newest_timestamp = COALESCE(MAX(COALESCE(newest_timestamp, excluded.newest_timestamp),
+                                                    excluded.newest_timestamp), newest_timestamp),
+                    polls = polls + 1,
+                    updated_at = excluded.updated_at,
+                    resume_max_id = NULL,
+                    pending_id = NULL,
+                    pending_timestamp = NULL""",
+                (self.job_id(keyword, lang, start_date, end_date), keyword, lang, newest["newest_id"],
+                 newest["newest_timestamp"], datetime.datetime.now().isoformat())
+            )
+
+    def suspend_watermark(self, keyword: str, lang: Optional[str], start_date: Optional[str],
+                          end_date: Optional[str], newest: Dict[str, Any], resume_max_id: int):
+        """
+        Simpan resume cursor untuk poll yang terpotong max_tweets sebelum mencapai mark
+
+        Mark tidak dimajukan. Poll berikutnya mengisi celah dari max_id:resume_max_id
+        sampai mark, baru kemudian mark dimajukan ke posisi terbaru yang tersimpan di sini.
+
+        Args:
+            newest: Posisi terbaru yang sudah diambil (hasil newest_position)
+            resume_max_id: ID tweet tertua yang sudah diambil dikurangi satu
+        """
+        with self.conn:
+            self.conn.execute(
+                """UPDATE watermarks SET resume_max_id = ?, pending_id = ?, pending_timestamp = ?,
+                    polls = polls + 1, updated_at = ?
+                WHERE signature = ?""",
+                (resume_max_id, newest["newest_id"], newest["newest_timestamp"],
+                 datetime.datetime.now().isoformat(), self.job_id(keyword, lang, start_date, end_date))
+            )
+
+    def shard_status(self, job_id: str, since: str, until: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT status FROM job_shards WHERE job_id = ? AND since = ? AND until = ?",
+            (job_id, since, until)
+        ).fetchone()
+        return row[0] if row else None
+
+    def pending_shards(self, job_id: str, shards: List[tuple]) -> List[tuple]:
+        """Buang shard yang sudah selesai; shard yang pernah dipecah diganti sub-shardnya"""
+        pending = []
+        for since, until in shards:
+            status = self.shard_status(job_id, since, until)
+            if status == "split":
+                pending.extend(self.pending_shards(job_id, split_dense_shard(since, until)))
+            elif status != "done":
+                pending.append((since, until))
+        return pending
+
+    def mark_shard(self, job_id: str, since: str, until: str, status: str, collected: int = 0):
+        """Catat status shard (done/split/failed) beserta jumlah tweet yang didapat"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO job_shards (job_id, since, until, status, collected) VALUES (?, ?, ?, ?, ?)",
+                (job_id, since, until, status, collected)
+            )
+
+# Sufiks singkatan angka di tombol metrik per bahasa UI ("1.2K", "3,4 rb", "1,5 jt", "2 M" = miliar)
+METRIC_SUFFIXES = {
+    "en": {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000},
+    "id": {"RB": 1_000, "JT": 1_000_000, "M": 1_000_000_000, "T": 1_000_000_000_000}
+}
+# Tanpa bahasa: sufiks Indonesia yang tidak ambigu ditambah sufiks Inggris ("M" = juta)
+METRIC_SUFFIXES[None] = {**METRIC_SUFFIXES["id"], **METRIC_SUFFIXES["en"]}
+METRIC_PATTERN = re.compile(r"^([0-9][0-9.,]*)([A-Z]*)\.?$")
+METRIC_NAMES = ("likes", "retweets", "replies")
+
+@functools.lru_cache(maxsize=65536)
+def parse_metric_display(value: Any, lang: Optional[str] = None) -> tuple:
+    """
+    Ubah teks tombol metrik menjadi (jumlah, perkiraan)
+
+    Angka bersufiks ("1.2K", "3,4 rb") memakai satu pemisah sebagai desimal dan ditandai
+    perkiraan; angka tanpa sufiks ("1,234", "1.234") memakai pemisah sebagai ribuan.
+
+    Args:
+        value: Teks metrik, integer, atau None
+        lang: Bahasa UI ("en"/"id"); menentukan arti sufiks "M"
+
+    Returns:
+        Tuple (integer atau None jika kosong/tidak valid, True jika angka disingkat)
+    """
+    if value is None:
+        return None, False
+    if isinstance(value, int):
+        return value, False
+    text = "".join(str(value).split()).upper()
+    match = METRIC_PATTERN.match(text)
+    if not match:
+        return None, False
+    number, suffix = match.groups()
+    if not suffix:
+        digits = number.replace(",", "").replace(".", "")
+        return (int(digits), False) if digits else (None, False)
+    multiplier = METRIC_SUFFIXES.get(lang, METRIC_SUFFIXES[None]).get(suffix)
+    if multiplier is None:
+        return None, False
+    # Pemisah terakhir adalah desimal, sisanya pemisah ribuan ("1.234,5 rb" / "1,234.5K")
+    decimal_at = max(number.rfind(","), number.rfind("."))
+    if decimal_at >= 0:
+        number = number[:decimal_at].replace(",", "").replace(".", "") + "." + number[decimal_at + 1:]
+    try:
+        return int(round(float(number) * multiplier)), True
+    except ValueError:
+        return None, False
+
+def parse_metric_count(value: Any, lang: Optional[str] = None) -> Optional[int]:
+    """Ubah teks metrik ("1,234", "1.2K", "3,4 rb") menjadi integer; None jika kosong/tidak valid"""
+    return parse_metric_display(value, lang)[0]
+
+def normalize_metric_column(values: Iterable[Any], lang: Optional[str] = None) -> tuple:
+    """
+    Normalisasi satu kolom teks metrik sekaligus
+
+    Tiap nilai unik hanya di-parse sekali, lalu seluruh kolom dipetakan lewat tabel lookup,
+    sehingga jutaan baris dengan sedikit variasi tampilan tetap cepat.
+
+    Args:
+        values: Teks metrik per tweet (mis. semua nilai "likes")
+        lang: Bahasa UI ("en"/"id")
+
+    Returns:
+        Tuple (list jumlah integer/None, list flag perkiraan)
+    """
+    values = list(values)
+    table = {value: parse_metric_display(value, lang) for value in set(values)}
+    parsed = [table[value] for value in values]
+    return [count for count, _ in parsed], [approximate for _, approximate in parsed]
+
+def normalize_tweet_metrics(tweets: List[Dict[str, Any]], lang: Optional[str] = None) -> Dict[str, list]:
+    """
+    Normalisasi metrik sekumpulan tweet per kolom
+
+    Returns:
+        Dict {"likes": [...], "retweets": [...], "replies": [...], "metrics_approximate": [...]},
+        dengan metrics_approximate True jika salah satu metrik tweet itu disingkat atau
+        tweet sudah membawa flag tersebut (dict dari Tweet.to_dict)
+    """
+    metrics = [tweet.get("metrics") or {} for tweet in tweets]
+    columns, flags = {}, [[bool(tweet.get("metrics_approximate")) for tweet in tweets]]
+    for name in METRIC_NAMES:
+        columns[name], approximate = normalize_metric_column((item.get(name) for item in metrics), lang)
+        flags.append(approximate)
+    columns["metrics_approximate"] = [any(row) for row in zip(*flags)]
+    return columns
+
+# Nilai kosong di kolom integer TweetBatch (ID, timestamp dan metrik selalu >= 0)
+MISSING_INT = -1
+
+def timestamp_to_ms(value: Any) -> Optional[int]:
+    """Timestamp ISO tweet menjadi milidetik sejak epoch (UTC), atau None"""
+    parsed = parse_tweet_timestamp(value)
+    if parsed is None:
+        return None
+    return (parsed - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)) // datetime.timedelta(milliseconds=1)
+
+def ms_to_timestamp(value: Optional[int]) -> str:
+    """Milidetik sejak epoch menjadi timestamp ISO seperti atribut <time> ("2025-01-01T00:03:00.000Z")"""
+    if value is None or value == MISSING_INT:
+        return ""
+    created = datetime.datetime(1970, 1, 1) + datetime.timedelta(milliseconds=value)
+    return created.isoformat(timespec="milliseconds") + "Z"
+
+class Tweet:
+    """
+    Record tweet ringkas dengan __slots__
+
+    tweet_id, timestamp (milidetik epoch) dan metrik disimpan sebagai integer, username
+    dan keyword di-intern. to_dict() mengembalikan bentuk dict hasil scrape_tweets.
+    """
+
+    __slots__ = ("tweet_id", "username", "timestamp_ms", "text", "keyword",
+                 "likes", "retweets", "replies", "metrics_approximate")
+
+    def __init__(self, tweet_id: Optional[int], username: str, timestamp_ms: Optional[int], text: str,
+                 keyword: Optional[str] = None, likes: Optional[int] = None, retweets: Optional[int] = None,
+                 replies: Optional[int] = None, metrics_approximate: bool = False):
+        self.tweet_id = tweet_id
+        self.username = sys.intern(username or "")
+        self.timestamp_ms = timestamp_ms
+        self.text = text
+        self.keyword = sys.intern(keyword) if keyword else None
+        self.likes = likes
+        self.retweets = retweets
+        self.replies = replies
+        self.metrics_approximate = metrics_approximate
+
+    @classmethod
+    def from_dict(cls, tweet: Dict[str, Any], lang: Optional[str] = None) -> "Tweet":
+        """
+        Buat Tweet dari dict hasil scrape_tweets
+
+        Args:
+            tweet: Data tweet
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        metrics = tweet.get("metrics") or {}
+        counts = {name: parse_metric_display(metrics.get(name), lang) for name in METRIC_NAMES}
+        return cls(snowflake_id(tweet), tweet.get("username", ""), timestamp_to_ms(tweet.get("timestamp")),
+                   tweet.get("text", ""), tweet.get("keyword"),
+                   *(counts[name][0] for name in METRIC_NAMES),
+                   bool(tweet.get("metrics_approximate")) or any(approximate for _, approximate in counts.values()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Bentuk dict seperti hasil scrape_tweets (metrik sebagai integer)
+
+        Metrik yang sudah diubah ke integer tidak lagi terlihat disingkat, jadi flag
+        metrics_approximate ikut disertakan dan dibaca ulang oleh from_dict dan
+        normalize_tweet_metrics.
+        """
+        return {
+            "username": self.username,
+            "timestamp": ms_to_timestamp(self.timestamp_ms),
+            "text": self.text,
+            "tweet_id": str(self.tweet_id) if self.tweet_id is not None else "",
+            "metrics": {name: getattr(self, name) for name in METRIC_NAMES if getattr(self, name) is not None},
+            "metrics_approximate": self.metrics_approximate,
+            "keyword": self.keyword
+        }
+
+    def __repr__(self) -> str:
+        return f"Tweet(tweet_id={self.tweet_id}, username={self.username!r})"
+
+class TweetBatch:
+    """
+    Kontainer kolumnar untuk banyak tweet
+
+    ID, timestamp dan metrik disimpan di array("q") (MISSING_INT untuk nilai kosong),
+    flag metrik perkiraan di bytearray, dan username/keyword sebagai string yang
+    di-intern. Jutaan tweet bisa disimpan untuk dedup dan ekspor tanpa overhead dict
+    per tweet. Exporter dan sink menerima TweetBatch secara langsung.
+    """
+
+    def __init__(self, tweets: Iterable[Any] = (), lang: Optional[str] = None):
+        """
+        Args:
+            tweets: Dict tweet atau objek Tweet awal
+            lang: Bahasa UI asal teks metrik ("en"/"id") untuk dict yang ditambahkan
+        """
+        self.lang = lang
+        self.tweet_ids = array.array("q")
+        self.timestamps = array.array("q")
+        self.metrics = {name: array.array("q") for name in METRIC_NAMES}
+        self.approximate = bytearray()
+        self.usernames = []
+        self.keywords = []
+        self.texts = []
+        self.extend(tweets)
+
+    def append(self, tweet: Any):
+        """Tambahkan satu dict tweet atau Tweet"""
+        if not isinstance(tweet, Tweet):
+            tweet = Tweet.from_dict(tweet, self.lang)
+        self.tweet_ids.append(MISSING_INT if tweet.tweet_id is None else tweet.tweet_id)
+        self.timestamps.append(MISSING_INT if tweet.timestamp_ms is None else tweet.timestamp_ms)
+        for name in METRIC_NAMES:
+            value = getattr(tweet, name)
+            self.metrics[name].append(MISSING_INT if value is None else value)
+        self.approximate.append(tweet.metrics_approximate)
+        self.usernames.append(tweet.username)
+        self.keywords.append(tweet.keyword)
+        self.texts.append(tweet.text)
+
+    def extend(self, tweets: Iterable[Any]):
+        for tweet in tweets:
+            self.append(tweet)
+
+    def __len__(self) -> int:
+        return len(self.tweet_ids)
+
+    def __getitem__(self, index: int) -> Tweet:
+        def value(column):
+            return None if column[index] == MISSING_INT else column[index]
+        return Tweet(value(self.tweet_ids), self.usernames[index], value(self.timestamps), self.texts[index],
+                     self.keywords[index], *(value(self.metrics[name]) for name in METRIC_NAMES),
+                     bool(self.approximate[index]))
+
+    def __iter__(self) -> Iterator[Tweet]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield setiap tweet sebagai dict (satu per satu, tanpa menyalin seluruh batch)"""
+        for tweet in self:
+            yield tweet.to_dict()
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return list(self.iter_dicts())
+
+    def store_rows(self, start: int = 0, stop: Optional[int] = None) -> List[tuple]:
+        """Baris tabel TweetStore untuk tweet[start:stop] yang punya tweet_id"""
+        now = datetime.datetime.now().isoformat()
+        rows = []
+        for index in range(start, len(self) if stop is None else min(stop, len(self))):
+            if self.tweet_ids[index] == MISSING_INT:
+                continue
+            metrics = [None if self.metrics[name][index] == MISSING_INT else self.metrics[name][index]
+                       for name in METRIC_NAMES]
+            rows.append((self.tweet_ids[index], self.usernames[index], ms_to_timestamp(self.timestamps[index]),
+                         self.texts[index], self.keywords[index] or "", *metrics,
+                         self.approximate[index], now, now))
+        return rows
+
+    def arrow_arrays(self, schema) -> list:
+        """Kolom Arrow sesuai tweet_arrow_schema; kolom integer dibaca langsung dari buffer array"""
+        def int_column(values, arrow_type):
+            raw = pa.Array.from_buffers(pa.int64(), len(values), [None, pa.py_buffer(values)])
+            return pc.if_else(pc.equal(raw, MISSING_INT), pa.scalar(None, pa.int64()), raw).cast(arrow_type)
+
+        columns = {
+            "tweet_id": self.tweet_ids,
+            "timestamp": self.timestamps,
+            **self.metrics
+        }
+        arrays = []
+        for field in schema:
+            if field.name in columns:
+                arrays.append(int_column(columns[field.name], field.type))
+            elif field.name == "metrics_approximate":
+                flags = pa.Array.from_buffers(pa.uint8(), len(self), [None, pa.py_buffer(bytes(self.approximate))])
+                arrays.append(pc.not_equal(flags, 0))
+            else:
+                arrays.append(pa.array({"username": self.usernames, "keyword": self.keywords,
+                                        "text": self.texts}[field.name], type=field.type))
+        return arrays
+
+def iter_tweet_dicts(tweets: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Yield dict tweet dari list dict, objek Tweet, atau TweetBatch"""
+    if isinstance(tweets, TweetBatch):
+        yield from tweets.iter_dicts()
+        return
+    for tweet in tweets:
+        yield tweet.to_dict() if isinstance(tweet, Tweet) else tweet
+
+TWEET_STORE_PATH = "tweets.db"
+
+class TweetStore:
+    """
+    Penyimpanan tweet jangka panjang di SQLite dengan upsert berdasarkan tweet_id
+
+    Metrik disimpan sebagai kolom integer, dan ada index pada keyword, timestamp dan
+    username sehingga query lintas run tidak perlu memuat ulang file CSV/JSON.
+    Kolom keyword menyimpan keyword pertama yang menemukan tweet; semua keyword yang
+    pernah menemukannya dicatat di tabel tweet_keywords.
+    """
+
+    def __init__(self, path: str = TWEET_STORE_PATH, batch_size: int = 500, lang: Optional[str] = None):
+        """
+        Args:
+            path: Lokasi file database SQLite
+            batch_size: Jumlah tweet per transaksi saat upsert
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.lang = lang
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        has_links = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tweet_keywords'").fetchone()
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS tweets (
+                tweet_id INTEGER PRIMARY KEY,
+                username TEXT NOT NULL,
+                timestamp TEXT,
+                text TEXT,
+                keyword TEXT,
+                likes INTEGER,
+                retweets INTEGER,
+                replies INTEGER,
+                metrics_approximate INTEGER NOT NULL DEFAULT 0,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tweets_keyword ON tweets (keyword);
+            CREATE INDEX IF NOT EXISTS idx_tweets_timestamp ON tweets (timestamp);
+            CREATE INDEX IF NOT EXISTS idx_tweets_username ON tweets (username);
+            CREATE TABLE IF NOT EXISTS tweet_keywords (
+                tweet_id INTEGER NOT NULL,
+                keyword TEXT NOT NULL,
+                PRIMARY KEY (tweet_id, keyword)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_tweet_keywords_keyword ON tweet_keywords (keyword);
+        """)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(tweets)")}
+        if "metrics_approximate" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE tweets ADD COLUMN metrics_approximate INTEGER NOT NULL DEFAULT 0")
+        if not has_links:
+            # Database lama: keyword yang tersimpan di tweets menjadi link pertama
+            with self.conn:
+                self.conn.execute("INSERT OR IGNORE INTO tweet_keywords (tweet_id, keyword) "
+                                  "SELECT tweet_id, keyword FROM tweets WHERE keyword != ''")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def upsert(self, tweets: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert atau update tweet berdasarkan tweet_id, dalam transaksi per batch_size
+
+        Tweet tanpa tweet_id numerik dilewati. Metrik dan teks diperbarui dengan nilai
+        terbaru; first_seen dan keyword tetap dari pertama kali tweet disimpan, keyword
+        lain ditambahkan ke tweet_keywords.
+
+        Returns:
+            Jumlah tweet yang ditulis
+        """
+        written = 0
+        if isinstance(tweets, TweetBatch):
+            for start in range(0, len(tweets), self.batch_size):
+                written += self.write_batch(tweets.store_rows(start, start + self.batch_size))
+            return written
+        batch = []
+        for tweet in iter_tweet_dicts(tweets):
+            if not str(tweet.get("tweet_id", "")).isdigit():
+                continue
+            batch.append(tweet)
+            if len(batch) >= self.batch_size:
+                written += self.write_batch(self.rows_from_tweets(batch))
+                batch = []
+        if batch:
+            written += self.write_batch(self.rows_from_tweets(batch))
+        return written
+
+    def write_many(self, tweets: Iterable[Dict[str, Any]]):
+        """Alias upsert supaya TweetStore bisa dipakai sebagai sink"""
+        self.upsert(tweets)
+
+    def rows_from_tweets(self, tweets: List[Dict[str, Any]]) -> List[tuple]:
+        """Ubah satu batch tweet menjadi baris tabel, dengan metrik dinormalisasi per kolom"""
+        columns = normalize_tweet_metrics(tweets, self.lang)
+        now = datetime.datetime.now().isoformat()
+        return [
+            (int(tweet["tweet_id"]), tweet.get("username", ""), tweet.get("timestamp", ""),
+             tweet.get("text", ""), tweet.get("keyword", ""),
+             likes, retweets, replies, int(approximate), now, now)
+            for tweet, likes, retweets, replies, approximate in zip(
+                tweets, columns["likes"], columns["retweets"], columns["replies"],
+                columns["metrics_approximate"])
+        ]
+
+    def write_batch(self, rows: List[tuple]) -> int:
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO tweets (tweet_id, username, timestamp, text, keyword,
+                                    likes, retweets, replies, metrics_approximate,
+                                    first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(tweet_id) DO UPDATE SET
+                    username = excluded.username,
+                    timestamp = COALESCE(NULLIF(excluded.timestamp, ''), tweets.timestamp),
+                    text = excluded.text,
+                    keyword = COALESCE(NULLIF(tweets.keyword, ''), excluded.keyword),
+                    likes = COALESCE(excluded.likes, tweets.likes),
+                    retweets = COALESCE(excluded.retweets, tweets.retweets),
+                    replies = COALESCE(excluded.replies, tweets.replies),
+                    metrics_approximate = excluded.metrics_approximate,
+                    last_seen = excluded.last_seen
+            """, rows)
+            self.conn.executemany("INSERT OR IGNORE INTO tweet_keywords (tweet_id, keyword) VALUES (?, ?)",
+                                  [(row[0], row[4]) for row in rows if row[4]])
+        return len(rows)
+
+    def query(self, keyword: Optional[str] = None, username: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ambil tweet dengan filter opsional, terbaru lebih dulu
+
+        Args:
+            keyword: Filter keyword pencarian (semua keyword yang pernah menemukan tweet)
+            username: Filter username
+            since: Timestamp minimal (ISO, inklusif)
+            until: Timestamp maksimal (ISO, eksklusif)
+            limit: Jumlah maksimal baris
+
+        Returns:
+            List baris tweet sebagai dict
+        """
+        clauses, params = [], []
+        if keyword is not None:
+            clauses.append("tweet_id IN (SELECT tweet_id FROM tweet_keywords WHERE keyword = ?)")
+            params.append(keyword)
+        for column, operator, value in (("username", "=", username),
+                                        ("timestamp", ">=", since), ("timestamp", "<", until)):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        sql = "SELECT * FROM tweets"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def count(self, keyword: Optional[str] = None) -> int:
+        if keyword is None:
+            return self.conn.execute("SELECT COUNT(*) FROM tweets").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM tweet_keywords WHERE keyword = ?", (keyword,)).fetchone()[0]
+
+class TweetSink(abc.ABC):
+    """
+    Dasar writer streaming: tweet dikumpulkan di buffer dan di-flush ke disk
+    setiap batch_size tweet, jadi memori tetap datar dan data yang sudah di-flush
+    tetap tersimpan jika proses berhenti di tengah jalan
+    """
+
+    def __init__(self, filename: str, batch_size: int = 50, append: bool = False):
+        """
+        Args:
+            filename: Nama file output
+            batch_size: Jumlah tweet per flush
+            append: Lanjutkan file yang sudah ada alih-alih menimpanya
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.count = 0
+        self.buffer = []
+        self.resumed = append and os.path.exists(filename) and os.path.getsize(filename) > 0
+        self.file = open(filename, 'a' if append else 'w', newline='', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @abc.abstractmethod
+    def format_tweet(self, tweet: Dict[str, Any]) -> Any:
+        """Ubah satu tweet menjadi baris yang ditampung di buffer"""
+
+    @abc.abstractmethod
+    def write_rows(self, rows: List[Any]):
+        """Tulis baris dari buffer ke file"""
+
+    def write(self, tweet: Dict[str, Any]):
+        """Tambahkan satu tweet ke buffer"""
+        self.buffer.append(self.format_tweet(tweet))
+        self.count += 1
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, tweets: Iterable[Any]):
+        """Tambahkan banyak tweet sekaligus (dict, Tweet, atau TweetBatch)"""
+        for tweet in iter_tweet_dicts(tweets):
+            self.write(tweet)
+
+    def flush(self):
+        """Tulis buffer ke disk"""
+        if self.buffer:
+            self.write_rows(self.buffer)
+            self.buffer = []
+        self.file.flush()
+
+    def close(self):
+        """Flush sisa buffer dan tutup file"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+class NDJSONSink(TweetSink):
+    """Writer NDJSON streaming, satu objek JSON per baris"""
+
+    def format_tweet(self, tweet: Dict[str, Any]) -> str:
+        return json.dumps(tweet, ensure_ascii=False)
+
+    def write_rows(self, rows: List[str]):
+        self.file.write("\n".join(rows) + "\n")
+
+class CSVSink(TweetSink):
+    """Writer CSV streaming dengan skema yang dideklarasikan di awal (default CSV_FIELDNAMES)"""
+
+    def __init__(self, filename: str, batch_size: int = 50, append: bool = False,
+                 fieldnames: Optional[List[str]] = None):
+        """
+        Args:
+            filename: Nama file output
+            batch_size: Jumlah tweet per flush
+            append: Lanjutkan file yang sudah ada alih-alih menimpanya
+            fieldnames: Kolom CSV; default CSV_FIELDNAMES
+        """
+        super().__init__(filename, batch_size, append)
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames or CSV_FIELDNAMES, extrasaction='ignore')
+        if not self.resumed:
+            self.writer.writeheader()
+
+    def format_tweet(self, tweet: Dict[str, Any]) -> Dict[str, Any]:
+        return tweet_to_csv_row(tweet)
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        self.writer.writerows(rows)
+
+# Preset resource blocking: tipe resource Playwright yang dibatalkan
+RESOURCE_BLOCK_PRESETS = {
+    "none": [],
+    "text+images": ["media", "font"],
+    "text-only": ["image", "media", "font"]
+}
+# Beacon analytics/telemetry yang tidak dibutuhkan untuk scraping
+TELEMETRY_URL_PATTERNS = [
+    "/i/jot", "/1.1/jot/", "/i/api/1.1/jot/", "/client_event",
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "analytics.twitter.com"
+]
+
+class ResourceBlocker:
+    """
+    Kebijakan blocking resource untuk context.route beserta counter per tipe
+
+    Ukuran transfer dihitung dari header content-length response (tanpa round trip
+    tambahan), jadi untuk response chunked nilainya bisa kurang dari sebenarnya.
+    """
+
+    def __init__(self, preset: str = "text-only", block_telemetry: bool = True):
+        """
+        Args:
+            preset: Nama preset di RESOURCE_BLOCK_PRESETS
+            block_telemetry: Batalkan juga request ke TELEMETRY_URL_PATTERNS
+        """
+        if preset not in RESOURCE_BLOCK_PRESETS:
+            raise ValueError(f"Unknown resource blocking preset: {preset}")
+        self.preset = preset
+        self.blocked_types = set(RESOURCE_BLOCK_PRESETS[preset])
+        self.block_telemetry = block_telemetry and preset != "none"
+        self.allowed = {}
+        self.blocked = {}
+        self.bytes_transferred = {}
+
+    def should_block(self, request) -> bool:
+        """Tentukan apakah request dibatalkan, sekaligus update counter"""
+        resource_type = request.resource_type
+        if resource_type in self.blocked_types or (
+                self.block_telemetry and any(pattern in request.url for pattern in TELEMETRY_URL_PATTERNS)):
+            self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+            return True
+        self.allowed[resource_type] = self.allowed.get(resource_type, 0) + 1
+        return False
+
+    async def handle_route(self, route):
+        """Handler context.route"""
+        if self.should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def handle_response(self, response):
+        """Catat ukuran response per tipe resource (handler context.on("response"))"""
+        resource_type = response.request.resource_type
+        try:
+            size = int(response.headers.get("content-length", 0))
+        except ValueError:
+            size = 0
+        self.bytes_transferred[resource_type] = self.bytes_transferred.get(resource_type, 0) + size
+
+    @property
+    def installs_route(self) -> bool:
+        return bool(self.blocked_types) or self.block_telemetry
+
+    def stats(self) -> Dict[str, Any]:
+        """Ringkasan counter per tipe resource"""
+        return {
+            "preset": self.preset,
+            "allowed": dict(self.allowed),
+            "blocked": dict(self.blocked),
+            "bytes_transferred": dict(self.bytes_transferred),
+            "total_bytes": sum(self.bytes_transferred.values()),
+            "total_blocked": sum(self.blocked.values())
+        }
+
+    def print_summary(self):
+        """Cetak ringkasan transfer dan request yang diblokir"""
+        stats = self.stats()
+        print(f"Resource policy '{self.preset}': {stats['total_blocked']} request diblokir, "
+              f"{stats['total_bytes'] / 1024:.1f} KiB ditransfer")
+        for resource_type in sorted(set(self.allowed) | set(self.blocked)):
+            print(f"  {resource_type:<12} allowed={self.allowed.get(resource_type, 0):<6} "
+                  f"blocked={self.blocked.get(resource_type, 0):<6} "
+                  f"bytes={self.bytes_transferred.get(resource_type, 0)}")
+
+# Scroll lalu tunggu cellInnerDiv/tweet baru lewat MutationObserver, atau sampai timeout
+SCROLL_AND_WAIT_JS = '''({distance, scrollTo, timeout}) => new Promise(resolve => {
+    const root = document.querySelector('[aria-label^="Timeline"]') || document.body;
+    const cellSelector = '[data-testid="cellInnerDiv"], article[data-testid="tweet"]';
+    let timer = null;
+    const observer = new MutationObserver(mutations => {
+        let added = 0;
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                added += node.matches(cellSelector) ? 1 : node.querySelectorAll(cellSelector).length;
+            }
+        }
+        if (added) finish(added);
+    });
+    const finish = added => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(added);
+    };
+    observer.observe(root, {childList: true, subtree: true});
+    timer = setTimeout(() => finish(0), timeout);
+    if (scrollTo !== null) window.scrollTo(0, scrollTo);
+    else window.scrollBy(0, distance);
+})'''
+
+# Replay arsip HAR: tidak ada latency jaringan, jadi scroll cukup menunggu sebentar
+REPLAY_SCROLL_TIMEOUT_MS = 1000
+# Header yang membawa kredensial sesi; dihapus dari arsip HAR setelah rekaman selesai
+HAR_SENSITIVE_HEADERS = ("cookie", "set-cookie", "authorization", "x-csrf-token")
+# Request alur login (berisi username/password) tidak disimpan; replay melewati login
+HAR_LOGIN_MARKERS = ("/i/flow/login", "/onboarding/task.json")
+
+def scrub_har_entries(har: Dict[str, Any]) -> int:
+    """
+    Hapus kredensial dari isi arsip HAR (in place)
+
+    Header HAR_SENSITIVE_HEADERS dan daftar cookie request/response dikosongkan, entri
+    alur login dibuang. Replay tetap jalan karena route_from_har mencocokkan URL, method
+    dan body, bukan cookie.
+
+    Returns:
+        Jumlah entri login yang dibuang
+    """
+    log = har.get("log", {})
+    entries = log.get("entries", [])
+    kept = [entry for entry in entries
+            if not any(marker in entry.get("request", {}).get("url", "") for marker in HAR_LOGIN_MARKERS)]
+    for entry in kept:
+        for message in (entry.get("request", {}), entry.get("response", {})):
+            message["headers"] = [header for header in message.get("headers", [])
+                                  if header.get("name", "").lower() not in HAR_SENSITIVE_HEADERS]
+            message["cookies"] = []
+    log["entries"] = kept
+    return len(entries) - len(kept)
+
+def scrub_har(path: str) -> int:
+    """
+    Hapus kredensial dari file HAR hasil record_har (.har atau .zip)
+
+    Args:
+        path: Arsip HAR; untuk .zip hanya file .har di dalamnya yang ditulis ulang
+
+    Returns:
+        Jumlah entri login yang dibuang
+    """
+    if not zipfile.is_zipfile(path):
+        with open(path, encoding="utf-8") as f:
+            har = json.load(f)
+        dropped = scrub_har_entries(har)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        return dropped
+    scrubbed = path + ".tmp"
+    dropped = 0
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(scrubbed, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = source.read(item)
+            if item.filename.endswith(".har"):
+                har = json.loads(data)
+                dropped = scrub_har_entries(har)
+                data = json.dumps(har).encode("utf-8")
+            target.writestr(item, data)
+    os.replace(scrubbed, path)
+    return dropped
+
+class ScrollPolicy:
+    """
+    Pengaturan scroll berbasis event: jarak scroll, batas tunggu konten baru,
+    dan jitter opsional untuk memberi jeda acak setelah setiap scroll
+    """
+
+    def __init__(self, distance: tuple = (800, 1400), timeout_ms: int = 5000,
+                 jitter: Optional[tuple] = None):
+        """
+        Args:
+            distance: Rentang jarak scroll dalam pixel (min, max)
+            timeout_ms: Batas waktu menunggu cell baru setelah scroll
+            jitter: Rentang jeda tambahan dalam detik (min, max), None untuk tanpa jeda
+        """
+        self.distance = distance
+        self.timeout_ms = timeout_ms
+        self.jitter = jitter
+
+    def scroll_args(self, scroll_to: Optional[int] = None) -> Dict[str, Any]:
+        """Argumen untuk SCROLL_AND_WAIT_JS"""
+        return {
+            "distance": random.randint(*self.distance),
+            "scrollTo": scroll_to,
+            "timeout": self.timeout_ms
+        }
+
+    def pause(self) -> float:
+        """Lama jeda jitter dalam detik (0 jika jitter tidak dipakai)"""
+        return random.uniform(*self.jitter) if self.jitter else 0.0
+
+# Batas bucket histogram per keluarga metrik
+HISTOGRAM_BUCKETS = {
+    "phase_seconds": (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    "tweets_per_scroll": (0, 1, 2, 5, 10, 20, 50, 100)
+}
+METRIC_HELP = {
+    "phase_seconds": "Durasi fase scraping (goto, wait_for_selector, extract, scroll, sleep, ...)",
+    "tweets_per_scroll": "Tweet baru per pass ekstraksi",
+    "playwright_calls": "Jumlah pemanggilan Playwright yang diinstrumentasi",
+    "tweets_extracted": "Tweet baru yang diambil",
+    "records_seen": "Record tweet mentah sebelum dedup",
+    "duplicates": "Record yang dilewati karena sudah pernah diambil",
+    "stalled_scrolls": "Pass tanpa tweet baru",
+    "goto_retries": "Percobaan ulang page.goto",
+    "selector_fallbacks": "Selector yang gagal sebelum selector cadangan dicoba",
+    "extract_errors": "Error saat ekstraksi",
+    "rate_limits": "Job yang dihentikan karena rate limit",
+    "skipped_after_window": "Record lebih baru dari until (menurut snowflake tweet ID) yang dilewati",
+    "window_exhausted": "Job yang berhenti karena timeline sudah melewati since",
+    "jobs": "Job scraping yang selesai"
+}
+
+class ScrapeMetrics:
+    """
+    Histogram durasi per fase dan counter untuk satu scraper
+
+    Nilai bersifat kumulatif selama umur objek (seperti metrik Prometheus) dan bisa
+    diekspor sebagai teks Prometheus atau ringkasan JSON.
+    """
+
+    def __init__(self, prefix: str = "xscrapper"):
+        self.prefix = prefix
+        self.histograms = {}
+        self.counters = {}
+
+    def observe(self, family: str, value: float, label: str = ""):
+        """Catat satu nilai ke histogram family (dengan label fase opsional)"""
+        histogram = self.histograms.get((family, label))
+        if histogram is None:
+            histogram = self.histograms[(family, label)] = {
+                "buckets": [0] * len(HISTOGRAM_BUCKETS[family]), "count": 0, "sum": 0.0, "max": 0.0
+            }
+        for index, bound in enumerate(HISTOGRAM_BUCKETS[family]):
+            if value <= bound:
+                histogram["buckets"][index] += 1
+                break
+        histogram["count"] += 1
+        histogram["sum"] += value
+        histogram["max"] = max(histogram["max"], value)
+
+    def increment(self, name: str, value: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextlib.contextmanager
+    def phase(self, name: str, calls: int = 1):
+        """
+        Ukur durasi blok sebagai fase name
+
+        Args:
+            name: Nama fase
+            calls: Jumlah pemanggilan Playwright di dalam blok (0 untuk sleep)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("phase_seconds", time.perf_counter() - started, name)
+            if calls:
+                self.increment("playwright_calls", calls)
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan JSON: statistik per fase, histogram lain dan counter"""
+        result = {"phases": {}, "histograms": {}, "counters": dict(self.counters)}
+        for (family, label), histogram in sorted(self.histograms.items()):
+            stats = {
+                "count": histogram["count"],
+                "total": round(histogram["sum"], 6),
+                "mean": round(histogram["sum"] / histogram["count"], 6),
+                "max": round(histogram["max"], 6),
+                "buckets": dict(zip(map(str, HISTOGRAM_BUCKETS[family]), histogram["buckets"]))
+            }
+            if family == "phase_seconds":
+                result["phases"][label] = stats
+            else:
+                result["histograms"][family] = stats
+        return result
+
+    def to_prometheus(self) -> str:
+        """Render semua metrik dalam format teks Prometheus"""
+        lines = []
+        families = sorted({family for family, _ in self.histograms})
+        for family in families:
+            name = f"{self.prefix}_{family}"
+            lines.append(f"# HELP {name} {METRIC_HELP[family]}")
+            lines.append(f"# TYPE {name} histogram")
+            for (hist_family, label), histogram in sorted(self.histograms.items()):
+                if hist_family != family:
+                    continue
+                labels = f'phase="{label}",' if label else ""
+                cumulative = 0
+                for bound, count in zip(HISTOGRAM_BUCKETS[family], histogram["buckets"]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {histogram["count"]}')
+                suffix = f"{{{labels.rstrip(',')}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {histogram['sum']:.6f}")
+                lines.append(f"{name}_count{suffix} {histogram['count']}")
+        for counter, value in sorted(self.counters.items()):
+            name = f"{self.prefix}_{counter}_total"
+            lines.append(f"# HELP {name} {METRIC_HELP.get(counter, counter)}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Tulis metrik ke file: .prom/.txt sebagai teks Prometheus, selain itu JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith((".prom", ".txt")):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.summary(), f, indent=2)
+
+    def print_summary(self):
+        """Cetak waktu per fase, urut dari total terbesar"""
+        phases = self.summary()["phases"]
+        if not phases:
+            return
+        print("Waktu per fase:")
+        for name, stats in sorted(phases.items(), key=lambda item: -item[1]["total"]):
+            print(f"  {name:<18} {stats['count']:>5}x  total {stats['total']:>8.2f}s  "
+                  f"rata-rata {stats['mean']:.3f}s  max {stats['max']:.3f}s")
+        print("Counter: " + ", ".join(f"{name}={value:g}" for name, value in sorted(self.counters.items())))
+
+# Level debug capture: off (mati), failure (hanya snapshot saat gagal),
+# trace (snapshot langkah disimpan di ring buffer dan ikut ditulis saat gagal)
+DEBUG_LEVELS = {"off": 0, "failure": 1, "trace": 2}
+DEBUG_DIR = "debug_artifacts"
+
+class DebugCapture:
+    """
+    Snapshot debug (screenshot JPEG viewport dan HTML) dengan ring buffer di memori
+
+    Snapshot langkah di-sampling dan hanya disimpan di memori, dibatasi max_items dan
+    max_bytes. Saat kegagalan terdeteksi, isi buffer beserta snapshot kegagalan ditulis
+    ke folder tersendiri oleh thread background sehingga loop scraping tidak tertahan.
+    """
+
+    def __init__(self, level: str = "failure", directory: str = DEBUG_DIR, sample_rate: float = 1.0,
+                 max_items: int = 20, max_bytes: int = 32 * 1024 * 1024, max_dumps: int = 10):
+        """
+        Args:
+            level: "off", "failure" atau "trace"
+            directory: Folder tujuan dump
+            sample_rate: Peluang snapshot langkah diambil (0..1) pada level trace
+            max_items: Jumlah snapshot maksimal di ring buffer
+            max_bytes: Ukuran total maksimal ring buffer
+            max_dumps: Jumlah dump maksimal per sesi, supaya disk tidak penuh
+        """
+        if level not in DEBUG_LEVELS:
+            raise ValueError(f"Unknown debug level: {level}")
+        self.level = DEBUG_LEVELS[level]
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_dumps = max_dumps
+        self.buffer = collections.deque()
+        self.buffer_bytes = 0
+        self.dumps = 0
+        self.writer = None
+
+    async def snapshot(self, page, name: str, html: bool = False) -> List[tuple]:
+        """Ambil screenshot (dan HTML jika diminta) dari page"""
+        stamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S%f')
+        artifacts = []
+        try:
+            artifacts.append((f"{stamp}_{name}.jpg", await page.screenshot(type="jpeg", quality=60)))
+            if html:
+                artifacts.append((f"{stamp}_{name}.html", (await page.content()).encode("utf-8")))
+        except Exception as e:
+            print(f"Gagal mengambil snapshot debug {name}: {e}")
+        return artifacts
+
+    async def step(self, page, name: str, html: bool = False):
+        """Snapshot langkah normal; hanya masuk ring buffer pada level trace"""
+        if self.level < DEBUG_LEVELS["trace"] or random.random() >= self.sample_rate:
+            return
+        for artifact in await self.snapshot(page, name, html):
+            self.buffer.append(artifact)
+            self.buffer_bytes += len(artifact[1])
+        while self.buffer and (len(self.buffer) > self.max_items or self.buffer_bytes > self.max_bytes):
+            _, data = self.buffer.popleft()
+            self.buffer_bytes -= len(data)
+
+    async def failure(self, page, reason: str):
+        """Snapshot kegagalan lalu tulis isi ring buffer dan snapshot itu di background"""
+        if self.level < DEBUG_LEVELS["failure"] or self.dumps >= self.max_dumps:
+            return
+        self.dumps += 1
+        artifacts = list(self.buffer) + await self.snapshot(page, reason, html=True)
+        self.buffer.clear()
+        self.buffer_bytes = 0
+        folder = os.path.join(self.directory, f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}_{reason}")
+        if self.writer is None:
+            self.writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.writer.submit(self.write_dump, folder, artifacts)
+        print(f"Artefak debug ({len(artifacts)} file) ditulis ke {folder}")
+
+    @staticmethod
+    def write_dump(folder: str, artifacts: List[tuple]):
+        os.makedirs(folder, exist_ok=True)
+        for filename, data in artifacts:
+            with open(os.path.join(folder, filename), "wb") as f:
+                f.write(data)
+
+    def close(self):
+        """Tunggu semua dump selesai ditulis"""
+        if self.writer is not None:
+            self.writer.shutdown(wait=True)
+            self.writer = None
+
+def parse_tweet_timestamp(value: str) -> Optional[datetime.datetime]:
+    """Parse timestamp ISO dari atribut <time> ("2025-01-01T00:03:00.000Z") ke datetime UTC"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+def tweet_arrow_schema(dictionary_encode: bool = True):
+    """
+    Skema Arrow bertipe untuk tweet: id int64, timestamp, metrik integer
+
+    Args:
+        dictionary_encode: Simpan username/keyword sebagai kolom dictionary. File Arrow IPC
+            hanya boleh punya satu dictionary per kolom, jadi ColumnarSink mematikannya untuk "arrow".
+    """
+    if pa is None:
+        raise ImportError("Ekspor Parquet/Arrow membutuhkan pyarrow: pip install pyarrow")
+    dictionary = pa.dictionary(pa.int32(), pa.string()) if dictionary_encode else pa.string()
+    return pa.schema([
+        ("tweet_id", pa.int64()),
+        ("timestamp", pa.timestamp("ms", tz="UTC")),
+        ("username", dictionary),
+        ("keyword", dictionary),
+        ("text", pa.string()),
+        ("likes", pa.int64()),
+        ("retweets", pa.int64()),
+        ("replies", pa.int64()),
+        ("metrics_approximate", pa.bool_())
+    ])
+
+class ColumnarSink:
+    """
+    Writer kolumnar streaming ke Parquet atau Arrow IPC
+
+    Tweet dikumpulkan per kolom dan ditulis sebagai satu row group / record batch
+    setiap row_group_size tweet, sehingga memori tetap datar selama scraping.
+    """
+
+    def __init__(self, filename: str, file_format: Optional[str] = None, row_group_size: int = 10_000,
+                 compression: str = "zstd", lang: Optional[str] = None):
+        """
+        Args:
+            filename: Nama file output
+            file_format: "parquet" atau "arrow"; default dari ekstensi filename
+            row_group_size: Jumlah tweet per row group / record batch
+            compression: Codec kompresi Parquet
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        self.filename = filename
+        self.lang = lang
+        self.file_format = file_format or ("arrow" if filename.endswith((".arrow", ".feather", ".ipc")) else "parquet")
+        if self.file_format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown columnar format: {self.file_format}")
+        self.schema = tweet_arrow_schema(dictionary_encode=self.file_format == "parquet")
+        self.row_group_size = row_group_size
+        self.count = 0
+        self.columns = {field.name: [] for field in self.schema}
+        self.pending = []
+        if self.file_format == "parquet":
+            self.writer = pq.ParquetWriter(filename, self.schema, compression=compression)
+        else:
+            self.writer = pa.ipc.new_file(filename, self.schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, tweet: Dict[str, Any]):
+        """Tambahkan satu tweet ke buffer kolom"""
+        tweet_id = str(tweet.get("tweet_id", ""))
+        self.pending.append(tweet)
+        self.columns["tweet_id"].append(int(tweet_id) if tweet_id.isdigit() else None)
+        self.columns["timestamp"].append(parse_tweet_timestamp(tweet.get("timestamp", "")))
+        self.columns["username"].append(tweet.get("username"))
+        self.columns["keyword"].append(tweet.get("keyword"))
+        self.columns["text"].append(tweet.get("text"))
+        self.count += 1
+        if len(self.columns["tweet_id"]) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, tweets: Iterable[Any]):
+        """Tambahkan banyak tweet sekaligus; TweetBatch ditulis langsung dari kolomnya"""
+        if isinstance(tweets, TweetBatch):
+            self.write_tweet_batch(tweets)
+            return
+        for tweet in iter_tweet_dicts(tweets):
+            self.write(tweet)
+
+    def write_tweet_batch(self, batch: "TweetBatch"):
+        """Tulis TweetBatch per row_group_size tanpa membuat dict per tweet"""
+        self.flush()
+        arrays = batch.arrow_arrays(self.schema)
+        for offset in range(0, len(batch), self.row_group_size):
+            self.writer.write_batch(pa.RecordBatch.from_arrays(
+                [column.slice(offset, self.row_group_size) for column in arrays], schema=self.schema))
+        self.count += len(batch)
+
+    def flush(self):
+        """Tulis buffer sebagai satu row group / record batch"""
+        if not self.columns["tweet_id"]:
+            return
+        self.columns.update(normalize_tweet_metrics(self.pending, self.lang))
+        self.pending = []
+        arrays = [pa.array(self.columns[field.name], type=field.type) for field in self.schema]
+        self.writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.columns = {field.name: [] for field in self.schema}
+
+    def close(self):
+        """Flush sisa buffer dan tutup file"""
+        if self.writer is not None:
+            self.flush()
+            self.writer.close()
+            self.writer = None
+
+class TweetExportMixin:
+    """Method ekspor yang dipakai bersama oleh TwitterScraper dan AsyncTwitterScraper"""
+
+    def export_to_csv(self, tweets_data: List[Dict[str, Any]], filename: str = "tweets.csv"):
+        """
+        Ekspor data tweet ke file CSV
+        
+        Args:
+            tweets_data: List berisi data tweet (dict, Tweet, atau TweetBatch)
+            filename: Nama file CSV
+        """
+        if not tweets_data:
+            print("Tidak ada data untuk diekspor.")
+            return
+            
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            
+            for tweet in iter_tweet_dicts(tweets_data):
+                writer.writerow(tweet_to_csv_row(tweet))
+                
+        print(f"Data berhasil diekspor ke {filename}")
+    
+    def export_to_json(self, tweets_data: List[Dict[str, Any]], filename: str = "tweets.json"):
+        """
+        Ekspor data tweet ke file JSON
+        
+        Args:
+            tweets_data: List berisi data tweet (dict, Tweet, atau TweetBatch)
+            filename: Nama file JSON
+        """
+        if not tweets_data:
+            print("Tidak ada data untuk diekspor.")
+            return
+            
+        with open(filename, 'w', encoding='utf-8') as jsonfile:
+            json.dump(list(iter_tweet_dicts(tweets_data)), jsonfile, ensure_ascii=False, indent=4)
+            
+        print(f"Data berhasil diekspor ke {filename}")
+
+    def export_to_sqlite(self, tweets_data: Iterable[Dict[str, Any]], filename: str = TWEET_STORE_PATH,
+                         lang: Optional[str] = None):
+        """
+        Ekspor (upsert) data tweet ke database SQLite berdasarkan tweet_id
+        
+        Args:
+            tweets_data: List atau iterator berisi data tweet (dict, Tweet), atau TweetBatch
+            filename: Nama file database SQLite
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        with TweetStore(filename, lang=lang) as store:
+            written = store.upsert(tweets_data)
+            
+        print(f"{written} tweet berhasil diekspor ke {filename}")
+
+    def export_to_parquet(self, tweets_data: Iterable[Dict[str, Any]], filename: str = "tweets.parquet",
+                         lang: Optional[str] = None):
+        """
+        Ekspor data tweet ke file Parquet bertipe (butuh pyarrow)
+        
+        Args:
+            tweets_data: List atau iterator berisi data tweet (dict, Tweet), atau TweetBatch
+            filename: Nama file Parquet
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        with ColumnarSink(filename, "parquet", lang=lang) as sink:
+            sink.write_many(tweets_data)
+            
+        print(f"Data berhasil diekspor ke {filename}")
+
+    def export_to_arrow(self, tweets_data: Iterable[Dict[str, Any]], filename: str = "tweets.arrow",
+                         lang: Optional[str] = None):
+        """
+        Ekspor data tweet ke file Arrow IPC bertipe (butuh pyarrow)
+        
+        Args:
+            tweets_data: List atau iterator berisi data tweet (dict, Tweet), atau TweetBatch
+            filename: Nama file Arrow
+            lang: Bahasa UI asal teks metrik ("en"/"id")
+        """
+        with ColumnarSink(filename, "arrow", lang=lang) as sink:
+            sink.write_many(tweets_data)
+            
+        print(f"Data berhasil diekspor ke {filename}")
+
+    def export_to_ndjson(self, tweets_data: Iterable[Dict[str, Any]], filename: str = "tweets.ndjson"):
+        """
+        Ekspor data tweet ke file NDJSON (satu objek JSON per baris)
+        
+        Args:
+            tweets_data: List atau iterator berisi data tweet (dict, Tweet), atau TweetBatch
+            filename: Nama file NDJSON
+        """
+        with NDJSONSink(filename) as sink:
+            sink.write_many(tweets_data)
+            
+        print(f"Data berhasil diekspor ke {filename}")
+
+class TimelineReader:
+    """
+    Sumber record tweet untuk satu page pencarian, sesuai capture_mode scraper
+
+    Mode network menampung response timeline dari page.on("response"), mode html
+    mengirim fragmen ke process pool milik scraper, mode dom membaca DOM langsung.
+    State disimpan per page supaya beberapa pencarian bisa berjalan bersamaan.
+    """
+
+    def __init__(self, scraper: "AsyncTwitterScraper", page, keyword: str):
+        self.scraper = scraper
+        self.page = page
+        self.keyword = keyword
+        self.responses = []
+        self.parses = collections.deque()
+        self.empty_responses = 0
+        if scraper.capture_mode == "network":
+            page.on("response", self.handle_response)
+
+    def handle_response(self, response):
+        """Simpan response timeline JSON untuk diparse di loop scraping"""
+        if response.status == 200 and is_timeline_response_url(response.url):
+            self.responses.append(response)
+
+    @property
+    def parsing(self) -> bool:
+        """True jika masih ada fragmen html yang sedang di-parse"""
+        return bool(self.parses)
+
+    async def collect(self) -> List[Dict[str, Any]]:
+        """Ambil record tweet sesuai capture_mode"""
+        metrics = self.scraper.metrics
+        if self.scraper.capture_mode == "network":
+            with metrics.phase("extract", calls=len(self.responses)):
+                return await self.drain_responses()
+        if self.scraper.capture_mode == "html":
+            return await self.capture_html()
+        with metrics.phase("extract"):
+            return await self.page.evaluate(EXTRACT_TWEETS_JS, EXTRACT_TWEETS_CONFIG) or []
+
+    async def drain_responses(self) -> List[Dict[str, Any]]:
+        """
+        Parse semua response timeline yang tertangkap sejak pemanggilan terakhir
+
+        Returns:
+            List berisi record tweet dari payload JSON
+        """
+        responses, self.responses = self.responses, []
+        records = []
+        for response in responses:
+            try:
+                payload = await response.json()
+                tweets = parse_timeline_payload(payload)
+                self.empty_responses = self.scraper.rate_limit.check_payload(
+                    payload, len(tweets), self.empty_responses)
+                records.extend(tweets)
+            except Exception as e:
+                print(f"Gagal membaca response timeline {response.url}: {e}")
+        return records
+
+    async def capture_html(self) -> List[Dict[str, Any]]:
+        """
+        Salin fragmen HTML tweet baru lalu ambil hasil parse yang sudah selesai
+
+        Fragmen dikirim ke process pool dan di-parse selama loop scroll berjalan. Hasil
+        dikembalikan sesuai urutan capture; loop hanya menunggu parser jika tidak ada
+        fragmen baru di halaman atau antrian parse sudah penuh.
+        """
+        scraper = self.scraper
+        with scraper.metrics.phase("extract"):
+            fragments = await self.page.evaluate(CAPTURE_TWEET_HTML_JS, EXTRACT_TWEETS_CONFIG) or []
+        if fragments:
+            scraper.save_captures(self.keyword, fragments)
+            self.parses.append(scraper.parser_pool().submit(parse_tweet_fragments, fragments))
+        backlog_limit = 2 * (scraper.parse_workers or os.cpu_count() or 1)
+        if self.parses and not self.parses[0].done() and (not fragments or len(self.parses) > backlog_limit):
+            with scraper.metrics.phase("parse_wait"):
+                await asyncio.wait([asyncio.wrap_future(self.parses[0])])
+        records = []
+        while self.parses and self.parses[0].done():
+            records.extend(self.parses.popleft().result())
+        return records
+
+    def close(self):
+        """Batalkan parse yang belum selesai"""
+        for future in self.parses:
+            future.cancel()
+        self.parses.clear()
+
+class AsyncTwitterScraper(TweetExportMixin):
+    """
+    Engine scraping berbasis asyncio: satu browser, satu context terautentikasi,
+    dan beberapa page yang menjalankan pencarian secara bersamaan
+
+    Semua fitur scraping (checkpoint, incremental, capture mode, metrik, debug capture,
+    rekam/replay HAR) ada di sini; TwitterScraper hanya menjalankan engine ini dari kode sync.
+    """
+
+    def __init__(self, headless: bool = True, capture_mode: str = "dom",
+                 base_url: str = "https://twitter.com", concurrency: int = 4,
+                 block_resources: str = "none", scroll_policy: Optional[ScrollPolicy] = None,
+                 state_path: str = AUTH_STATE_PATH, metrics_path: Optional[str] = None,
+                 debug_level: str = "failure", debug_capture: Optional[DebugCapture] = None,
+                 typing_delay_ms: int = LOGIN_TYPING_DELAY_MS,
+                 parse_workers: Optional[int] = None, capture_path: Optional[str] = None,
+                 record_har: Optional[str] = None, replay_har: Optional[str] = None):
+        """
+        Inisialisasi Async Twitter Scraper
+
+        Args:
+            headless: Menjalankan browser dalam mode headless jika True
+            capture_mode: "dom" untuk membaca tweet dari halaman, "network" untuk membaca
+                          JSON timeline yang diunduh halaman, "html" untuk menyalin fragmen
+                          HTML tweet dan mem-parse-nya di process pool
+            base_url: Origin situs (bisa diarahkan ke fixture server lokal)
+            concurrency: Jumlah maksimal page yang scraping bersamaan
+            block_resources: Preset resource blocking ("none", "text+images", "text-only")
+            scroll_policy: Pengaturan scroll berbasis event (default: ScrollPolicy())
+            state_path: File storage state sesi (satu file per akun)
+            metrics_path: File metrik yang ditulis ulang di akhir setiap job
+                          (.prom untuk teks Prometheus, selain itu JSON)
+            debug_level: Level snapshot debug ("off", "failure", "trace")
+            debug_capture: DebugCapture dengan pengaturan sendiri (menggantikan debug_level)
+            typing_delay_ms: Jeda antar karakter saat mengetik di form login (0 = langsung diisi)
+            parse_workers: Jumlah proses parser untuk mode "html" (default: jumlah CPU)
+            capture_path: File NDJSON untuk menyimpan fragmen mode "html" (lihat parse_captures)
+            record_har: Rekam seluruh traffic sesi ke arsip HAR (.har, atau .zip yang lebih ringkas).
+                        Saat ditutup, header cookie/authorization dan request login dihapus
+                        (scrub_har), tapi isi response tetap data akun: perlakukan arsip
+                        sebagai kredensial dan jangan dibagikan
+            replay_har: Jalankan sesi dari arsip HAR lewat context.route tanpa akses jaringan;
+                        jeda dan jitter dimatikan supaya replay secepat ekstraktor
+        """
+        if record_har and replay_har:
+            raise ValueError("record_har dan replay_har tidak bisa dipakai bersamaan")
+        if capture_mode not in ("dom", "network", "html"):
+            raise ValueError(f"Unknown capture mode: {capture_mode}")
+        if concurrency < 1:
+            raise ValueError("concurrency harus minimal 1")
+        self.headless = headless
+        self.capture_mode = capture_mode
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.resource_blocker = ResourceBlocker(block_resources)
+        self.scroll_policy = scroll_policy or ScrollPolicy()
+        self.session = SessionManager(state_path, base_url=self.base_url)
+        self.rate_limit = RateLimitMonitor()
+        self.metrics = ScrapeMetrics()
+        self.metrics_path = metrics_path
+        self.debug = debug_capture or DebugCapture(debug_level)
+        self.typing_delay_ms = typing_delay_ms
+        self.parse_workers = parse_workers
+        self.parse_pool = None
+        self.capture_path = capture_path
+        self.capture_file = None
+        self.record_har = record_har
+        self.replay_har = replay_har
+        if replay_har:
+            self.scroll_policy = ScrollPolicy(self.scroll_policy.distance,
+                                              min(self.scroll_policy.timeout_ms, REPLAY_SCROLL_TIMEOUT_MS))
+            self.typing_delay_ms = 0
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        """Memulai browser dan membuat satu context yang dipakai semua page."""
+        print("Memulai browser...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=BROWSER_ARGS
+        )
+        state_path = self.session.storage_state_path()
+        context_options = {"viewport": VIEWPORT, "user_agent": USER_AGENT}
+        if self.record_har or self.replay_har:
+            # Request dari service worker tidak lewat context.route dan tidak terekam di HAR
+            context_options["service_workers"] = "block"
+        if self.record_har:
+            context_options.update(record_har_path=self.record_har, record_har_mode="minimal")
+        try:
+            self.context = await self.browser.new_context(storage_state=state_path, **context_options)
+            if state_path:
+                print(f"Loaded browser state from {state_path}")
+        except Exception as e:
+            print(f"Failed to load browser state: {e}")
+            self.context = await self.browser.new_context(**context_options)
+        await self.context.add_init_script(STEALTH_INIT_SCRIPT)
+        await self.context.set_extra_http_headers(EXTRA_HTTP_HEADERS)
+        if self.replay_har:
+            # Request yang tidak ada di arsip dibatalkan, jadi replay tidak pernah menyentuh jaringan
+            await self.context.route_from_har(self.replay_har, not_found="abort")
+            self.session.valid = True
+            print(f"Mode replay dari {self.replay_har}")
+        elif self.resource_blocker.installs_route:
+            await self.context.route("**/*", self.resource_blocker.handle_route)
+        if self.record_har:
+            print(f"Merekam traffic sesi ke {self.record_har}")
+        self.context.on("response", self.resource_blocker.handle_response)
+        self.context.on("response", self.rate_limit.handle_response)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        print("Browser berhasil dimulai.")
+
+    async def close(self):
+        """Menutup browser dan playwright."""
+        # Ringkasan hanya berarti jika route pemblokir terpasang (preset selain "none", bukan replay)
+        if self.context and self.resource_blocker.installs_route and not self.replay_har:
+            self.resource_blocker.print_summary()
+        self.debug.close()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(cancel_futures=True)
+            self.parse_pool = None
+        if self.capture_file is not None:
+            self.capture_file.close()
+            self.capture_file = None
+        if self.context:
+            # Arsip HAR baru ditulis saat context ditutup
+            await self.context.close()
+            self.context = None
+            if self.record_har and os.path.exists(self.record_har):
+                dropped = scrub_har(self.record_har)
+                print(f"Cookie dan header auth dihapus dari {self.record_har} ({dropped} request login dibuang)")
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def debug_screenshot(self, page, name="debug", failure: bool = False):
+        """Snapshot debug: langkah normal masuk ring buffer, kegagalan memicu dump ke disk"""
+        if failure:
+            await self.debug.failure(page, name)
+        else:
+            await self.debug.step(page, name)
+
+    async def idle(self, seconds: float):
+        """Jeda di loop scraping; dilewati saat replay arsip HAR"""
+        if not self.replay_har:
+            with self.metrics.phase("sleep", calls=0):
+                await asyncio.sleep(seconds)
+
+    async def wait_for_login_state(self, page, exclude: Iterable[str] = (),
+                                   timeout: int = LOGIN_STEP_TIMEOUT) -> Optional[str]:
+        """
+        Tunggu sampai salah satu state login muncul, dalam satu wait_for_function
+
+        Args:
+            page: Page form login
+            exclude: State yang diabaikan (state yang baru saja diisi dan belum berganti)
+            timeout: Batas waktu dalam milidetik
+
+        Returns:
+            Nama state dari LOGIN_STATES, atau None jika timeout
+        """
+        try:
+            with self.metrics.phase("wait_for_selector"):
+                handle = await page.wait_for_function(
+                    LOGIN_STATE_JS, arg={"states": LOGIN_STATES, "exclude": list(exclude)}, timeout=timeout)
+            return await handle.json_value()
+        except TimeoutError:
+            return None
+
+    async def fill_login_field(self, page, state: str, value: str):
+        """Isi field milik state dengan satu panggilan ketik, lalu kirim dengan Enter"""
+        field = page.locator(", ".join(LOGIN_STATES[state]["selectors"])).first
+        if self.typing_delay_ms:
+            await field.press_sequentially(value, delay=self.typing_delay_ms)
+        else:
+            await field.fill(value)
+        await field.press("Enter")
+
+    async def login_flow(self, page, username: str, password: str) -> bool:
+        """
+        Jalankan alur login sebagai state machine: username -> verifikasi (opsional) -> password -> home
+
+        Setiap transisi menunggu state berikutnya (atau error) muncul, tanpa jeda tetap.
+        Jika Enter tidak memajukan form, tombol lanjut/masuk diklik sekali lewat JavaScript.
+
+        Args:
+            page: Page untuk form login
+            username: Username atau email Twitter
+            password: Password Twitter
+
+        Returns:
+            True jika login berhasil, False jika gagal
+        """
+        print("Mencoba login ke Twitter...")
+        try:
+            await self.context.clear_cookies()
+            await page.goto(f"{self.base_url}/i/flow/login", wait_until="domcontentloaded", timeout=30000)
+            state = await self.wait_for_login_state(page)
+            filled = set()
+            while state in ("username", "verification", "password"):
+                print(f"Login: langkah {state}")
+                if state in filled:
+                    print(f"Form {state} tidak berubah, gagal login.")
+                    break
+                filled.add(state)
+                await self.fill_login_field(page, state, password if state == "password" else username)
+                await self.debug_screenshot(page, f"login_{state}")
+                next_state = await self.wait_for_login_state(page, exclude=[state])
+                if next_state is None and await page.evaluate(LOGIN_CLICK_JS, LOGIN_BUTTON_TEXTS[state]):
+                    next_state = await self.wait_for_login_state(page, exclude=[state])
+                state = next_state
+            if state == "home":
+                await self.context.storage_state(path=self.session.state_path)
+                print(f"Login berhasil. State browser disimpan ke {self.session.state_path}")
+                return True
+            if state == "error":
+                print("Login ditolak Twitter (password salah atau verifikasi tambahan diperlukan).")
+            elif state is None:
+                print("Login timeout: tidak ada langkah login yang dikenali.")
+            await self.debug_screenshot(page, f"login_failed_{state or 'timeout'}", failure=True)
+            return False
+        except Exception as e:
+            print(f"Error during login process: {e}")
+            await self.debug_screenshot(page, "login_error", failure=True)
+            return False
+
+    async def login(self, username: str, password: str) -> bool:
+        """
+        Login ke Twitter menggunakan username dan password
+
+        Alur login dilewati jika storage state tersimpan masih valid (lihat SessionManager).
+
+        Args:
+            username: Username Twitter
+            password: Password Twitter
+
+        Returns:
+            True jika login berhasil, False jika gagal
+        """
+        if self.replay_har:
+            print("Mode replay: login dilewati.")
+            return True
+        with self.metrics.phase("session_check"):
+            session_valid = await self.session.validate(self.context)
+        if session_valid:
+            print("Sesi tersimpan masih valid, login dilewati.")
+            return True
+        page = await self.context.new_page()
+        try:
+            with self.metrics.phase("login", calls=0):
+                login_result = await self.login_flow(page, username, password)
+        finally:
+            await page.close()
+        if login_result:
+            self.session.mark_valid()
+        return login_result
+
+    async def check_login_status(self, page=None) -> bool:
+        """
+        Cek apakah user sudah login
+
+        Menunggu indikator home atau tombol login muncul (mana yang lebih dulu), tanpa jeda tetap.
+
+        Args:
+            page: Page yang dipakai untuk cek; None untuk membuka page sementara
+        """
+        if page is None:
+            page = await self.context.new_page()
+            try:
+                return await self.check_login_status(page)
+            finally:
+                await page.close()
+        try:
+            if not page.url.startswith(self.base_url):
+                await page.goto(f"{self.base_url}/home", wait_until="domcontentloaded", timeout=15000)
+            with self.metrics.phase("wait_for_selector"):
+                await page.wait_for_selector(", ".join(HOME_INDICATOR_SELECTORS + LOGIN_INDICATOR_SELECTORS),
+                                             timeout=LOGIN_STEP_TIMEOUT)
+            for indicator in HOME_INDICATOR_SELECTORS:
+                if await page.query_selector(indicator):
+                    # Cukup sekali per sesi; page pencarian berikutnya tidak perlu membuka /home lagi
+                    self.session.valid = True
+                    return True
+            return False
+        except TimeoutError:
+            return False
+        except Exception as e:
+            print(f"Error checking login status: {e}")
+            return False
+
+    async def scroll_and_wait(self, page, scroll_to: Optional[int] = None) -> int:
+        """
+        Scroll dan tunggu sampai cell timeline baru muncul atau timeout scroll_policy
+
+        Args:
+            page: Page pencarian
+            scroll_to: Posisi absolut tujuan; None untuk scroll relatif sesuai policy
+
+        Returns:
+            Jumlah cell baru yang muncul (0 jika timeout)
+        """
+        with self.metrics.phase("scroll"):
+            added = await page.evaluate(SCROLL_AND_WAIT_JS, self.scroll_policy.scroll_args(scroll_to))
+        pause = self.scroll_policy.pause()
+        if pause:
+            with self.metrics.phase("sleep", calls=0):
+                await asyncio.sleep(pause)
+        return added or 0
+
+    async def force_reload_tweets(self, page):
+        """Force reload tweets if we're not getting new ones"""
+        try:
+            await self.scroll_and_wait(page, scroll_to=0)
+            await self.scroll_and_wait(page, scroll_to=2000)
+
+            print("Forced tweet reload")
+            return True
+        except Exception:
+            return False
+
+    def parser_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Process pool parser mode html, dibuat saat pertama dipakai dan dipakai semua page"""
+        if self.parse_pool is None:
+            self.parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.parse_pool
+
+    def save_captures(self, keyword: str, fragments: List[str]):
+        """Tambahkan fragmen html ke capture_path jika diatur"""
+        if not self.capture_path:
+            return
+        if self.capture_file is None:
+            self.capture_file = open(self.capture_path, "a", encoding="utf-8")
+        self.capture_file.writelines(
+            json.dumps({"keyword": keyword, "html": fragment}, ensure_ascii=False) + "\n"
+            for fragment in fragments)
+        self.capture_file.flush()
+
+    async def open_search(self, page, search_url: str, max_retries: int = 3) -> bool:
+        """Buka halaman pencarian, dicoba ulang sampai max_retries kali"""
+        for retry_count in range(1, max_retries + 1):
+            try:
+                with self.metrics.phase("goto"):
+                    await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
+                return True
+            except Exception as e:
+                self.metrics.increment("goto_retries")
+                print(f"Gagal memuat halaman, mencoba lagi ({retry_count}/{max_retries}): {e}")
+                if retry_count < max_retries:
+                    await self.idle(2)
+        print("Gagal memuat halaman setelah beberapa percobaan.")
+        await self.debug_screenshot(page, "failed_search_page", failure=True)
+        return False
+
+    async def wait_for_tweet_elements(self, page) -> bool:
+        """Tunggu sampai elemen tweet muncul di halaman hasil pencarian"""
+        print("Menunggu tweet dimuat...")
+        for selector in TWEET_LOAD_SELECTORS:
+            try:
+                with self.metrics.phase("wait_for_selector"):
+                    await page.wait_for_selector(selector, timeout=15000)
+                print(f"Tweet ditemukan dengan selector: {selector}")
+                return True
+            except Exception:
+                self.metrics.increment("selector_fallbacks")
+
+        if await self.has_empty_state(page):
+            print("Tidak ada hasil untuk pencarian ini.")
+            return False
+        await self.debug_screenshot(page, "no_tweets_found", failure=True)
+        print("Tidak dapat menemukan tweet dengan selectors yang ada.")
+        if await page.query_selector('div[data-testid="loginButton"]'):
+            print("Terdeteksi layar login. Session tidak valid.")
+        return False
+
+    async def has_empty_state(self, page) -> bool:
+        """True jika halaman menampilkan "tidak ada hasil" untuk pencarian ini"""
+        try:
+            return bool(await page.query_selector('div[data-testid="emptyState"]'))
+        except Exception:
+            return False
+
+    async def wait_for_timeline_response(self, page, reader: TimelineReader, timeout: int = 15000) -> bool:
+        """Tunggu response timeline JSON pertama dalam mode network"""
+        if reader.responses:
+            return True
+        try:
+            print("Menunggu response timeline...")
+            with self.metrics.phase("wait_for_response"):
+                await page.wait_for_event(
+                    "response",
+                    predicate=lambda response: is_timeline_response_url(response.url),
+                    timeout=timeout
+                )
+            return True
+        except TimeoutError:
+            await self.debug_screenshot(page, "no_timeline_response", failure=True)
+            print("Tidak ada response timeline yang tertangkap.")
+            print("Kemungkinan sesi login tidak valid atau rate limited.")
+            return False
+
+    async def detect_rate_limit(self, page) -> bool:
+        """Cek sinyal rate limit dari response, lalu banner error di halaman"""
+        # Saat replay, banner error muncul karena arsip habis (request dibatalkan), bukan rate limit
+        if not self.rate_limit.limited and not self.replay_har:
+            try:
+                self.rate_limit.check_banner(await page.evaluate(RATE_LIMIT_BANNER_JS, RATE_LIMIT_BANNER_TEXTS))
+            except Exception:
+                pass
+        return self.rate_limit.limited
+
+    def finish_job_metrics(self):
+        """Cetak ringkasan metrik di akhir job dan tulis ke metrics_path jika diatur"""
+        self.metrics.increment("jobs")
+        self.metrics.print_summary()
+        if self.metrics_path:
+            self.metrics.write(self.metrics_path)
+            print(f"Metrik disimpan ke {self.metrics_path}")
+
+    async def scrape_tweets(self, keyword: str, max_tweets: int = 100, lang: Optional[str] = None,
+                            start_date: Optional[str] = None, end_date: Optional[str] = None,
+                            seen_index: Optional[SeenIndex] = None,
+                            checkpoint: Optional[CheckpointStore] = None,
+                            incremental: bool = False,
+                            max_scrolls: Optional[int] = None,
+                            on_tweets: Optional[Callable] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape tweets berdasarkan kata kunci dan filter, di page tersendiri
+
+        Args:
+            keyword: Kata kunci untuk pencarian
+            max_tweets: Jumlah tweet maksimal yang akan diambil
+            lang: Kode bahasa (en, id, dll)
+            start_date: Tanggal mulai format YYYY-MM-DD
+            end_date: Tanggal akhir format YYYY-MM-DD
+            seen_index: Index dedup yang dipakai bersama antar pencarian (default: SeenIndex baru)
+            checkpoint: Checkpoint store untuk melanjutkan job yang terputus
+            incremental: Hanya ambil tweet yang lebih baru dari poll sebelumnya (butuh checkpoint)
+            max_scrolls: Batas jumlah scroll (kedalaman) untuk pencarian ini
+            on_tweets: Coroutine function yang dipanggil dengan setiap batch tweet baru
+
+        Returns:
+            List berisi data tweet (saat resume, hanya tweet yang baru diambil)
+
+        Raises:
+            ScrapeFailedError: Jika pencarian gagal; membawa tweet yang sudah diambil
+            RateLimitedError: Jika pencarian dihentikan karena rate limit
+        """
+        tweets_data = []
+        try:
+            async with contextlib.aclosing(self.scrape_batches(
+                    keyword, max_tweets, lang, start_date, end_date, seen_index,
+                    checkpoint, incremental, max_scrolls)) as batches:
+                async for batch in batches:
+                    tweets_data.extend(batch)
+                    if on_tweets is not None:
+                        await on_tweets(batch)
+        except ScrapeFailedError as e:
+            e.tweets = tweets_data
+            raise
+        return tweets_data
+
+    async def scrape_tweets_iter(self, keyword: str, max_tweets: int = 100, lang: Optional[str] = None,
+                                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                                 seen_index: Optional[SeenIndex] = None,
+                                 checkpoint: Optional[CheckpointStore] = None,
+                                 incremental: bool = False,
+                                 max_scrolls: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Versi streaming dari scrape_tweets: setiap tweet di-yield begitu diekstrak
+
+        Args:
+            Sama seperti scrape_tweets
+
+        Yields:
+            Data tweet satu per satu
+        """
+        async with contextlib.aclosing(self.scrape_batches(
+                keyword, max_tweets, lang, start_date, end_date, seen_index,
+                checkpoint, incremental, max_scrolls)) as batches:
+            async for batch in batches:
+                for tweet in batch:
+                    yield tweet
+
+    async def scrape_batches(self, keyword: str, max_tweets: int = 100, lang: Optional[str] = None,
+                             start_date: Optional[str] = None, end_date: Optional[str] = None,
+                             seen_index: Optional[SeenIndex] = None,
+                             checkpoint: Optional[CheckpointStore] = None,
+                             incremental: bool = False,
+                             max_scrolls: Optional[int] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Loop scraping satu pencarian: buka page sendiri, yield setiap batch tweet baru
+
+        Dibatasi oleh semaphore concurrency. Dengan checkpoint, setiap batch disimpan
+        sebelum di-yield. Job yang terputus dilanjutkan dari tweet tertua yang sudah
+        dicapai (operator max_id:) dan tweet yang sudah tersimpan tidak di-yield ulang.
+
+        Dengan incremental, checkpoint hanya menyimpan high-water mark per query.
+        Hasil f=live urut dari yang terbaru, jadi scroll berhenti begitu tweet yang
+        sudah diambil poll sebelumnya tercapai; mark dimajukan jika poll tidak gagal.
+        Poll yang terpotong max_tweets sebelum mencapai mark menyimpan resume cursor
+        dan poll berikutnya mengisi celah itu dulu sebelum mark dimajukan.
+
+        Args:
+            Sama seperti scrape_tweets
+
+        Yields:
+            List tweet baru per pass ekstraksi
+
+        Raises:
+            ScrapeFailedError: Jika belum login, halaman tidak terbuka atau tweet tidak dimuat
+            RateLimitedError: Jika pencarian dihentikan karena rate limit
+        """
+        seen = seen_index if seen_index is not None else SeenIndex()
+        collected = 0
+        max_id = None
+        job_id = None
+        watermark = None
+        newest = None
+        oldest_id = None
+        if incremental:
+            if checkpoint is None:
+                raise ValueError("Mode incremental membutuhkan checkpoint")
+            watermark = checkpoint.get_watermark(keyword, lang, start_date, end_date)
+            if watermark:
+                print(f"Mode incremental: berhenti di tweet {watermark['newest_id'] or watermark['newest_timestamp']}")
+                if watermark["resume_max_id"] is not None:
+                    max_id = str(watermark["resume_max_id"])
+                    newest = {"newest_id": watermark["pending_id"], "newest_timestamp": watermark["pending_timestamp"]}
+                    print(f"Mengisi celah poll sebelumnya, mulai dari max_id:{max_id}")
+        elif checkpoint:
+            job = checkpoint.open_job(keyword, lang, start_date, end_date)
+            job_id = job["job_id"]
+            if job["status"] == "done":
+                print(f"Job {job_id} sudah selesai, dilewati.")
+                return
+            for key in checkpoint.seen_keys(job_id):
+                seen.add(key)
+            collected = job["collected"]
+            if job["oldest_id"]:
+                max_id = str(job["oldest_id"] - 1)
+                print(f"Melanjutkan job {job_id}: {collected} tweet tersimpan, mulai dari max_id:{max_id}")
+            if collected >= max_tweets:
+                checkpoint.mark_done(job_id)
+                return
+
+        async with self.semaphore:
+            page = await self.context.new_page()
+            reader = TimelineReader(self, page, keyword)
+            self.rate_limit.start_job()
+            try:
+                # Cek sesi lewat request hanya petunjuk; pencarian pertama memastikan di halaman
+                if not self.session.valid and not await self.check_login_status(page):
+                    print("User not logged in. Cannot scrape tweets.")
+                    self.session.invalidate()
+                    raise ScrapeFailedError("belum login")
+
+                search_url = build_search_url(self.base_url, keyword, lang, start_date, end_date, max_id)
+                print(f"[{keyword}] Membuka URL pencarian: {search_url}")
+                if not await self.open_search(page, search_url):
+                    self.finish_job_metrics()
+                    raise ScrapeFailedError("halaman pencarian gagal dimuat")
+
+                print(f"Mencari tweet dengan kata kunci: {keyword}")
+                if lang:
+                    print(f"Bahasa: {lang}")
+                if start_date and end_date:
+                    print(f"Periode: {start_date} sampai {end_date}")
+                if self.capture_mode == "network":
+                    loaded = await self.wait_for_timeline_response(page, reader)
+                else:
+                    loaded = await self.wait_for_tweet_elements(page)
+                if not loaded:
+                    self.finish_job_metrics()
+                    if await self.has_empty_state(page):
+                        if checkpoint and not incremental:
+                            checkpoint.mark_done(job_id)
+                        return
+                    raise ScrapeFailedError("tweet tidak dimuat")
+
+                print(f"[{keyword}] Mulai mengumpulkan {max_tweets} tweet...")
+                no_new_tweets_count = 0
+                max_stalled_scrolls = 15
+                attempts = 0
+                scrolls = 0
+                failure = None
+                rate_limited = False
+                reached_mark = False
+                first_batch = True
+                # Hasil f=live urut dari terbaru: tweet di bawah lower berarti timeline sudah lewat rentang
+                lower, upper = snowflake_window(start_date, end_date)
+                out_of_window = False
+
+                while collected < max_tweets and no_new_tweets_count < max_stalled_scrolls:
+                    attempts += 1
+                    try:
+                        tweet_records = await reader.collect()
+                    except Exception as e:
+                        print(f"Error saat mengekstrak data tweet: {e}")
+                        self.metrics.increment("extract_errors")
+                        tweet_records = []
+                    self.metrics.increment("records_seen", len(tweet_records))
+                    # Mode network dan html hanya mengembalikan record baru, jadi setelah batch pertama
+                    # hasil kosong berarti halaman berikutnya belum dimuat dan dihitung sebagai scroll macet
+                    if not tweet_records and not reader.parsing and (self.capture_mode == "dom" or first_batch):
+                        print("Tidak ada tweet yang ditemukan dengan selectors yang tersedia.")
+                        if attempts > 3:  # Only take screenshot after a few attempts
+                            if not collected and await self.has_empty_state(page):
+                                print("Tidak ada hasil untuk pencarian ini.")
+                                break
+                            await self.debug_screenshot(page, "no_tweets_found_while_scrolling", failure=True)
+                            failure = "tidak ada tweet yang bisa diekstrak"
+                            break
+                        else:
+                            await self.idle(2)
+                            continue
+                    if tweet_records:
+                        first_batch = False
+                    new_records = []
+                    for record in tweet_records:
+                        if collected >= max_tweets:
+                            break
+                        if not record["text"] or record["username"] == "Unknown":
+                            continue
+                        if reached_watermark(record, watermark):
+                            reached_mark = True
+                            break
+                        tweet_id = snowflake_id(record)
+                        if tweet_id is not None and lower is not None and tweet_id < lower:
+                            out_of_window = True
+                            break
+                        if tweet_id is not None and upper is not None and tweet_id >= upper:
+                            self.metrics.increment("skipped_after_window")
+                            continue
+                        # Node timeline di-recycle saat scroll, jadi progres dihitung dari id baru
+                        if not seen.add(tweet_key(record)):
+                            self.metrics.increment("duplicates")
+                            continue
+                        record["keyword"] = keyword
+                        collected += 1
+                        new_records.append(record)
+                        if tweet_id is not None and (oldest_id is None or tweet_id < oldest_id):
+                            oldest_id = tweet_id
+
+                        print(f"[{keyword}] Tweet {collected}/{max_tweets} diambil dari @{record['username']}")
+                    if incremental:
+                        newest = newest_position(new_records, newest)
+                    elif checkpoint:
+                        checkpoint.record_tweets(job_id, new_records)
+                    self.metrics.observe("tweets_per_scroll", len(new_records))
+                    self.metrics.increment("tweets_extracted", len(new_records))
+                    if new_records:
+                        yield new_records
+                    if reached_mark:
+                        print(f"[{keyword}] High-water mark tercapai setelah {collected} tweet baru.")
+                        break
+                    if out_of_window:
+                        print(f"[{keyword}] Timeline sudah melewati {start_date}, berhenti setelah {collected} tweet.")
+                        self.metrics.increment("window_exhausted")
+                        break
+                    new_tweets = len(new_records)
+                    # Dalam mode html, batch kosong selagi parser masih bekerja bukan tanda macet
+                    if new_tweets == 0 and not reader.parsing:
+                        no_new_tweets_count += 1
+                        self.metrics.increment("stalled_scrolls")
+                        if await self.detect_rate_limit(page):
+                            print(f"[{keyword}] Rate limit terdeteksi ({self.rate_limit.reason}), berhenti. "
+                                  f"Coba lagi dalam {self.rate_limit.remaining():.0f} detik.")
+                            self.metrics.increment("rate_limits")
+                            failure = "rate limit"
+                            rate_limited = True
+                            break
+                        if no_new_tweets_count % 5 == 0:
+                            with self.metrics.phase("force_reload", calls=0):
+                                await self.force_reload_tweets(page)
+                    elif new_tweets:
+                        no_new_tweets_count = 0
+
+                    if collected >= max_tweets or (max_scrolls is not None and scrolls >= max_scrolls):
+                        break
+                    scrolls += 1
+                    await self.scroll_and_wait(page)
+
+                if incremental and not failure:
+                    has_mark = watermark and (watermark["newest_id"] is not None or watermark["newest_timestamp"])
+                    cut_off = has_mark and not reached_mark and not out_of_window and collected >= max_tweets
+                    if cut_off and oldest_id is not None and watermark["newest_id"] is not None:
+                        # Tweet tertua tepat di atas mark: tidak ada celah tersisa
+                        cut_off = oldest_id - 1 > watermark["newest_id"]
+                    if cut_off and oldest_id is not None:
+                        # Celah antara tweet tertua poll ini dan mark diisi dulu oleh poll berikutnya
+                        checkpoint.suspend_watermark(keyword, lang, start_date, end_date,
+                                                     newest_position([], newest), oldest_id - 1)
+                        print(f"[{keyword}] {max_tweets} tweet diambil sebelum high-water mark tercapai; "
+                              f"poll berikutnya melanjutkan dari max_id:{oldest_id - 1}.")
+                    elif cut_off:
+                        print(f"[{keyword}] {max_tweets} tweet diambil sebelum high-water mark tercapai; "
+                              f"mark tidak dimajukan.")
+                    else:
+                        checkpoint.advance_watermark(keyword, lang, start_date, end_date,
+                                                     newest_position([], newest))
+                elif checkpoint and not failure:
+                    checkpoint.mark_done(job_id)
+                self.finish_job_metrics()
+                if rate_limited:
+                    raise RateLimitedError(self.rate_limit.reason, self.rate_limit.remaining())
+                if failure:
+                    raise ScrapeFailedError(failure)
+            finally:
+                self.rate_limit.finish_job()
+                reader.close()
+                await page.close()
+
+    async def gather_limited(self, coroutines: List, concurrency: Optional[int] = None) -> List[Any]:
+        """asyncio.gather dengan return_exceptions, opsional dibatasi concurrency per panggilan"""
+        limit = asyncio.Semaphore(concurrency) if concurrency else contextlib.nullcontext()
+
+        async def run(coroutine):
+            async with limit:
+                return await coroutine
+
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=True)
+
+    async def scrape_many(self, searches: List[Dict[str, Any]],
+                          concurrency: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Jalankan beberapa pencarian bersamaan, masing-masing di page tersendiri
+
+        Args:
+            searches: List berisi kwargs scrape_tweets (keyword, max_tweets, lang, ...)
+            concurrency: Batas page bersamaan untuk panggilan ini (default: concurrency scraper)
+
+        Returns:
+            List hasil per pencarian, urut sesuai searches
+        """
+        results = await self.gather_limited([self.scrape_tweets(**search) for search in searches], concurrency)
+        for search, result in zip(searches, results):
+            if isinstance(result, Exception):
+                print(f"[{search.get('keyword')}] Pencarian gagal: {result}")
+        return [result.tweets if isinstance(result, ScrapeFailedError) else
+                [] if isinstance(result, Exception) else result for result in results]
+
+    async def scrape_sharded(self, keyword: str, start_date: str, end_date: str, window: Any = "day",
+                             max_per_shard: int = 200, lang: Optional[str] = None,
+                             max_scrolls: int = 10,
+                             checkpoint: Optional[CheckpointStore] = None,
+                             concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Pecah start_date..end_date menjadi window pencarian yang jalan paralel
+
+        Setiap window memakai page sendiri dengan kedalaman scroll pendek. Dengan
+        window="auto", pencarian dimulai per hari dan window yang penuh (mencapai
+        max_per_shard) dipecah lagi sampai minimal satu jam.
+
+        Args:
+            keyword: Kata kunci untuk pencarian
+            start_date: Awal rentang (YYYY-MM-DD atau YYYY-MM-DD_HH:MM:SS_UTC)
+            end_date: Akhir rentang, eksklusif seperti operator until:
+            window: "day", "hour", jumlah jam per window, atau "auto"
+            max_per_shard: Jumlah tweet maksimal per window
+            lang: Kode bahasa (en, id, dll)
+            max_scrolls: Batas scroll per window
+            checkpoint: Checkpoint store; shard yang sudah selesai dilewati saat dijalankan ulang
+            concurrency: Batas page bersamaan untuk panggilan ini (default: concurrency scraper)
+
+        Returns:
+            List tweet gabungan tanpa duplikat, terbaru lebih dulu
+        """
+        seen = SeenIndex()
+        shards = split_date_range(start_date, end_date, "day" if window == "auto" else window)
+        tweets_data = []
+        job_id = None
+        if checkpoint:
+            job_id = checkpoint.open_job(keyword, lang, start_date, end_date)["job_id"]
+            for key in checkpoint.seen_keys(job_id):
+                seen.add(key)
+        while shards:
+            if checkpoint:
+                shards = checkpoint.pending_shards(job_id, shards)
+                if not shards:
+                    break
+            print(f"[{keyword}] Menjalankan {len(shards)} shard tanggal")
+            results = await self.gather_limited(
+                [self.scrape_tweets(keyword, max_per_shard, lang, since, until,
+                                    seen_index=seen, max_scrolls=max_scrolls)
+                 for since, until in shards],
+                concurrency
+            )
+            dense_shards = []
+            for (since, until), result in zip(shards, results):
+                if isinstance(result, Exception):
+                    print(f"[{keyword}] Shard {since}..{until} gagal: {result}")
+                    # Tweet sebelum gagal sudah masuk seen, jadi harus disimpan supaya tidak hilang
+                    partial = result.tweets if isinstance(result, ScrapeFailedError) else []
+                    tweets_data.extend(partial)
+                    if checkpoint:
+                        checkpoint.record_tweets(job_id, partial)
+                        checkpoint.mark_shard(job_id, since, until, "failed")
+                    continue
+                tweets_data.extend(result)
+                sub_shards = []
+                if window == "auto" and len(result) >= max_per_shard:
+                    sub_shards = split_dense_shard(since, until)
+                    dense_shards.extend(sub_shards)
+                if checkpoint:
+                    checkpoint.record_tweets(job_id, result)
+                    checkpoint.mark_shard(job_id, since, until, "split" if sub_shards else "done", len(result))
+            shards = dense_shards
+        if checkpoint:
+            checkpoint.mark_done(job_id)
+            tweets_data = list(checkpoint.tweets(job_id))
+        return sort_tweets(tweets_data)
+
+class TwitterScraper(TweetExportMixin):
+    """
+    API sync di atas AsyncTwitterScraper
+
+    Setiap method menjalankan coroutine engine sampai selesai di event loop milik objek
+    ini (di thread pemanggil), jadi perilaku scraping sama persis dengan engine async.
+    """
+
+    def __init__(self, headless: bool = True, capture_mode: str = "dom",
+                 base_url: str = "https://twitter.com", block_resources: str = "none",
+                 scroll_policy: Optional[ScrollPolicy] = None, metrics_path: Optional[str] = None,
+                 debug_level: str = "failure", debug_capture: Optional[DebugCapture] = None,
+                 typing_delay_ms: int = LOGIN_TYPING_DELAY_MS, state_path: str = AUTH_STATE_PATH,
+                 parse_workers: Optional[int] = None, capture_path: Optional[str] = None,
+                 record_har: Optional[str] = None, replay_har: Optional[str] = None,
+                 concurrency: int = 4):
+        """
+        Inisialisasi Twitter Scraper
+
+        Args:
+            Sama seperti AsyncTwitterScraper; concurrency membatasi page yang scraping
+            bersamaan di scrape_many dan scrape_sharded
+        """
+        self.engine = AsyncTwitterScraper(
+            headless=headless, capture_mode=capture_mode, base_url=base_url, concurrency=concurrency,
+            block_resources=block_resources, scroll_policy=scroll_policy, state_path=state_path,
+            metrics_path=metrics_path, debug_level=debug_level, debug_capture=debug_capture,
+            typing_delay_ms=typing_delay_ms, parse_workers=parse_workers, capture_path=capture_path,
+            record_har=record_har, replay_har=replay_har
+        )
+        self.loop = None
+
+    def __enter__(self):
+        """Context manager entry point."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit point."""
+        self.close()
+
+    @property
+    def session(self) -> SessionManager:
+        return self.engine.session
+
+    @property
+    def metrics(self) -> ScrapeMetrics:
+        return self.engine.metrics
+
+    @property
+    def rate_limit(self) -> RateLimitMonitor:
+        return self.engine.rate_limit
+
+    @property
+    def resource_blocker(self) -> ResourceBlocker:
+        return self.engine.resource_blocker
+
+    @property
+    def debug(self) -> DebugCapture:
+        return self.engine.debug
+
+    def run(self, coroutine):
+        """Jalankan coroutine engine sampai selesai di event loop milik scraper"""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        return self.loop.run_until_complete(coroutine)
+
+    def start(self):
+        """Memulai browser dan membuat context."""
+        self.run(self.engine.start())
+
+    def close(self):
+        """Menutup browser dan playwright."""
+        if self.loop is None:
+            return
+        try:
+            self.run(self.engine.close())
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+            self.loop = None
+
     def login(self, username: str, password: str) -> bool:
         """
         Login ke Twitter menggunakan username dan password
-        
+
+        Alur login dilewati jika storage state tersimpan masih valid (lihat SessionManager).
+
         Args:
             username: Username Twitter
             password: Password Twitter
-            
+
         Returns:
             True jika login berhasil, False jika gagal
         """
-        login_result = self.improved_login(username, password)
-        if not login_result:
-            print("Improved login failed, trying the original method as backup...")
-            try:
-                self.page.goto("https://twitter.com/i/flow/login", wait_until="networkidle", timeout=30000)
-                self.page.wait_for_timeout(5000)
-                
-                self.page.wait_for_selector('input[autocomplete="username"]', timeout=15000)
-                self.page.fill('input[autocomplete="username"]', username)
-                
-                self.debug_screenshot("original_login_username")
-                self.page.wait_for_timeout(2000)
-                self.page.evaluate('''() => {
-                    const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                    const nextButton = buttons.find(button => 
-                        button.textContent.includes('Next') || 
-                        button.textContent.includes('Berikutnya'));
-                    if (nextButton) nextButton.click();
-                }''')
-                
-                self.page.wait_for_timeout(3000)
-                self.debug_screenshot("original_login_after_next")
-                
-                try:
-                    self.page.wait_for_selector('input[name="password"]', timeout=10000)
-                    self.page.fill('input[name="password"]', password)
-                    
-                    self.debug_screenshot("original_login_password")
-                    self.page.wait_for_timeout(2000)
-                    self.page.evaluate('''() => {
-                        const loginBtn = document.querySelector('[data-testid="LoginForm_Login_Button"]');
-                        if (loginBtn) loginBtn.click();
-                        else {
-                            const buttons = Array.from(document.querySelectorAll('div[role="button"]'));
-                            const logInButton = buttons.find(button => 
-                                button.textContent.includes('Log in') || 
-                                button.textContent.includes('Masuk'));
-                            if (logInButton) logInButton.click();
-                        }
-                    }''')
-                    
-                    try:
-                        self.page.wait_for_selector('a[aria-label="Home"]', timeout=15000)
-                        print("Login berhasil dengan metode original!")
-                        state_path = "twitter_auth_state.json"
-                        self.context.storage_state(path=state_path)
-                        print(f"State browser disimpan ke {state_path}")
-                        
-                        return True
-                    except Exception as e:
-                        print(f"Gagal mendeteksi halaman Home: {e}")
-                        self.debug_screenshot("home_detection_failed")
-                        return False
-                    
-                except Exception as e:
-                    print(f"Tidak dapat menemukan field password: {e}")
-                    self.debug_screenshot("password_field_missing")
-                    return False
-                
-            except Exception as e:
-                print(f"Error saat login dengan metode original: {e}")
-                self.debug_screenshot("original_login_error")
-                return False
-                
-        return login_result
-    
+        return self.run(self.engine.login(username, password))
+
     def check_login_status(self) -> bool:
-        """Check if the user is logged in"""
-        try:
-            current_url = self.page.url
-            if not current_url.startswith("https://twitter.com"):
-                self.page.goto("https://twitter.com/home", wait_until="domcontentloaded", timeout=15000)
-                self.page.wait_for_timeout(3000)
-            home_indicators = [
-                'a[aria-label="Home"]', 
-                'a[data-testid="AppTabBar_Home_Link"]',
-                'header[role="banner"]'
-            ]
-            
-            for indicator in home_indicators:
-                if self.page.query_selector(indicator):
-                    return True
-            login_indicators = [
-                'a[href="/login"]',
-                'a[data-testid="login"]',
-                'div[data-testid="loginButton"]'
-            ]
-            
-            for indicator in login_indicators:
-                if self.page.query_selector(indicator):
-                    return False
-            if "twitter.com/i/flow/login" in self.page.url:
-                return False
-                
-            return False  # Default to not logged in if uncertain
-            
-        except Exception as e:
-            print(f"Error checking login status: {e}")
-            return False
-    
-    def close(self):
-        """Menutup browser dan playwright."""
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
-    
-    def build_search_url(self, keyword: str, lang: Optional[str] = None, 
-                         start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
+        """Cek apakah user sudah login"""
+        return self.run(self.engine.check_login_status())
+
+    def build_search_url(self, keyword: str, lang: Optional[str] = None,
+                         start_date: Optional[str] = None, end_date: Optional[str] = None,
+                         max_id: Optional[str] = None) -> str:
         """
         Membangun URL pencarian Twitter
-        
+
         Args:
             keyword: Kata kunci untuk pencarian
             lang: Kode bahasa (en, id, dll)
             start_date: Tanggal mulai format YYYY-MM-DD
             end_date: Tanggal akhir format YYYY-MM-DD
-            
+            max_id: Hanya tweet dengan id <= max_id (dipakai untuk melanjutkan job)
+
         Returns:
             URL pencarian Twitter
         """
-        base_url = "https://twitter.com/search"
-        query_parts = [keyword]
-        
-        if lang:
-            query_parts.append(f"lang:{lang}")
-            
-        if start_date and end_date:
-            start = datetime.datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y-%m-%d")
-            end = datetime.datetime.strptime(end_date, "%Y-%m-%d").strftime("%Y-%m-%d")
-            query_parts.append(f"since:{start} until:{end}")
-            
-        query = " ".join(query_parts)
-        search_query = f"{base_url}?q={query}&src=typed_query&f=live"
-        return search_query
-    
-    def human_like_scroll(self):
-        """Scroll dengan cara yang lebih agresif untuk mengambil lebih banyak tweet"""
-        scroll_distance = random.randint(500, 1200)  # Increased from 300-700
-        for i in range(0, scroll_distance, random.randint(100, 200)):  # Larger steps
-            self.page.evaluate(f"window.scrollBy(0, {random.randint(80, 150)})")  # Larger scroll increments
-            time.sleep(random.uniform(0.05, 0.15))  # Shorter pauses
-        self.page.evaluate("window.scrollBy(0, 1000)")  # Force extra scroll at end
-        time.sleep(random.uniform(0.3, 0.8))  # Reduced from 0.5-1.5
-        try:
-            show_more_selectors = [
-                'div[role="button"]:has-text("Show more")',
-                'div[role="button"]:has-text("Load more")',
-                'div[role="button"]:has-text("Show more tweets")'
-            ]
-            
-            for selector in show_more_selectors:
-                if self.page.query_selector(selector):
-                    self.page.click(selector)
-                    time.sleep(1)
-                    break
-        except:
-            pass
-        
-    def force_reload_tweets(self):
-        """Force reload tweets if we're not getting new ones"""
-        try:
-            self.page.evaluate("window.scrollTo(0, 0)")
-            time.sleep(1)
-            self.page.evaluate("window.scrollTo(0, 2000)")
-            time.sleep(1.5)
-            
-            print("Forced tweet reload")
-            return True
-        except:
-            return False
-    
+        return build_search_url(self.engine.base_url, keyword, lang, start_date, end_date, max_id)
+
     def scrape_tweets(self, keyword: str, max_tweets: int = 100, lang: Optional[str] = None,
-                     start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+                     start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     seen_index: Optional[SeenIndex] = None,
+                     checkpoint: Optional[CheckpointStore] = None,
+                     incremental: bool = False) -> List[Dict[str, Any]]:
         """
         Scrape tweets berdasarkan kata kunci dan filter
-        
+
         Args:
-            keyword: Kata kunci untuk pencarian
-            max_tweets: Jumlah tweet maksimal yang akan diambil
-            lang: Kode bahasa (en, id, dll)
-            start_date: Tanggal mulai format YYYY-MM-DD
-            end_date: Tanggal akhir format YYYY-MM-DD
-            
+            Sama seperti AsyncTwitterScraper.scrape_tweets
+
         Returns:
-            List berisi data tweet
+            List berisi data tweet (saat resume, hanya tweet yang baru diambil)
+
+        Raises:
+            ScrapeFailedError: Jika pencarian gagal atau terkena rate limit (RateLimitedError);
+                               membawa tweet yang sudah diambil
         """
-        if not self.check_login_status():
-            print("User not logged in. Cannot scrape tweets.")
-            return []
-        
-        search_url = self.build_search_url(keyword, lang, start_date, end_date)
-        print(f"Membuka URL pencarian: {search_url}")
-        retry_count = 0
-        max_retries = 3
-        
-        while retry_count < max_retries:
-            try:
-                self.page.goto(search_url, wait_until="networkidle", timeout=30000)
-                break
-            except Exception as e:
-                retry_count += 1
-                print(f"Gagal memuat halaman, mencoba lagi ({retry_count}/{max_retries}): {e}")
-                time.sleep(2)
-                
-                if retry_count == max_retries:
-                    print("Gagal memuat halaman setelah beberapa percobaan.")
-                    self.debug_screenshot("failed_search_page")
-                    return []
-        
-        print(f"Mencari tweet dengan kata kunci: {keyword}")
-        if lang:
-            print(f"Bahasa: {lang}")
-        if start_date and end_date:
-            print(f"Periode: {start_date} sampai {end_date}")
+        return self.run(self.engine.scrape_tweets(keyword, max_tweets, lang, start_date, end_date,
+                                                  seen_index, checkpoint, incremental))
+
+    def scrape_tweets_iter(self, keyword: str, max_tweets: int = 100, lang: Optional[str] = None,
+                           start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           seen_index: Optional[SeenIndex] = None,
+                           checkpoint: Optional[CheckpointStore] = None,
+                           incremental: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Versi streaming dari scrape_tweets: setiap tweet di-yield begitu diekstrak
+
+        Args:
+            Sama seperti scrape_tweets
+
+        Yields:
+            Data tweet satu per satu
+
+        Raises:
+            ScrapeFailedError: Setelah tweet yang sempat diambil di-yield, jika pencarian gagal
+        """
+        batches = self.engine.scrape_batches(keyword, max_tweets, lang, start_date, end_date,
+                                             seen_index, checkpoint, incremental)
         try:
-            print("Menunggu tweet dimuat...")
-            selectors = [
-                'article[data-testid="tweet"]',
-                'div[data-testid="tweet"]',
-                'div[data-testid="tweetText"]',
-                '[data-testid="cellInnerDiv"]'
-            ]
-            found = False
-            for selector in selectors:
-                try:
-                    self.page.wait_for_selector(selector, timeout=15000)
-                    print(f"Tweet ditemukan dengan selector: {selector}")
-                    found = True
-                    break
-                except:
-                    continue
-                    
-            if not found:
-                self.debug_screenshot("no_tweets_found")
-                print("Tidak dapat menemukan tweet dengan selectors yang ada.")
-                if self.page.query_selector('div[data-testid="loginButton"]'):
-                    print("Terdeteksi layar login. Session tidak valid.")
-                elif self.page.query_selector('div[data-testid="emptyState"]'):
-                    print("Tidak ada hasil untuk pencarian ini.")
-                
-                return []
-                
-        except TimeoutError:
-            self.debug_screenshot("tweet_load_timeout")
-            print("Tidak ada tweet yang ditemukan atau halaman tidak dimuat dengan benar.")
-            print("Kemungkinan sesi login tidak valid atau rate limited.")
-            return []
-        
-        tweets_data = []
-        last_tweet_count = 0
-        
-        print(f"Mulai mengumpulkan {max_tweets} tweet...")
-        no_new_tweets_count = 0
-        attempts = 0
-        max_attempts = 15
-        
-        while len(tweets_data) < max_tweets and no_new_tweets_count < 100  and attempts < max_attempts:
-            attempts += 1
-            tweet_elements = self.page.query_selector_all('article[data-testid="tweet"]')
-            if not tweet_elements or len(tweet_elements) == 0:
+            while True:
                 try:
-                    tweet_elements = self.page.query_selector_all('div[data-testid="cellInnerDiv"] div[data-testid="tweet"]')
-                except:
-                    pass
-            if not tweet_elements or len(tweet_elements) == 0:
-                print("Tidak ada tweet yang ditemukan dengan selectors yang tersedia.")
-                if attempts > 3:  # Only take screenshot after a few attempts
-                    self.debug_screenshot("no_tweets_found_while_scrolling")
-                    break
-                else:
-                    time.sleep(2)
-                    continue
-            for i in range(last_tweet_count, len(tweet_elements)):
-                if len(tweets_data) >= max_tweets:
-                    break
-                    
-                tweet = tweet_elements[i]
-                
+                    batch = self.run(batches.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield from batch
+        finally:
+            # Setelah Ctrl-C generator engine masih berjalan dan tidak bisa ditutup dari sini
+            with contextlib.suppress(RuntimeError):
+                if self.loop is not None:
+                    self.run(batches.aclose())
+
+    def scrape_many(self, searches: List[Dict[str, Any]],
+                    concurrency: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Jalankan beberapa pencarian bersamaan di browser dan context yang sama
+
+        Args:
+            searches: List berisi kwargs scrape_tweets (keyword, max_tweets, lang, ...)
+            concurrency: Batas page bersamaan untuk panggilan ini (default: concurrency scraper)
+
+        Returns:
+            List hasil per pencarian, urut sesuai searches
+        """
+        return self.run(self.engine.scrape_many(searches, concurrency))
+
+    def scrape_sharded(self, keyword: str, start_date: str, end_date: str, window: Any = "day",
+                       max_per_shard: int = 200, lang: Optional[str] = None, max_scrolls: int = 10,
+                       concurrency: Optional[int] = None,
+                       checkpoint: Optional[CheckpointStore] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape rentang tanggal yang dipecah menjadi beberapa window paralel
+
+        Lihat AsyncTwitterScraper.scrape_sharded untuk detail argumen.
+
+        Returns:
+            List tweet gabungan tanpa duplikat, terbaru lebih dulu
+        """
+        return self.run(self.engine.scrape_sharded(keyword, start_date, end_date, window, max_per_shard,
+                                                   lang, max_scrolls, checkpoint, concurrency))
+
+class AccountScheduler:
+    """
+    Jalankan pencarian di atas AccountPool, satu AsyncTwitterScraper per akun
+
+    Setiap job mengambil akun sehat dari pool (token bucket dan cooldown). Jika akun
+    terkena rate limit, tweet yang sudah diambil tetap disimpan, akun didinginkan, dan
+    sisa job dipindah ke antrian supaya diambil akun lain. Error lain juga diantrikan
+    ulang sampai max_attempts; job yang tetap gagal dicatat di failed.
+    """
+
+    def __init__(self, pool: AccountPool, max_attempts: int = 5, **scraper_options):
+        """
+        Args:
+            pool: Pool akun
+            max_attempts: Batas percobaan per job sebelum dilepas
+            scraper_options: Argumen AsyncTwitterScraper (headless, capture_mode, ...)
+        """
+        self.pool = pool
+        self.max_attempts = max_attempts
+        self.scraper_options = scraper_options
+        self.scrapers = {}
+        self.failed = {}
+
+    async def scraper_for(self, account: Account) -> Optional[AsyncTwitterScraper]:
+        """Browser terautentikasi milik akun; dibuat dan login saat pertama dipakai"""
+        if account.username in self.scrapers:
+            return self.scrapers[account.username]
+        scraper = AsyncTwitterScraper(state_path=account.state_path, concurrency=1, **self.scraper_options)
+        try:
+            await scraper.start()
+            logged_in = await scraper.login(account.username, account.password)
+        except Exception:
+            await scraper.close()
+            raise
+        if not logged_in:
+            await scraper.close()
+            self.pool.disable(account, "login gagal")
+            return None
+        self.scrapers[account.username] = scraper
+        return scraper
+
+    async def run(self, searches: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Jalankan semua pencarian dan kembalikan hasil per pencarian, urut sesuai searches
+
+        Pencarian yang gagal tetap punya entri (berisi tweet yang sempat diambil);
+        alasannya ada di failed[index].
+
+        Args:
+            searches: List berisi kwargs scrape_tweets (keyword, max_tweets, lang, ...)
+        """
+        self.failed = {}
+        results = [[] for _ in searches]
+        seen = [SeenIndex() for _ in searches]
+        queue = asyncio.Queue()
+        for index in range(len(searches)):
+            queue.put_nowait((index, 1))
+
+        async def worker():
+            while True:
+                index, attempt = await queue.get()
                 try:
-                    username = "Unknown"
-                    timestamp = ""
-                    text = ""
-                    tweet_id = ""
-                    metrics = {}
-                    username_selectors = [
-                        'div[data-testid="User-Name"] a span',
-                        'div[data-testid="User-Name"] span',
-                        'a[role="link"] div span span',
-                        '[data-testid="User-Name"] a[tabindex="-1"] span'
-                    ]
-                    
-                    for selector in username_selectors:
-                        try:
-                            username_element = tweet.query_selector(selector)
-                            if username_element:
-                                username = username_element.text_content().strip()
-                                if username and username != "Unknown":
-                                    break
-                        except:
-                            continue
-                    try:
-                        time_element = tweet.query_selector('time')
-                        if time_element:
-                            timestamp = time_element.get_attribute('datetime')
-                    except:
-                        timestamp = ""
-                    try:
-                        text_element = tweet.query_selector('div[data-testid="tweetText"]')
-                        if text_element:
-                            text = text_element.inner_text()
-                    except:
-                        text = ""
-                    try:
-                        link_elements = tweet.query_selector_all('a[href*="/status/"]')
-                        for link in link_elements:
-                            href = link.get_attribute('href')
-                            if href and '/status/' in href:
-                                tweet_id = href.split('/status/')[1].split('/')[0]
-                                break
-                    except:
-                        tweet_id = ""
-                    metrics_selectors = {
-                        "likes": ['div[data-testid="like"]', 'div[aria-label*="Like"]'],
-                        "retweets": ['div[data-testid="retweet"]', 'div[aria-label*="Retweet"]'],
-                        "replies": ['div[data-testid="reply"]', 'div[aria-label*="Reply"]']
-                    }
-                    
-                    for metric_name, selectors in metrics_selectors.items():
-                        for selector in selectors:
-                            try:
-                                element = tweet.query_selector(selector)
-                                if element:
-                                    text_content = element.text_content().strip()
-                                    if text_content:
-                                        metrics[metric_name] = text_content
-                                    break
-                            except:
-                                continue
-                    if text and username != "Unknown":
-                        tweets_data.append({
-                            "username": username,
-                            "timestamp": timestamp,
-                            "text": text,
-                            "tweet_id": tweet_id,
-                            "metrics": metrics,
-                            "keyword": keyword
-                        })
-                        
-                        print(f"Tweet {len(tweets_data)}/{max_tweets} diambil dari @{username}")
-                    
+                    await self.run_job(searches[index], results[index], seen[index], index, attempt, queue)
                 except Exception as e:
-                    print(f"Error saat mengekstrak data tweet: {e}")
-            if last_tweet_count == len(tweet_elements):
-                no_new_tweets_count += 1
-            else:
-                no_new_tweets_count = 0
-                
-            last_tweet_count = len(tweet_elements)
-            if len(tweets_data) >= max_tweets:
+                    # Worker yang mati meninggalkan item di antrian dan queue.join() tidak pernah selesai
+                    print(f"[{searches[index].get('keyword')}] Job gagal: {e}")
+                    self.failed[index] = str(e)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in self.pool.accounts]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return results
+
+    async def run_job(self, search: Dict[str, Any], result: List[Dict[str, Any]], seen: SeenIndex,
+                      index: int, attempt: int, queue: asyncio.Queue):
+        keyword = search.get("keyword")
+        while True:
+            account, wait = self.pool.acquire()
+            if account is not None:
                 break
-            self.human_like_scroll()
-            time.sleep(random.uniform(1.0, 3.0))
-                    
-        return tweets_data
-    
-    def export_to_csv(self, tweets_data: List[Dict[str, Any]], filename: str = "tweets.csv"):
+            if wait == float("inf"):
+                print(f"[{keyword}] Tidak ada akun aktif, job dilepas.")
+                self.failed[index] = "tidak ada akun aktif"
+                return
+            await asyncio.sleep(min(wait, 30.0))
+        try:
+            scraper = await self.scraper_for(account)
+            if scraper is None:
+                queue.put_nowait((index, attempt))
+                return
+            remaining = dict(search, max_tweets=search.get("max_tweets", 100) - len(result), seen_index=seen)
+            print(f"[{keyword}] Dijalankan dengan akun @{account.username} (percobaan {attempt})")
+            tweets = await scraper.scrape_tweets(**remaining)
+            result.extend(tweets)
+            self.pool.report_success(account, len(tweets))
+        except RateLimitedError as e:
+            result.extend(e.tweets)
+            self.pool.report_rate_limited(account, e.cooldown)
+            if attempt < self.max_attempts and len(result) < search.get("max_tweets", 100):
+                queue.put_nowait((index, attempt + 1))
+            else:
+                print(f"[{keyword}] Batas percobaan tercapai dengan {len(result)} tweet.")
+        except Exception as e:
+            if isinstance(e, ScrapeFailedError):
+                result.extend(e.tweets)
+            self.pool.report_failure(account, e)
+            # Browser akun bisa saja sudah mati; dibuat ulang saat akun dipakai lagi
+            scraper = self.scrapers.pop(account.username, None)
+            if scraper is not None:
+                with contextlib.suppress(Exception):
+                    await scraper.close()
+            if attempt < self.max_attempts:
+                queue.put_nowait((index, attempt + 1))
+            else:
+                print(f"[{keyword}] Gagal setelah {attempt} percobaan: {e}")
+                self.failed[index] = str(e)
+        finally:
+            self.pool.release(account)
+
+    async def close(self):
+        for scraper in self.scrapers.values():
+            await scraper.close()
+        self.scrapers = {}
+
+def scrape_with_accounts(searches: List[Dict[str, Any]], pool: Optional[AccountPool] = None,
+                         **scraper_options) -> List[List[Dict[str, Any]]]:
+    """
+    Jalankan pencarian dengan rotasi akun dari twitter_accounts.json (lihat AccountScheduler)
+
+    Args:
+        searches: List berisi kwargs scrape_tweets (keyword, max_tweets, lang, ...)
+        pool: Pool akun; default AccountPool.load()
+        scraper_options: Argumen AsyncTwitterScraper (headless, capture_mode, ...)
+
+    Returns:
+        List hasil per pencarian, urut sesuai searches
+    """
+    scheduler = AccountScheduler(pool or AccountPool.load(), **scraper_options)
+
+    async def run():
+        try:
+            return await scheduler.run(searches)
+        finally:
+            await scheduler.close()
+            scheduler.pool.print_summary()
+            for index, reason in sorted(scheduler.failed.items()):
+                print(f"Pencarian '{searches[index].get('keyword')}' gagal: {reason}")
+
+    return asyncio.run(run())
+
+# Mode daemon: browser tetap hangat dan menerima job NDJSON lewat socket lokal
+DAEMON_SOCKET_PATH = "xscrapper.sock"
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8765
+
+def open_output_sink(filename: str, ui_locale: Optional[str] = UI_LOCALE, append: bool = False):
+    """
+    Buka sink tulis bertahap sesuai ekstensi file output
+
+    Args:
+        filename: File output (.csv, .ndjson/.jsonl, .parquet, .arrow, .db/.sqlite)
+        ui_locale: Bahasa UI asal teks metrik (bukan filter lang pencarian), untuk sink
+                   yang menormalisasi metrik
+        append: Lanjutkan file CSV/NDJSON yang sudah ada
+
+    Returns:
+        Sink dengan write_many() dan close()
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".csv":
+        return CSVSink(filename, append=append)
+    if extension in (".ndjson", ".jsonl"):
+        return NDJSONSink(filename, append=append)
+    if extension in (".parquet", ".arrow"):
+        return ColumnarSink(filename, extension[1:], lang=ui_locale)
+    if extension in (".db", ".sqlite"):
+        return TweetStore(filename, lang=ui_locale)
+    raise ValueError(f"Format output tidak didukung: {filename}")
+
+class ScrapeDaemon:
+    """
+    Daemon yang menjaga satu AsyncTwitterScraper terautentikasi tetap hidup
+
+    Klien mengirim satu job JSON per baris, misalnya
+    {"keyword": "python", "max_tweets": 200, "lang": "en", "output": "out.ndjson"},
+    dan menerima baris NDJSON balasan: {"type": "tweet", ...} untuk setiap tweet (jika
+    "stream" tidak false), lalu {"type": "done", ...} atau {"type": "error", ...}.
+    Beberapa koneksi dilayani bersamaan, dibatasi oleh concurrency scraper.
+    Job dengan "incremental": true hanya mengambil tweet yang lebih baru dari job
+    sebelumnya untuk query yang sama (high-water mark di checkpoint_path). Metrik di
+    output dibaca dengan "ui_locale" (default UI_LOCALE), bukan dengan "lang" pencarian.
+    """
+
+    def __init__(self, socket_path: Optional[str] = DAEMON_SOCKET_PATH, host: Optional[str] = None,
+                 port: int = DAEMON_PORT, checkpoint_path: str = CHECKPOINT_PATH, **scraper_options):
         """
-        Ekspor data tweet ke file CSV
-        
         Args:
-            tweets_data: List berisi data tweet
-            filename: Nama file CSV
+            socket_path: Path Unix socket (dipakai jika host tidak diisi)
+            host: Host TCP (mis. 127.0.0.1) sebagai ganti Unix socket
+            port: Port TCP
+            checkpoint_path: Database high-water mark untuk job incremental
+            scraper_options: Argumen untuk AsyncTwitterScraper (headless, concurrency, ...)
         """
-        if not tweets_data:
-            print("Tidak ada data untuk diekspor.")
-            return
-            
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['username', 'timestamp', 'text', 'tweet_id']
-            if 'metrics' in tweets_data[0] and tweets_data[0]['metrics']:
-                for metric in tweets_data[0]['metrics']:
-                    fieldnames.append(f"metrics_{metric}")
-                    
-            fieldnames.append('keyword')
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for tweet in tweets_data:
-                row = {
-                    'username': tweet['username'],
-                    'timestamp': tweet['timestamp'],
-                    'text': tweet['text'],
-                    'tweet_id': tweet['tweet_id'],
-                    'keyword': tweet['keyword']
-                }
-                if 'metrics' in tweet and tweet['metrics']:
-                    for k, v in tweet['metrics'].items():
-                        row[f"metrics_{k}"] = v
-                        
-                writer.writerow(row)
-                
-        print(f"Data berhasil diekspor ke {filename}")
-    
-    def export_to_json(self, tweets_data: List[Dict[str, Any]], filename: str = "tweets.json"):
+        if host is None and not hasattr(socket, "AF_UNIX"):
+            host = DAEMON_HOST
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.scraper_options = scraper_options
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = None
+        self.scraper = None
+        self.jobs_served = 0
+
+    async def serve(self, username: Optional[str] = None, password: Optional[str] = None):
+        """Mulai browser, login sekali, lalu layani job sampai dihentikan"""
+        async with AsyncTwitterScraper(**self.scraper_options) as scraper:
+            self.scraper = scraper
+            if username and password:
+                if not await scraper.login(username, password):
+                    print("Login gagal. Daemon tidak dijalankan.")
+                    return
+            elif not await scraper.session.validate(scraper.context):
+                print("Peringatan: sesi tersimpan tidak valid dan kredensial tidak diberikan.")
+            if self.host:
+                server = await asyncio.start_server(self.handle_client, self.host, self.port)
+                address = f"{self.host}:{self.port}"
+            else:
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
+                server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+                address = self.socket_path
+            print(f"Daemon siap menerima job di {address}")
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                if not self.host and os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
+                if self.checkpoint is not None:
+                    self.checkpoint.close()
+
+    async def handle_client(self, reader, writer):
+        """Layani satu koneksi; setiap baris adalah satu job"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    await self.run_job(line, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, message: Dict[str, Any]):
+        writer.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        await writer.drain()
+
+    async def run_job(self, line: bytes, writer):
+        """Jalankan satu job dan kirim hasilnya ke klien"""
+        started = time.perf_counter()
+        sink = None
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict) or not job.get("keyword"):
+                raise ValueError("Job harus berupa objek JSON dengan 'keyword'")
+            output = job.get("output")
+            stream = job.get("stream", True)
+            if output:
+                sink = open_output_sink(output, job.get("ui_locale", UI_LOCALE), append=bool(job.get("append")))
+
+            checkpoint = None
+            if job.get("incremental"):
+                if self.checkpoint is None:
+                    self.checkpoint = CheckpointStore(self.checkpoint_path)
+                checkpoint = self.checkpoint
+
+            async def on_tweets(batch):
+                if sink is not None:
+                    sink.write_many(batch)
+                if stream:
+                    for tweet in batch:
+                        await self.send(writer, {"type": "tweet", "tweet": tweet})
+
+            tweets = await self.scraper.scrape_tweets(
+                job["keyword"], int(job.get("max_tweets", 100)), job.get("lang"),
+                job.get("start_date"), job.get("end_date"),
+                checkpoint=checkpoint, incremental=checkpoint is not None,
+                max_scrolls=job.get("max_scrolls"), on_tweets=on_tweets
+            )
+            if sink is not None:
+                sink.close()
+                sink = None
+            self.jobs_served += 1
+            await self.send(writer, {"type": "done", "keyword": job["keyword"], "count": len(tweets),
+                                     "output": output, "elapsed": round(time.perf_counter() - started, 3)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception as e:
+            print(f"Job gagal: {e}")
+            await self.send(writer, {"type": "error", "error": str(e)})
+        finally:
+            if sink is not None:
+                sink.close()
+
+def daemon_request(job: Dict[str, Any], socket_path: str = DAEMON_SOCKET_PATH,
+                   host: Optional[str] = None, port: int = DAEMON_PORT) -> Iterator[Dict[str, Any]]:
+    """
+    Kirim satu job ke daemon dan yield setiap baris balasan sampai "done"/"error"
+
+    Args:
+        job: Objek job (keyword, max_tweets, lang, start_date, end_date, output, stream)
+        socket_path: Path Unix socket daemon
+        host: Host TCP daemon (jika daemon dijalankan dengan --host)
+        port: Port TCP daemon
+    """
+    if host is None and hasattr(socket, "AF_UNIX"):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    else:
+        connection = socket.create_connection((host or DAEMON_HOST, port))
+    with connection, connection.makefile("rwb") as stream:
+        stream.write((json.dumps(job) + "\n").encode("utf-8"))
+        stream.flush()
+        for line in stream:
+            message = json.loads(line)
+            yield message
+            if message.get("type") in ("done", "error"):
+                return
+
+# Runner multi-proses: koordinator membagi job ke beberapa proses worker
+WORKER_BATCH_SIZE = 50
+
+def build_job_list(keywords: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None,
+                   window: Any = "day", langs: Optional[List[Optional[str]]] = None,
+                   max_tweets: int = 200) -> List[Dict[str, Any]]:
+    """
+    Bangun daftar job keyword x shard tanggal x bahasa
+
+    Args:
+        keywords: Kata kunci pencarian
+        start_date: Awal rentang; tanpa rentang setiap keyword menjadi satu job
+        end_date: Akhir rentang (eksklusif)
+        window: Ukuran shard, seperti split_date_range
+        langs: Kode bahasa; [None] untuk tanpa filter bahasa
+        max_tweets: Jumlah tweet maksimal per job
+
+    Returns:
+        List job (kwargs scrape_tweets_iter)
+    """
+    shards = split_date_range(start_date, end_date, window) if start_date and end_date else [(start_date, end_date)]
+    return [
+        {"keyword": keyword, "lang": lang, "start_date": since, "end_date": until, "max_tweets": max_tweets}
+        for keyword in keywords for lang in (langs or [None]) for since, until in shards
+    ]
+
+def scrape_worker(worker_id: int, job_queue, result_queue, scraper_options: Dict[str, Any],
+                  account: Optional[Dict[str, Any]] = None):
+    """
+    Proses worker: satu TwitterScraper yang mengerjakan job dari job_queue sampai dapat None
+
+    Pesan ke result_queue: ("tweets", worker, job, batch), ("done", worker, job, jumlah)
+    dan ("failed", worker, job, pesan error). Jika login akun gagal, setiap job dilaporkan
+    gagal supaya koordinator mengulangnya di worker lain.
+    """
+    account = account or {}
+    options = dict(scraper_options)
+    if account.get("state_path"):
+        options["state_path"] = account["state_path"]
+    with TwitterScraper(**options) as scraper:
+        login_error = None
+        if account.get("username") and account.get("password"):
+            if not scraper.login(account["username"], account["password"]):
+                login_error = f"login @{account['username']} gagal"
+        while True:
+            item = job_queue.get()
+            if item is None:
+                break
+            job_index, job = item
+            if login_error:
+                result_queue.put(("failed", worker_id, job_index, login_error))
+                continue
+            batch, count = [], 0
+            try:
+                for tweet in scraper.scrape_tweets_iter(**job):
+                    batch.append(tweet)
+                    count += 1
+                    if len(batch) >= WORKER_BATCH_SIZE:
+                        result_queue.put(("tweets", worker_id, job_index, batch))
+                        batch = []
+                if batch:
+                    result_queue.put(("tweets", worker_id, job_index, batch))
+                result_queue.put(("done", worker_id, job_index, count))
+            except Exception as e:
+                if batch:
+                    result_queue.put(("tweets", worker_id, job_index, batch))
+                result_queue.put(("failed", worker_id, job_index, str(e)))
+
+class ShardCoordinator:
+    """
+    Bagi daftar job ke beberapa proses worker dan gabungkan hasilnya ke satu sink
+
+    Setiap worker menjalankan TwitterScraper sendiri (Chromium sendiri) dan menerima
+    satu job sekaligus lewat antriannya sendiri, jadi koordinator selalu tahu job mana
+    yang sedang dikerjakan. Jika proses worker mati, job tersebut dimasukkan lagi ke
+    antrian dan worker diganti. Tweet didedup berdasarkan tweet ID sebelum ditulis,
+    sehingga hasil parsial dari job yang diulang tidak menghasilkan duplikat.
+    """
+
+    def __init__(self, jobs: List[Dict[str, Any]], sink, workers: int = 4, max_attempts: int = 3,
+                 accounts: Optional[List[Account]] = None, **scraper_options):
         """
-        Ekspor data tweet ke file JSON
-        
         Args:
-            tweets_data: List berisi data tweet
-            filename: Nama file JSON
+            jobs: Daftar job dari build_job_list
+            sink: Sink dengan write_many() (CSVSink, NDJSONSink, ColumnarSink, TweetStore)
+            workers: Jumlah proses worker
+            max_attempts: Batas percobaan per job (gagal atau worker mati)
+            accounts: Akun yang dibagi bergiliran ke worker (storage state dan login sendiri)
+            scraper_options: Argumen TwitterScraper untuk setiap worker
         """
-        if not tweets_data:
-            print("Tidak ada data untuk diekspor.")
-            return
-            
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(tweets_data, jsonfile, ensure_ascii=False, indent=4)
-            
-        print(f"Data berhasil diekspor ke {filename}")
+        self.jobs = jobs
+        self.sink = sink
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.accounts = accounts or []
+        self.scraper_options = scraper_options
+        self.seen = SeenIndex()
+        self.pending = collections.deque(range(len(jobs)))
+        self.attempts = [1] * len(jobs)
+        self.finished = set()
+        self.failed = set()
+        self.written = 0
+        self.duplicates = 0
+
+    def account_for(self, slot: int) -> Optional[Dict[str, Any]]:
+        if not self.accounts:
+            return None
+        account = self.accounts[slot % len(self.accounts)]
+        return {"username": account.username, "password": account.password, "state_path": account.state_path}
+
+    def spawn(self, context, worker_id: int, slot: int, job_queue, result_queue):
+        # Bukan daemon: worker mode html membuat process pool parser sendiri, dan proses daemon
+        # tidak boleh punya anak. run() selalu menghentikan dan join worker di blok finally.
+        process = context.Process(target=scrape_worker, name=f"scrape-worker-{worker_id}", daemon=False,
+                                  args=(worker_id, job_queue, result_queue, self.scraper_options,
+                                        self.account_for(slot)))
+        process.start()
+        return process
+
+    def retry(self, job_index: int, reason: str):
+        """Masukkan job lagi ke antrian, atau tandai gagal jika batas percobaan tercapai"""
+        if self.attempts[job_index] < self.max_attempts:
+            self.attempts[job_index] += 1
+            print(f"Job {job_index} diulang ({reason}), percobaan {self.attempts[job_index]}/{self.max_attempts}")
+            self.pending.append(job_index)
+        else:
+            print(f"Job {job_index} dilepas setelah {self.max_attempts} percobaan: {reason}")
+            self.failed.add(job_index)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Jalankan semua job sampai selesai
+
+        Returns:
+            Ringkasan: jumlah tweet ditulis, duplikat, job selesai dan job gagal
+        """
+        context = multiprocessing.get_context("spawn")
+        result_queue = context.Queue()
+        # worker_id -> [slot, process, job_queue, job yang sedang dikerjakan]
+        workers = {}
+        next_id = 0
+        started = time.perf_counter()
+
+        def dispatch(worker_id):
+            worker = workers[worker_id]
+            if worker[3] is None and self.pending:
+                worker[3] = self.pending.popleft()
+                worker[2].put((worker[3], self.jobs[worker[3]]))
+
+        def start_worker(slot):
+            nonlocal next_id
+            worker_id, next_id = next_id, next_id + 1
+            job_queue = context.Queue()
+            workers[worker_id] = [slot, self.spawn(context, worker_id, slot, job_queue, result_queue),
+                                  job_queue, None]
+            dispatch(worker_id)
+
+        for slot in range(min(self.workers, len(self.jobs))):
+            start_worker(slot)
+        try:
+            while len(self.finished) + len(self.failed) < len(self.jobs):
+                try:
+                    kind, worker_id, job_index, payload = result_queue.get(timeout=1.0)
+                except queue.Empty:
+                    # Tidak ada pesan: periksa worker yang mati dan ganti
+                    for worker_id, (slot, process, _, job_index) in list(workers.items()):
+                        if process.is_alive():
+                            continue
+                        print(f"Worker {worker_id} berhenti (exit code {process.exitcode})")
+                        del workers[worker_id]
+                        if job_index is not None:
+                            self.retry(job_index, f"worker {worker_id} mati")
+                        if self.pending:
+                            start_worker(slot)
+                    if not workers and self.pending:
+                        start_worker(0)
+                    continue
+                if kind == "tweets":
+                    self.write(payload)
+                    continue
+                if worker_id in workers and workers[worker_id][3] == job_index:
+                    workers[worker_id][3] = None
+                if kind == "done":
+                    self.finished.add(job_index)
+                    print(f"Job {job_index} selesai ({payload} tweet) "
+                          f"[{len(self.finished) + len(self.failed)}/{len(self.jobs)}]")
+                else:
+                    self.retry(job_index, payload)
+                for worker_id in list(workers):
+                    dispatch(worker_id)
+        finally:
+            for _, process, job_queue, _ in workers.values():
+                job_queue.put(None)
+            for _, process, _, _ in workers.values():
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
+            self.sink.close()
+        summary = {
+            "tweets": self.written,
+            "duplicates": self.duplicates,
+            "jobs_done": len(self.finished),
+            "jobs_failed": len(self.failed),
+            "seconds": round(time.perf_counter() - started, 1)
+        }
+        print(f"Koordinator selesai: {summary}")
+        return summary
+
+    def write(self, tweets: List[Dict[str, Any]]):
+        """Dedup berdasarkan tweet ID lalu tulis ke sink"""
+        fresh = [tweet for tweet in tweets if self.seen.add(tweet_key(tweet))]
+        self.duplicates += len(tweets) - len(fresh)
+        if fresh:
+            self.sink.write_many(fresh)
+            self.written += len(fresh)
+
+def command_main(argv: List[str]):
+    """Entry point `python xscrapper.py daemon|submit|coordinate|reparse|replay`"""
+    parser = argparse.ArgumentParser(prog="xscrapper.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    daemon = commands.add_parser("daemon", help="Jalankan browser hangat yang menerima job lewat socket")
+    daemon.add_argument("--socket", default=DAEMON_SOCKET_PATH)
+    daemon.add_argument("--host", default=None, help="Pakai TCP di host ini, bukan Unix socket")
+    daemon.add_argument("--port", type=int, default=DAEMON_PORT)
+    daemon.add_argument("--concurrency", type=int, default=4)
+    daemon.add_argument("--capture-mode", choices=["dom", "network", "html"], default="dom")
+    daemon.add_argument("--block", choices=sorted(RESOURCE_BLOCK_PRESETS), default="none")
+    daemon.add_argument("--no-headless", action="store_true")
+    daemon.add_argument("--username", default=os.environ.get("TWITTER_USERNAME"))
+    submit = commands.add_parser("submit", help="Kirim satu job ke daemon dan cetak hasilnya sebagai NDJSON")
+    submit.add_argument("job", help='Job JSON, mis. \'{"keyword": "python", "max_tweets": 50}\'')
+    submit.add_argument("--socket", default=DAEMON_SOCKET_PATH)
+    submit.add_argument("--host", default=None)
+    submit.add_argument("--port", type=int, default=DAEMON_PORT)
+    coordinate = commands.add_parser("coordinate", help="Bagi keyword x shard tanggal x bahasa ke beberapa proses")
+    coordinate.add_argument("--keywords", required=True, help="Kata kunci dipisah koma")
+    coordinate.add_argument("--start", default=None, help="Tanggal mulai (YYYY-MM-DD)")
+    coordinate.add_argument("--end", default=None, help="Tanggal akhir, eksklusif (YYYY-MM-DD)")
+    coordinate.add_argument("--window", default="day", help='"day", "hour" atau jumlah jam per shard')
+    coordinate.add_argument("--langs", default="", help="Kode bahasa dipisah koma (kosong = semua)")
+    coordinate.add_argument("--max-per-shard", type=int, default=200)
+    coordinate.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    coordinate.add_argument("--output", required=True, help="File output (.csv/.ndjson/.parquet/.arrow/.db)")
+    coordinate.add_argument("--capture-mode", choices=["dom", "network", "html"], default="dom")
+    coordinate.add_argument("--block", choices=sorted(RESOURCE_BLOCK_PRESETS), default="text-only")
+    coordinate.add_argument("--accounts", default=None, help="File akun untuk dibagi ke worker")
+    coordinate.add_argument("--ui-locale", choices=["en", "id"], default=UI_LOCALE,
+                            help="Bahasa UI akun, menentukan arti sufiks metrik")
+    reparse = commands.add_parser("reparse", help="Parse ulang fragmen HTML dari file capture mode html")
+    reparse.add_argument("captures", help="File capture NDJSON (capture_path)")
+    reparse.add_argument("--output", required=True, help="File output (.csv/.ndjson/.parquet/.arrow/.db)")
+    reparse.add_argument("--workers", type=int, default=None, help="Jumlah proses parser (default: jumlah CPU)")
+    reparse.add_argument("--ui-locale", choices=["en", "id"], default=UI_LOCALE,
+                         help="Bahasa UI asal teks metrik")
+    replay = commands.add_parser("replay", help="Jalankan ulang scrape dari arsip HAR tanpa jaringan")
+    replay.add_argument("har", help="Arsip dari TwitterScraper(record_har=...)")
+    replay.add_argument("--keyword", required=True, help="Kata kunci yang sama seperti saat merekam")
+    replay.add_argument("--max-tweets", type=int, default=100)
+    replay.add_argument("--lang", default=None)
+    replay.add_argument("--start", default=None, help="Tanggal mulai saat merekam (YYYY-MM-DD)")
+    replay.add_argument("--end", default=None, help="Tanggal akhir saat merekam (YYYY-MM-DD)")
+    replay.add_argument("--capture-mode", choices=["dom", "network", "html"], default="dom")
+    replay.add_argument("--output", required=True, help="File output (.csv/.ndjson/.parquet/.arrow/.db)")
+    replay.add_argument("--ui-locale", choices=["en", "id"], default=UI_LOCALE,
+                        help="Bahasa UI saat merekam, menentukan arti sufiks metrik")
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        started = time.perf_counter()
+        with TwitterScraper(capture_mode=args.capture_mode, replay_har=args.har) as scraper:
+            try:
+                tweets = scraper.scrape_tweets(args.keyword, args.max_tweets, args.lang, args.start, args.end)
+            except ScrapeFailedError as e:
+                print(f"Replay berhenti lebih awal: {e}")
+                tweets = e.tweets
+        with contextlib.closing(open_output_sink(args.output, args.ui_locale)) as sink:
+            sink.write_many(tweets)
+        print(f"Replay selesai: {len(tweets)} tweet dalam {time.perf_counter() - started:.1f} detik, "
+              f"disimpan ke {args.output}")
+        return
+
+    if args.command == "reparse":
+        seen = SeenIndex()
+        with contextlib.closing(open_output_sink(args.output, args.ui_locale)) as sink:
+            sink.write_many(record for record in parse_captures(args.captures, args.workers)
+                            if record["text"] and record["username"] != "Unknown" and seen.add(tweet_key(record)))
+        print(f"{len(seen)} tweet dari {args.captures} ditulis ke {args.output}")
+        return
+
+    if args.command == "coordinate":
+        window = float(args.window) if args.window.replace(".", "", 1).isdigit() else args.window
+        langs = [lang.strip() for lang in args.langs.split(",") if lang.strip()] or [None]
+        jobs = build_job_list([keyword.strip() for keyword in args.keywords.split(",") if keyword.strip()],
+                              args.start, args.end, window, langs, args.max_per_shard)
+        accounts = AccountPool.load(args.accounts).accounts if args.accounts else None
+        print(f"{len(jobs)} job dibagi ke {min(args.workers, len(jobs))} worker")
+        ShardCoordinator(jobs, open_output_sink(args.output, args.ui_locale), workers=args.workers, accounts=accounts,
+                         capture_mode=args.capture_mode, block_resources=args.block).run()
+        return
+
+    if args.command == "submit":
+        for message in daemon_request(json.loads(args.job), args.socket, args.host, args.port):
+            print(json.dumps(message, ensure_ascii=False))
+        return
+    server = ScrapeDaemon(args.socket, args.host, args.port, headless=not args.no_headless,
+                          capture_mode=args.capture_mode, concurrency=args.concurrency,
+                          block_resources=args.block)
+    try:
+        asyncio.run(server.serve(args.username, os.environ.get("TWITTER_PASSWORD")))
+    except KeyboardInterrupt:
+        print(f"\nDaemon dihentikan setelah {server.jobs_served} job.")
 
 def is_valid_date(date_string):
     """Validasi format tanggal YYYY-MM-DD"""
@@ -846,8 +4436,8 @@ def get_user_input():
     except ValueError:
         print("Input tidak valid. Menggunakan default (100).")
         max_tweets = 100
-    output_format = input("Format output (csv/json, default: csv): ").lower()
-    if output_format not in ["csv", "json"]:
+    output_format = input("Format output (csv/json/ndjson/sqlite/parquet, default: csv): ").lower()
+    if output_format not in ["csv", "json", "ndjson", "sqlite", "parquet"]:
         print("Format tidak valid. Menggunakan default (csv).")
         output_format = "csv"
     headless = input("Jalankan dalam mode headless? (y/n, default: y): ").lower() != "n"
@@ -870,22 +4460,69 @@ def main():
         params = get_user_input()
         
         print("\nMemulai scraping Twitter...")
-        with TwitterScraper(headless=params["headless"]) as scraper:
+        with TwitterScraper(headless=params["headless"]) as scraper, CheckpointStore() as checkpoint:
             login_success = scraper.login(params["twitter_username"], params["twitter_password"])
             
             if not login_success:
                 print("\nLogin gagal. Tidak dapat melanjutkan.")
                 return
                 
-            tweets = scraper.scrape_tweets(
+            # Job dengan parameter yang sama dan belum selesai dilanjutkan dari checkpoint
+            job = checkpoint.open_job(params["keyword"], params["lang"], params["start_date"], params["end_date"])
+            if params["output_format"] == 'sqlite':
+                filename = TWEET_STORE_PATH
+            else:
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"tweets_{params['keyword'].replace(' ', '_')}_{timestamp}.{params['output_format']}"
+            resume = (job["status"] != "done" and job["collected"] > 0 and job["output"]
+                      and os.path.splitext(job["output"])[1] == os.path.splitext(filename)[1]
+                      and os.path.exists(job["output"]))
+            if resume:
+                filename = job["output"]
+                print(f"Melanjutkan job sebelumnya ({job['collected']} tweet tersimpan) ke {filename}")
+            else:
+                checkpoint.reset_job(job["job_id"])
+                checkpoint.set_output(job["job_id"], filename)
+            tweets = scraper.scrape_tweets_iter(
                 keyword=params["keyword"],
                 max_tweets=params["max_tweets"],
                 lang=params["lang"],
                 start_date=params["start_date"],
-                end_date=params["end_date"]
+                end_date=params["end_date"],
+                checkpoint=checkpoint
             )
+            if params["output_format"] == 'json':
+                # File JSON ditulis ulang utuh, termasuk tweet dari run sebelumnya di checkpoint
+                try:
+                    list(tweets)
+                except ScrapeFailedError:
+                    # Tweet yang sudah diambil ada di checkpoint; tulis dulu sebelum pesan gagal
+                    scraper.export_to_json(list(checkpoint.tweets(job["job_id"])), filename)
+                    raise
+                tweets = list(checkpoint.tweets(job["job_id"]))
+                scraper.export_to_json(tweets, filename)
+                total = len(tweets)
+            elif params["output_format"] == 'parquet':
+                # Parquet tidak bisa di-append; saat resume file ditulis ulang dari checkpoint
+                previous = list(checkpoint.tweets(job["job_id"])) if resume else []
+                with ColumnarSink(filename, "parquet", lang=UI_LOCALE) as sink:
+                    sink.write_many(previous)
+                    sink.write_many(tweets)
+                total = checkpoint.get_job(job["job_id"])["collected"]
+            elif params["output_format"] == 'sqlite':
+                with TweetStore(filename, lang=UI_LOCALE) as store:
+                    store.upsert(tweets)
+                total = checkpoint.get_job(job["job_id"])["collected"]
+            else:
+                # CSV/NDJSON ditulis bertahap, jadi tweet yang sudah diambil tetap tersimpan jika dibatalkan
+                sink_class = CSVSink if params["output_format"] == 'csv' else NDJSONSink
+                with sink_class(filename, append=resume) as sink:
+                    sink.write_many(tweets)
+                total = checkpoint.get_job(job["job_id"])["collected"]
             
-            if not tweets:
+            if not total:
+                if params["output_format"] != 'sqlite' and os.path.exists(filename):
+                    os.remove(filename)
                 print("Tidak ada tweet yang ditemukan.")
                 print("\nSaran troubleshooting:")
                 print("1. Periksa apakah kata kunci terlalu spesifik")
@@ -893,22 +4530,24 @@ def main():
                 print("3. Gunakan mode non-headless (n) untuk melihat proses scrapernya")
                 print("4. Coba lagi nanti jika Twitter sedang rate limiting")
                 return
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            if params["output_format"] == 'csv':
-                filename = f"tweets_{params['keyword'].replace(' ', '_')}_{timestamp}.csv"
-                scraper.export_to_csv(tweets, filename)
-            else:
-                filename = f"tweets_{params['keyword'].replace(' ', '_')}_{timestamp}.json"
-                scraper.export_to_json(tweets, filename)
                 
-            print(f"Berhasil mengambil {len(tweets)} tweet.")
+            print(f"Berhasil mengambil {total} tweet.")
             print(f"Data disimpan ke {filename}")
             
     except KeyboardInterrupt:
         print("\nOperasi dibatalkan oleh pengguna.")
+    except ScrapeFailedError as e:
+        # Tweet yang sudah diambil tetap ada di output dan checkpoint; job dilanjutkan saat dijalankan ulang
+        print(f"\nScraping gagal: {e}")
+        if e.tweets:
+            print(f"{len(e.tweets)} tweet yang sudah diambil tetap tersimpan.")
+        print("Jalankan ulang dengan parameter yang sama untuk melanjutkan job.")
     except Exception as e:
         print(f"\nTerjadi kesalahan: {e}")
         print("Screenshot debug diambil jika tersedia.")
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] in ("daemon", "submit", "coordinate", "reparse", "replay"):
+        command_main(sys.argv[1:])
+    else:
+        main()